@@ -0,0 +1,21 @@
+"""
+PayPal Agent Toolkit.
+
+Framework integrations live in ``openai``, ``langchain``, ``crewai`` and
+``adk``; each is imported, together with its framework, on first access.
+"""
+
+from ._lazy import lazy_exports
+
+__all__ = ["PayPalAPI", "Configuration", "Context", "get_tool"]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "PayPalAPI": ".shared.api",
+        "Configuration": ".shared.configuration",
+        "Context": ".shared.configuration",
+        "get_tool": ".shared.registry",
+    },
+    submodules=("shared", "openai", "langchain", "crewai", "adk", "bench"),
+)
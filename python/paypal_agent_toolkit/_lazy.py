@@ -0,0 +1,49 @@
+import importlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+PACKAGE = "paypal_agent_toolkit"
+
+
+def lazy_exports(
+    module_globals: Dict[str, Any],
+    exports: Dict[str, str],
+    submodules: Iterable[str] = (),
+    extra: Optional[str] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the PEP 562 ``__getattr__`` and ``__dir__`` of a package so that
+    ``exports`` (name -> relative module defining it) and ``submodules`` are
+    only imported on first access. ``extra`` names the pip extra that provides
+    the package's framework dependency, for the error raised when it is missing.
+    """
+    package = module_globals["__name__"]
+    submodules = tuple(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            return _import(f".{name}", package, extra)
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(_import(module_name, package, extra), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module_globals) | set(exports) | set(submodules))
+
+    return __getattr__, __dir__
+
+
+def _import(module_name: str, package: str, extra: Optional[str]):
+    try:
+        return importlib.import_module(module_name, package)
+    except ModuleNotFoundError as e:
+        missing = (e.name or "").split(".")[0]
+        if extra is None or not missing or missing == PACKAGE:
+            raise
+        raise ModuleNotFoundError(
+            f"{package} requires '{missing}', which is not installed. "
+            f"Install it with: pip install \"paypal-agent-toolkit[{extra}]\"",
+            name=e.name,
+        ) from e
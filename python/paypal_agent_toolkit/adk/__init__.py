@@ -0,0 +1,11 @@
+"""PayPal tools for Google ADK. Requires ``pip install "paypal-agent-toolkit[adk]"``."""
+
+from .._lazy import lazy_exports
+
+__all__ = ["PayPalToolkit", "PayPalTool"]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {"PayPalToolkit": ".toolkit", "PayPalTool": ".tool"},
+    extra="adk",
+)
@@ -0,0 +1,172 @@
+"""
+JSON Schema → OpenAPI 3.0 conversion for the ADK adapters. Kept free of
+``google.adk`` imports so schemas can be compiled without the framework.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..shared.constants import SANDBOX_BASE_URL
+
+DEFS_PREFIX = "#/$defs/"
+COMPONENTS_PREFIX = "#/components/schemas/"
+
+
+class OpenAPISchemaConverter:
+    """
+    Draft-2020-12 → OpenAPI 3.0 (Vertex/Gemini-friendly) in a single pass.
+
+    Output nodes are built fresh while walking the input, so the input is
+    never copied or modified. ``$defs`` are converted once each into
+    ``components`` and every ``$ref`` is rewritten to ``#/components/schemas``.
+    One converter may be reused for several schemas that share definitions.
+    """
+
+    def __init__(self):
+        self.components: Dict[str, Dict[str, Any]] = {}
+
+    def convert(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        for name, definition in schema.get("$defs", {}).items():
+            if name not in self.components:
+                self.components[name] = self._node(definition)
+        return self._node(schema)
+
+    def _node(self, schema: Any) -> Any:
+        if not isinstance(schema, dict):
+            return schema
+
+        out: Dict[str, Any] = {}
+        for key, value in schema.items():
+            if key in ("$defs", "anyOf", "allOf", "oneOf"):
+                continue
+            if key in ("$ref", "ref"):
+                out["$ref"] = value.replace(DEFS_PREFIX, COMPONENTS_PREFIX)
+            elif key == "properties":
+                out[key] = {name: self._node(prop) for name, prop in value.items()}
+            elif key == "items":
+                out[key] = [self._node(i) for i in value] if isinstance(value, list) else self._node(value)
+            elif key == "additionalProperties" and isinstance(value, dict):
+                out[key] = self._node(value)
+            elif key == "const":
+                out["enum"] = [value]
+            else:
+                out[key] = value
+
+        # Nullable shortcut: "type": ["string", "null"]
+        t = out.get("type")
+        if isinstance(t, list) and "null" in t:
+            out["nullable"] = True
+            out["type"] = next((x for x in t if x != "null"), None)
+            if out["type"] is None:
+                out.pop("type")
+
+        if "anyOf" in schema:
+            variants = schema["anyOf"]
+            non_null = [v for v in variants if v.get("type") != "null"]
+            if len(variants) == 2 and len(non_null) == 1:
+                # Optional[X]: X itself, marked nullable; the outer description and default win.
+                converted = self._node(non_null[0])
+                if "$ref" in converted:
+                    converted = {"allOf": [converted]}
+                out = {**converted, **out, "nullable": True}
+            else:
+                out = {"anyOf": [self._node(v) for v in variants]}
+                if schema.get("description"):
+                    out["description"] = schema["description"]
+
+        if "allOf" in schema:
+            refs = []
+            for part in schema["allOf"]:
+                converted = self._node(part)
+                if "$ref" in converted:
+                    refs.append(converted)
+                else:
+                    out.update(converted)
+            if refs:
+                out["allOf"] = refs
+
+        if "oneOf" in schema:
+            first = self._node(schema["oneOf"][0])
+            out.update(first)
+
+        return out
+
+
+def json_schema_to_oas3(schema: Dict[str, Any], converter: Optional[OpenAPISchemaConverter] = None) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Convert ``schema``; returns the converted schema and the ``components/schemas`` it references."""
+    converter = converter or OpenAPISchemaConverter()
+    return converter.convert(schema), converter.components
+
+
+def build_openapi_spec(
+    tools: List[Dict[str, Any]],
+    server_url: str = SANDBOX_BASE_URL,
+    title: str = "PayPal Agent Toolkit",
+) -> Dict[str, Any]:
+    """
+    One OpenAPI 3.0 document with a ``POST /<method>`` operation per tool and
+    the ``components/schemas`` of all of them. A component name used by two
+    tools for different schemas is suffixed for the later tool.
+    """
+    from ..shared.schemas import schema_compiler
+
+    paths: Dict[str, Any] = {}
+    components: Dict[str, Dict[str, Any]] = {}
+    for tool in tools:
+        compiled = schema_compiler.get(tool["args_schema"], "adk_oas3")
+        renames = _merge_components(components, compiled["components"])
+        request_schema = _rename_refs(compiled["schema"], renames) if renames else compiled["schema"]
+        paths[f"/{tool['method']}"] = {
+            "post": {
+                "operationId": tool["method"],
+                "description": tool["description"],
+                "requestBody": {
+                    "required": True,
+                    "content": {"application/json": {"schema": request_schema}},
+                },
+                "responses": {
+                    "200": {
+                        "description": "Successful PayPal API response",
+                        "content": {"application/json": {"schema": {"type": "object"}}},
+                    }
+                },
+            }
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": title, "version": "1.0.0"},
+        "servers": [{"url": server_url}],
+        "paths": paths,
+        "components": {"schemas": components},
+    }
+
+
+def _merge_components(target: Dict[str, Dict[str, Any]], components: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """Add ``components`` to ``target``; returns the names that had to change."""
+    renames: Dict[str, str] = {}
+    for name, schema in components.items():
+        if name in target and target[name] != schema:
+            suffix = 2
+            while f"{name}{suffix}" in target or f"{name}{suffix}" in components:
+                suffix += 1
+            renames[name] = f"{name}{suffix}"
+
+    for name, schema in components.items():
+        if renames:
+            schema = _rename_refs(schema, renames)
+        target.setdefault(renames.get(name, name), schema)
+    return renames
+
+
+def _rename_refs(schema: Any, renames: Dict[str, str]) -> Any:
+    if isinstance(schema, list):
+        return [_rename_refs(item, renames) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    out = {key: _rename_refs(value, renames) for key, value in schema.items()}
+    ref = out.get("$ref")
+    if isinstance(ref, str) and ref.startswith(COMPONENTS_PREFIX):
+        name = ref[len(COMPONENTS_PREFIX):]
+        if name in renames:
+            out["$ref"] = COMPONENTS_PREFIX + renames[name]
+    return out
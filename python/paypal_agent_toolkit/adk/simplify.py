@@ -0,0 +1,155 @@
+"""
+Annotation simplifier for the ADK ``FunctionTool`` adapter: collapses
+Pydantic models and rich typing constructs to what ADK can declare.
+"""
+
+import inspect
+import re
+import threading
+from typing import (
+    Any, Dict, List, Optional, Tuple, Union, Annotated, Literal,
+    get_origin, get_args,
+)
+
+from pydantic import BaseModel, ConfigDict, create_model
+from pydantic.networks import AnyUrl, HttpUrl
+
+# Process-wide caches, so toolkits built per tenant reuse the same classes.
+_simplified_models: Dict[type, type] = {}
+_simplified_annotations: Dict[Any, Any] = {}
+# Models being simplified by the current call (source -> forward reference)
+# and the clones it created, which may still need those references resolved.
+_in_progress: Dict[type, str] = {}
+_created: List[Tuple[str, type]] = []
+_lock = threading.RLock()
+
+
+def _simplify_basemodel(model_cls: type[BaseModel]) -> type[BaseModel]:
+    """
+    Return a model class whose field annotations are ADK-friendly. Each source
+    model is simplified once per process; later calls return the same class.
+    """
+    with _lock:
+        simplified = _simplified_models.get(model_cls)
+        if simplified is not None:
+            return simplified
+
+        if model_cls in _in_progress:
+            # Recursive model: refer to the clone, resolved once it exists.
+            return _in_progress[model_cls]
+
+        outermost = not _in_progress
+        # Clones keep readable names; references are qualified with the module
+        # so that models sharing a class name cannot resolve to each other.
+        reference = "Simplified_" + re.sub(r"\W", "_", f"{model_cls.__module__}.{model_cls.__qualname__}")
+        _in_progress[model_cls] = reference
+        try:
+            try:
+                fields: dict[str, tuple[Any, Any]] = {}
+                for field_name, field in model_cls.model_fields.items():     # type: ignore[attr-defined]
+                    ann = _simplify_annotation(field.annotation)
+                    default = inspect._empty if field.is_required() else field.default
+                    fields[field_name] = (ann, default)
+
+                simplified = create_model(                                  # type: ignore[call-arg]
+                    f"Simplified{model_cls.__name__}",
+                    __config__=ConfigDict(extra="forbid"),
+                    **fields,
+                )
+                _created.append((reference, simplified))
+            finally:
+                del _in_progress[model_cls]
+            _simplified_models[model_cls] = simplified
+
+            if outermost:
+                # Resolve forward references between the new clones.
+                namespace = dict(_created)
+                for _, model in _created:
+                    if not model.__pydantic_complete__:
+                        model.model_rebuild(_types_namespace=namespace)
+        except BaseException:
+            if outermost:
+                # Nested clones were cached before their references resolved.
+                created = {model for _, model in _created}
+                for source in [source for source, model in _simplified_models.items() if model in created]:
+                    del _simplified_models[source]
+            raise
+        finally:
+            if outermost:
+                _created.clear()
+        return simplified
+
+
+def _simplify_annotation(tp):  # noqa: ANN001
+    """
+    Collapse rich typing / Pydantic constructs to primitives ADK accepts.
+
+    Literal       → str
+    Annotated     → underlying type
+    constr / URLs → str
+    BaseModel     → *simplified clone* (recursively processed)
+    Containers    → same container with inner types simplified
+
+    Results are cached per annotation, except while a recursive model is
+    being simplified, when they may still hold forward references.
+    """
+    try:
+        return _simplified_annotations[tp]
+    except (KeyError, TypeError):   # TypeError: unhashable annotation
+        pass
+
+    simplified = _simplify(tp)
+    with _lock:
+        if not _in_progress:
+            try:
+                _simplified_annotations[tp] = simplified
+            except TypeError:
+                pass
+    return simplified
+
+
+def _simplify(tp):  # noqa: ANN001
+    # 0) URLs and constrained primitives → plain primitives
+    if isinstance(tp, type):
+        if issubclass(tp, (AnyUrl, HttpUrl)):
+            return str
+        # v2 no longer has ConstrainedStr; use a generic catch‑all
+        if issubclass(tp, str) and tp is not str:
+            return str
+        if issubclass(tp, int) and tp is not int:
+            return int
+        if issubclass(tp, float) and tp is not float:
+            return float
+
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    # 1) Optional[X] (Union[X, None])
+    if origin is Union and len(args) == 2 and type(None) in args:
+        non_null = next(a for a in args if a is not type(None))
+        return Optional[_simplify_annotation(non_null)]         # type: ignore[arg-type]
+
+    # 2) Annotated[base, …]  → base
+    if origin is Annotated:
+        return _simplify_annotation(args[0])
+
+    # 3) Literal[...] → str
+    if origin is Literal:
+        return str
+
+    # 4) Containers ---------------------------------------------------------
+    if origin in (list, List):
+        return List[_simplify_annotation(args[0])]              # type: ignore[arg-type]
+    if origin in (dict, Dict):
+        key_t, val_t = args or (str, Any)
+        return Dict[
+            _simplify_annotation(key_t), _simplify_annotation(val_t)  # type: ignore[arg-type]
+        ]
+
+    # 5) Nested Pydantic models --------------------------------------------
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return _simplify_basemodel(tp)
+
+    # 6) Already simple (str, int, float, bool, Any…)
+    return tp
@@ -10,8 +10,8 @@ from pydantic import PrivateAttr
 # from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
 
 from ..shared.api import PayPalAPI
-from ..shared.configuration import Configuration, is_tool_allowed
-from ..shared.tools import tools  
+from ..shared.configuration import Configuration
+from ..shared.registry import registry
 from .tool import PayPalTool  
 from google.adk.tools import FunctionTool, ToolContext  
 
@@ -29,7 +29,12 @@ class PayPalToolkit:
         client_id: str,
         secret: str,
         configuration: Optional[Configuration] = None,
+        openapi: bool = False,
     ) -> None:
+        """
+        With ``openapi=True`` the tools are ``RestApiTool``s generated from one
+        combined OpenAPI spec instead of ``FunctionTool``s.
+        """
         self._tools = []
 
         self.configuration = configuration or Configuration()
@@ -40,12 +45,17 @@ class PayPalToolkit:
         )
         self.context.source = self.SOURCE
 
-        paypal_api = PayPalAPI(client_id=client_id, secret=secret, context=self.context)
+        paypal_api = PayPalAPI(client_id=client_id, secret=secret, context=self.context, configuration=self.configuration)
 
-        filtered_tools = [t for t in tools if is_tool_allowed(t, self.configuration)]
+        filtered_tools = registry.enabled_tools(self.configuration)
 
-        for tool in filtered_tools:
-            self._tools.append(PayPalTool(paypal_api, tool))
+        if openapi:
+            from .rest_api_tool import build_rest_api_tools
+
+            self._tools = build_rest_api_tools(paypal_api, filtered_tools)
+        else:
+            for tool in filtered_tools:
+                self._tools.append(PayPalTool(paypal_api, tool))
 
 
     def get_tools(self) -> List[FunctionTool]:
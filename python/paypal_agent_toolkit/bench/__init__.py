@@ -0,0 +1 @@
+"""Benchmarks for the toolkit. Run one with ``python -m paypal_agent_toolkit.bench.<name>``."""
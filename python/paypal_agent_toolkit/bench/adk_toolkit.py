@@ -0,0 +1,91 @@
+"""
+Regression benchmark for building the ADK toolkit repeatedly, as servers
+that create one toolkit per tenant or request do::
+
+    python -m paypal_agent_toolkit.bench.adk_toolkit --builds 1000
+    python -m paypal_agent_toolkit.bench.adk_toolkit --simplifier-only
+
+Reports the time per build and the traced memory after warm-up and at the
+end; the exit status is 1 when memory keeps growing past ``--max-growth-kb``.
+``--simplifier-only`` runs just the annotation simplification the toolkit
+performs, so it works without google-adk installed.
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Optional
+
+from ..shared.configuration import Configuration, Context
+from ..shared.registry import registry
+
+
+def _toolkit_builder() -> Callable[[], object]:
+    from ..adk.toolkit import PayPalToolkit
+
+    # Every action of every tool enabled.
+    actions = {}
+    for tool in registry.all_tools():
+        for product, product_actions in tool["actions"].items():
+            actions.setdefault(product, {}).update(product_actions)
+    configuration = Configuration(actions=actions, context=Context(sandbox=True))
+
+    def build():
+        toolkit = PayPalToolkit("client-id", "secret", configuration=configuration)
+        toolkit.get_tools()
+
+    return build
+
+
+def _simplifier_builder() -> Callable[[], object]:
+    from ..adk.simplify import _simplify_annotation
+
+    tools = registry.all_tools()
+
+    def build():
+        for tool in tools:
+            for field in tool["args_schema"].model_fields.values():
+                _simplify_annotation(field.annotation)
+
+    return build
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the ADK toolkit repeatedly and track time and memory.")
+    parser.add_argument("--builds", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=10, help="builds before the memory baseline is taken")
+    parser.add_argument("--max-growth-kb", type=float, default=512.0, help="allowed memory growth after warm-up")
+    parser.add_argument("--simplifier-only", action="store_true", help="skip google-adk and time the simplifier alone")
+    args = parser.parse_args(argv)
+
+    build = _simplifier_builder() if args.simplifier_only else _toolkit_builder()
+
+    tracemalloc.start()
+    for _ in range(args.warmup):
+        build()
+    gc.collect()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    for _ in range(args.builds):
+        build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    final = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    growth_kb = (final - baseline) / 1024
+    print(f"builds:          {args.builds}")
+    print(f"time per build:  {elapsed / args.builds * 1000:.3f} ms")
+    print(f"memory baseline: {baseline / 1024:.0f} KiB after {args.warmup} warm-up builds")
+    print(f"memory growth:   {growth_kb:.0f} KiB")
+    if growth_kb > args.max_growth_kb:
+        print(f"Memory grew by more than {args.max_growth_kb:.0f} KiB")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
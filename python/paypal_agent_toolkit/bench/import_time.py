@@ -0,0 +1,133 @@
+"""
+Import-time report for the toolkit.
+
+Imports each module in a fresh interpreter under ``python -X importtime`` and
+breaks the cost down per module and per top-level package::
+
+    python -m paypal_agent_toolkit.bench.import_time
+    python -m paypal_agent_toolkit.bench.import_time paypal_agent_toolkit.openai.toolkit --budget-ms 300
+
+With ``--budget-ms`` the exit status is 1 when any module takes longer, so
+the report can guard cold-start time in CI.
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+DEFAULT_MODULES = [
+    "paypal_agent_toolkit",
+    "paypal_agent_toolkit.shared.api",
+    "paypal_agent_toolkit.openai.toolkit",
+]
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class ImportReport(NamedTuple):
+    module: str
+    records: List[ImportRecord]
+    error: Optional[str] = None
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative time of the top-level import of ``module``."""
+        for record in self.records:
+            if record.module == self.module:
+                return record.cumulative_us / 1000
+        return sum(record.self_us for record in self.records) / 1000
+
+    def slowest(self, top: int) -> List[ImportRecord]:
+        return sorted(self.records, key=lambda r: r.self_us, reverse=True)[:top]
+
+    def by_package(self) -> Dict[str, float]:
+        """Self time in milliseconds summed per top-level package."""
+        totals: Dict[str, float] = {}
+        for record in self.records:
+            package = record.module.split(".")[0]
+            totals[package] = totals.get(package, 0.0) + record.self_us / 1000
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=stripped,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(stripped)) // 2,
+            )
+        )
+    return records
+
+
+def measure(module: str, repeat: int = 3) -> ImportReport:
+    """Import ``module`` ``repeat`` times in fresh interpreters and keep the fastest run."""
+    best: Optional[ImportReport] = None
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()
+            return ImportReport(module, [], error[-1] if error else f"exit status {completed.returncode}")
+        report = ImportReport(module, parse_importtime(completed.stderr))
+        if best is None or report.total_ms < best.total_ms:
+            best = report
+    return best
+
+
+def format_report(report: ImportReport, top: int = 15) -> str:
+    if report.error:
+        return f"{report.module}: not importable ({report.error})"
+
+    lines = [f"{report.module}: {report.total_ms:.1f} ms", "", "  slowest modules (self / cumulative ms):"]
+    for record in report.slowest(top):
+        lines.append(f"    {record.self_us / 1000:8.1f} {record.cumulative_us / 1000:9.1f}  {record.module}")
+    lines += ["", "  self time per package (ms):"]
+    for package, total in list(report.by_package().items())[:top]:
+        lines.append(f"    {total:8.1f}  {package}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="modules to import")
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module; the fastest is reported")
+    parser.add_argument("--budget-ms", type=float, help="fail when a module takes longer than this")
+    args = parser.parse_args(argv)
+
+    over_budget = []
+    for module in args.modules:
+        report = measure(module, args.repeat)
+        print(format_report(report, args.top))
+        print()
+        if args.budget_ms is not None and not report.error and report.total_ms > args.budget_ms:
+            over_budget.append(f"{module} ({report.total_ms:.1f} ms)")
+
+    if over_budget:
+        print(f"Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
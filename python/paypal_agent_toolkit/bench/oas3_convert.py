@@ -0,0 +1,127 @@
+"""
+JSON Schema → OpenAPI 3.0 conversion benchmark for the ADK adapter.
+
+Validates the converter against every tool's parameter schema and compares
+it with the previous implementation, which deep-copied the schema at every
+level of recursion::
+
+    python -m paypal_agent_toolkit.bench.oas3_convert --repeat 200
+"""
+
+import argparse
+import sys
+import time
+from copy import deepcopy
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..adk.openapi_schema import COMPONENTS_PREFIX, json_schema_to_oas3
+from ..shared.registry import registry
+
+
+def _legacy_json_schema_to_oas3(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """The converter this benchmark replaced, kept as the baseline."""
+    if not isinstance(schema, dict):
+        return schema
+    schema = deepcopy(schema)
+    t = schema.get("type")
+    if isinstance(t, list) and "null" in t:
+        schema["nullable"] = True
+        schema["type"] = next((x for x in t if x != "null"), None)
+        if schema["type"] is None:
+            schema.pop("type")
+    if "anyOf" in schema:
+        variants = schema["anyOf"]
+        if len(variants) == 2 and any(v.get("type") == "null" for v in variants):
+            schema = _legacy_json_schema_to_oas3(next(v for v in variants if v.get("type") != "null"))
+            schema["nullable"] = True
+        else:
+            desc = schema.get("description")
+            schema = {"anyOf": [_legacy_json_schema_to_oas3(v) for v in variants]}
+            if desc:
+                schema["description"] = desc
+    if "allOf" in schema:
+        flat = {}
+        for part in schema.pop("allOf"):
+            flat.update(_legacy_json_schema_to_oas3(part))
+        schema.update(flat)
+    if "oneOf" in schema:
+        schema.update(_legacy_json_schema_to_oas3(schema["oneOf"][0]))
+        schema.pop("oneOf")
+    if "properties" in schema:
+        schema["properties"] = {k: _legacy_json_schema_to_oas3(v) for k, v in schema["properties"].items()}
+    if "items" in schema:
+        if isinstance(schema["items"], list):
+            schema["items"] = [_legacy_json_schema_to_oas3(i) for i in schema["items"]]
+        else:
+            schema["items"] = _legacy_json_schema_to_oas3(schema["items"])
+    if "ref" in schema and "$ref" not in schema:
+        schema["$ref"] = schema.pop("ref").replace("#/$defs", "#/components/schemas")
+    return schema
+
+
+def _nodes(schema: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(schema, dict):
+        yield schema
+        for value in schema.values():
+            yield from _nodes(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from _nodes(value)
+
+
+def validate(method: str, schema: Dict[str, Any], components: Dict[str, Any]) -> List[str]:
+    """Problems that would make the converted schema invalid OpenAPI 3.0."""
+    problems = []
+    for node in _nodes([schema, components]):
+        if "$defs" in node:
+            problems.append(f"{method}: leftover $defs")
+        if isinstance(node.get("type"), list):
+            problems.append(f"{method}: type list {node['type']}")
+        if "const" in node:
+            problems.append(f"{method}: const is not OpenAPI 3.0")
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            if not ref.startswith(COMPONENTS_PREFIX):
+                problems.append(f"{method}: unresolved $ref {ref}")
+            elif ref[len(COMPONENTS_PREFIX):] not in components:
+                problems.append(f"{method}: dangling $ref {ref}")
+        for variant in node.get("anyOf", []):
+            if isinstance(variant, dict) and variant.get("type") == "null":
+                problems.append(f"{method}: null variant left in anyOf")
+    return problems
+
+
+def _time(fn, schema, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(schema)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the ADK JSON Schema → OpenAPI converter.")
+    parser.add_argument("--repeat", type=int, default=200, help="conversions per tool and implementation")
+    args = parser.parse_args(argv)
+
+    problems: List[str] = []
+    total_old = total_new = 0.0
+    print(f"{'tool':34} {'deepcopy (us)':>14} {'single pass (us)':>17} {'speed-up':>9}")
+    for tool in registry.all_tools():
+        schema = tool["args_schema"].model_json_schema()
+        converted, components = json_schema_to_oas3(schema)
+        problems += validate(tool["method"], converted, components)
+
+        old = _time(_legacy_json_schema_to_oas3, schema, args.repeat)
+        new = _time(json_schema_to_oas3, schema, args.repeat)
+        total_old += old
+        total_new += new
+        print(f"{tool['method']:34} {old:14.1f} {new:17.1f} {old / new:8.1f}x")
+
+    print(f"{'all tools':34} {total_old:14.1f} {total_new:17.1f} {total_old / total_new:8.1f}x")
+    for problem in problems:
+        print(problem)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
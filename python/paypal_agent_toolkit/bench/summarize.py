@@ -0,0 +1,97 @@
+"""
+Cross-check of the two ``summarize_transactions`` engines::
+
+    python -m paypal_agent_toolkit.bench.summarize --transactions 200000
+
+Summarizes the same synthetic transactions with the NumPy engine and the
+``array`` fallback, for every ``group_by`` key and an event code filter, and
+reports the time each takes. The exit status is 1 when any group differs;
+without NumPy installed only the fallback is timed.
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from ..shared.transactions import analytics
+from ..shared.transactions.analytics import GROUP_KEYS, TransactionColumns, summarize
+
+CURRENCIES = ("USD", "EUR", "GBP", "JPY")
+STATUSES = ("S", "P", "D", "V")
+EVENT_CODES = ("T0006", "T0003", "T1107", "T1201", "T0400", "T9800", "T2101")
+CASES = [("currency",)] + [("currency", key) for key in GROUP_KEYS if key != "currency"] + [("status", "day")]
+
+
+def synthetic_transactions(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    records = []
+    for _ in range(count):
+        event_code = rng.choice(EVENT_CODES)
+        value = round(rng.uniform(-500, 500) if event_code.startswith("T11") else rng.uniform(0.01, 2000), 2)
+        currency = rng.choice(CURRENCIES)
+        records.append({"transaction_info": {
+            "transaction_event_code": event_code,
+            "transaction_status": rng.choice(STATUSES),
+            "transaction_initiation_date": (start + timedelta(seconds=rng.randrange(90 * 86400))).strftime("%Y-%m-%dT%H:%M:%S+0000"),
+            "transaction_amount": {"currency_code": currency, "value": f"{value:.2f}"},
+            "fee_amount": {"currency_code": currency, "value": f"{-round(abs(value) * 0.029, 2):.2f}"},
+        }})
+    return records
+
+
+def differences(expected: List[Dict[str, Any]], actual: List[Dict[str, Any]], tolerance: float = 0.011) -> List[str]:
+    """Groups or values that differ between two ``summarize`` group lists; amounts may differ by rounding."""
+    if len(expected) != len(actual):
+        return [f"{len(expected)} groups vs {len(actual)}"]
+    found = []
+    for left, right in zip(expected, actual):
+        if left.keys() != right.keys():
+            found.append(f"fields {sorted(left)} vs {sorted(right)}")
+            continue
+        for field, value in left.items():
+            other = right[field]
+            if isinstance(value, float) and isinstance(other, float):
+                if abs(value - other) > tolerance:
+                    found.append(f"{field} {value} vs {other} in {left}")
+            elif value != other:
+                found.append(f"{field} {value!r} vs {other!r} in {left}")
+    return found
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the NumPy and array engines of summarize_transactions.")
+    parser.add_argument("--transactions", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    columns = TransactionColumns.from_records(synthetic_transactions(args.transactions, args.seed))
+    cases = [(keys, None) for keys in CASES] + [(("currency", "category"), "T11")]
+    engines = [False] + ([True] if analytics.numpy is not None else [])
+    if analytics.numpy is None:
+        print("NumPy is not installed; timing the array engine only")
+
+    mismatches = 0
+    for keys, event_code in cases:
+        timings, results = [], []
+        for use_numpy in engines:
+            start = time.perf_counter()
+            results.append(summarize(columns, keys, event_code=event_code, use_numpy=use_numpy)["groups"])
+            timings.append(f"{'numpy' if use_numpy else 'array'} {(time.perf_counter() - start) * 1000:8.1f} ms")
+        label = ",".join(keys) + (f" event_code={event_code}" if event_code else "")
+        print(f"{label:32} {len(results[0]):5} groups  {'  '.join(timings)}")
+        for difference in differences(*results) if len(results) == 2 else []:
+            mismatches += 1
+            print(f"  mismatch: {difference}")
+
+    if mismatches:
+        print(f"{mismatches} differences between the NumPy and array engines")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
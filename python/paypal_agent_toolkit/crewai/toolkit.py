@@ -6,8 +6,8 @@ from typing import List, Optional
 from pydantic import PrivateAttr, BaseModel
 
 from ..shared.api import PayPalAPI
-from ..shared.tools import tools
-from ..shared.configuration import Configuration, is_tool_allowed
+from ..shared.registry import registry
+from ..shared.configuration import Configuration
 from .tool import PayPalTool
 
 
@@ -21,11 +21,9 @@ class PayPalToolkit:
         self._tools = []
         self.context = configuration.context if configuration and configuration.context else Configuration.Context.default()
         self.context.source = self.SOURCE
-        paypal_api = PayPalAPI(client_id=client_id, secret=secret, context=self.context)
+        paypal_api = PayPalAPI(client_id=client_id, secret=secret, context=self.context, configuration=configuration)
 
-        filtered_tools = [
-            tool for tool in tools if is_tool_allowed(tool, configuration)
-        ]
+        filtered_tools = registry.enabled_tools(configuration)
         for tool in filtered_tools:
             args_schema = tool.get("args_schema")
     
@@ -0,0 +1,11 @@
+"""PayPal tools for LangChain. Requires ``pip install "paypal-agent-toolkit[langchain]"``."""
+
+from .._lazy import lazy_exports
+
+__all__ = ["PayPalToolkit", "PayPalTool"]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {"PayPalToolkit": ".toolkit", "PayPalTool": ".tool"},
+    extra="langchain",
+)
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from langchain.tools import BaseTool
 
 from ..shared.api import PayPalAPI
+from ..shared.schemas import schema_compiler
 
 
 class PayPalTool(BaseTool):
@@ -30,6 +31,13 @@ class PayPalTool(BaseTool):
     description: str = ""
     args_schema: Optional[Type[BaseModel]] = None
 
+    @property
+    def args(self) -> dict:
+        """Tool input properties, served from the process-wide schema cache."""
+        if isinstance(self.args_schema, type) and issubclass(self.args_schema, BaseModel):
+            return schema_compiler.get(self.args_schema, "langchain")
+        return super().args
+
     def _run(self, *args: Any, **kwargs: Any) -> str:
         """
         Executes the configured PayPal API method.
@@ -42,6 +50,18 @@ class PayPalTool(BaseTool):
         except Exception as e:
             return f"Error executing PayPalTool '{self.method}': {str(e)}"
 
+    async def _arun(self, *args: Any, **kwargs: Any) -> str:
+        """
+        Executes the configured PayPal API method without blocking the event loop.
+
+        Returns:
+            str: The result from the PayPal API, or an error message.
+        """
+        try:
+            return await self.paypal_api.arun(self.method, kwargs)
+        except Exception as e:
+            return f"Error executing PayPalTool '{self.method}': {str(e)}"
+
     def __repr__(self):
         return f"<PayPalTool name={self.name}, method={self.method}>"
 
@@ -4,8 +4,8 @@ from typing import List, Optional
 from pydantic import PrivateAttr
 
 from ..shared.api import PayPalAPI
-from ..shared.tools import tools
-from ..shared.configuration import Configuration, Context, is_tool_allowed
+from ..shared.registry import registry
+from ..shared.configuration import Configuration, Context
 from .tool import PayPalTool
 
 
@@ -19,11 +19,9 @@ class PayPalToolkit:
         self.configuration = configuration
         self.context = configuration.context if configuration and configuration.context else Configuration.Context.default()
         self.context.source = self.SOURCE
-        self._paypal_api = PayPalAPI(client_id=client_id, secret=secret, context=self.context)
+        self._paypal_api = PayPalAPI(client_id=client_id, secret=secret, context=self.context, configuration=configuration)
 
-        filtered_tools = [
-            tool for tool in tools if is_tool_allowed(tool, configuration)
-        ]
+        filtered_tools = registry.enabled_tools(configuration)
 
         self._tools = [
             PayPalTool(
@@ -1,12 +1,15 @@
 """PayPal Agentic Toolkit."""
-from typing import List
-from agents import FunctionTool
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 from pydantic import PrivateAttr
-from ..shared.tools import tools
-from ..openai.tool import PayPalTool
-from ..shared.paypal_client import PayPalClient
-from ..shared.configuration import Configuration, is_tool_allowed
+from ..shared.registry import registry
+from ..shared.configuration import Configuration
 from ..shared.api import PayPalAPI
+from ..shared.schemas import schema_compiler
+
+if TYPE_CHECKING:
+    from agents import FunctionTool
 
 class PayPalToolkit:
 
@@ -20,27 +23,22 @@ class PayPalToolkit:
         
         self.context = configuration.context if configuration and configuration.context else Configuration.Context.default()
         self.context.source = self.SOURCE
-        self._paypal_api = PayPalAPI(client_id=client_id, secret=secret, context=self.context)
+        self._paypal_api = PayPalAPI(client_id=client_id, secret=secret, context=self.context, configuration=configuration)
 
-        filtered_tools = [
-            tool for tool in tools if is_tool_allowed(tool, configuration)
-        ]
+        self._filtered_tools = registry.enabled_tools(configuration)
+        # Built on first use so Chat Completions users do not need openai-agents.
+        self._tools = None
 
-        self._tools = [
-            PayPalTool(self._paypal_api, tool)
-            for tool in filtered_tools
-        ]
-  
         self._openai_tools = [
             {
                 "type": "function",
                 "function": {
                     "name": tool["method"],
                     "description": tool["description"],
-                    "parameters": tool["args_schema"].model_json_schema(),
+                    "parameters": schema_compiler.get(tool["args_schema"], "openai_chat"),
                 }
             }
-            for tool in filtered_tools
+            for tool in self._filtered_tools
         ]
         
     def get_openai_chat_tools(self):
@@ -52,4 +50,11 @@ class PayPalToolkit:
     
     def get_tools(self) -> List[FunctionTool]:
         """Get the tools in the openai agent."""
+        if self._tools is None:
+            from .tool import PayPalTool
+
+            self._tools = [
+                PayPalTool(self._paypal_api, tool)
+                for tool in self._filtered_tools
+            ]
         return self._tools
@@ -0,0 +1,42 @@
+"""Framework-independent PayPal client, tool definitions and resilience settings."""
+
+from .._lazy import lazy_exports
+
+__all__ = [
+    "PayPalAPI",
+    "CallResult",
+    "BatchError",
+    "Configuration",
+    "Context",
+    "PayPalClient",
+    "AsyncPayPalClient",
+    "HttpPoolConfig",
+    "RetryPolicy",
+    "RateLimit",
+    "RateLimiter",
+    "CircuitBreakerRegistry",
+    "ToolResultCache",
+    "ToolRegistry",
+    "get_tool",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "PayPalAPI": ".api",
+        "CallResult": ".batch",
+        "BatchError": ".batch",
+        "Configuration": ".configuration",
+        "Context": ".configuration",
+        "PayPalClient": ".paypal_client",
+        "AsyncPayPalClient": ".async_paypal_client",
+        "HttpPoolConfig": ".http_pool",
+        "RetryPolicy": ".retry",
+        "RateLimit": ".rate_limiter",
+        "RateLimiter": ".rate_limiter",
+        "CircuitBreakerRegistry": ".circuit_breaker",
+        "ToolResultCache": ".result_cache",
+        "ToolRegistry": ".registry",
+        "get_tool": ".registry",
+    },
+)
@@ -1,28 +1,269 @@
-
-
-from typing import Optional
+import asyncio
+import contextvars
+import json
+import weakref
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any, Iterable, List, Optional
 from pydantic import BaseModel
-from .configuration import Context
+from .configuration import Configuration, Context
 from .paypal_client import PayPalClient
-from .tools import tools
+from .async_paypal_client import AsyncPayPalClient
+from .batch import DEFAULT_BATCH_CONCURRENCY, BatchError, Call, CallResult
+from .circuit_breaker import CircuitOpenError
+from .concurrency import merchant_scope
+from .result_cache import ToolResultCache
+from .registry import get_tool
 
 class PayPalAPI(BaseModel):
-    
+
     _context: Context
     _paypal_client: PayPalClient
-    
-    def __init__(self, client_id: str, secret: str, context: Optional[Context]):
+    _async_clients: Any = None
+    _client_id: str
+    _secret: str
+    _configuration: Optional[Configuration] = None
+    _result_cache: Optional[ToolResultCache] = None
+    _cache_scope: str = ""
+
+    def __init__(self, client_id: str, secret: str, context: Optional[Context], configuration: Optional[Configuration] = None):
         super().__init__()
 
         self._context = context if context is not None else Context()
-        self._paypal_client = PayPalClient(client_id=client_id, secret=secret, context=context)
-        
-    
+        self._client_id = client_id
+        self._secret = secret
+        self._configuration = configuration
+        # One AsyncPayPalClient per event loop, with the generator that closes it.
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._paypal_client = PayPalClient(
+            client_id=client_id,
+            secret=secret,
+            context=self._context,
+            **self._client_options(),
+        )
+        if configuration is not None and configuration.result_cache is not None:
+            self._result_cache = configuration.result_cache
+            # Results are only shared between callers acting for the same merchant.
+            self._cache_scope = merchant_scope(self._paypal_client)
+
+    def close(self):
+        """Release the pooled HTTP connections held by the underlying client."""
+        self._paypal_client.close()
+
+    async def aclose(self):
+        """
+        Release the sync connection pool and the async client of every event
+        loop: the running one directly, loops running in other threads through
+        ``run_coroutine_threadsafe``. Call it (or use ``async with``) before the
+        loop is closed, in particular when driving a loop by hand.
+        """
+        self.close()
+        running = asyncio.get_running_loop()
+        for loop, (_, closer) in list(self._async_clients.items()):
+            if loop is running:
+                await closer.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(closer.aclose(), loop))
+            # A stopped loop can no longer run the close; see _close_on_loop_shutdown.
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
     def run(self, method: str, params: dict) -> str:
-        for tool in tools:
-            if tool.get("method") == method:
-                execute_fn = tool.get("execute")
-                if execute_fn:
-                    return execute_fn(self._paypal_client, params)
-        raise ValueError(f"method: {method} not found in tools list")
+        tool = get_tool(method)
+        execute_fn = tool.get("execute") if tool else None
+        if not execute_fn:
+            raise ValueError(f"method: {method} not found in tools list")
+
+        cached = self._cached_result(tool, params)
+        if cached is not None:
+            return cached
+        try:
+            result = execute_fn(self._paypal_client, params, **self._services(tool))
+        except CircuitOpenError as e:
+            return json.dumps(e.to_result())
+        except Exception:
+            self._invalidate_results(tool, params)
+            raise
+        self._record_result(tool, params, result)
+        return result
+
+    async def arun(self, method: str, params: dict) -> str:
+        """
+        Async counterpart of ``run``. Uses the tool's native async handler on an
+        ``AsyncPayPalClient``; a tool without one runs in a worker thread so the
+        event loop is never blocked.
+        """
+        tool = get_tool(method) or {}
+        execute_async_fn = tool.get("execute_async")
+        execute_fn = tool.get("execute")
+        if not (execute_async_fn or execute_fn):
+            raise ValueError(f"method: {method} not found in tools list")
+
+        cached = self._cached_result(tool, params)
+        if cached is not None:
+            return cached
+        try:
+            if execute_async_fn:
+                result = await execute_async_fn(self._get_async_client(), params, **self._services(tool))
+            else:
+                result = await asyncio.to_thread(execute_fn, self._paypal_client, params, **self._services(tool))
+        except CircuitOpenError as e:
+            return json.dumps(e.to_result())
+        except Exception:
+            self._invalidate_results(tool, params)
+            raise
+        self._record_result(tool, params, result)
+        return result
+
+    def run_many(self, calls: Iterable[Call], max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+                 fail_fast: bool = False) -> List[CallResult]:
+        """
+        Run ``(method, params)`` calls concurrently, at most ``max_concurrency``
+        at a time, and return one ``CallResult`` per call in the order given.
+        Every call goes through ``run``, so they share the connection pool,
+        rate limiter, circuit breakers and result cache.
+
+        By default every call runs and failures are reported on their result.
+        With ``fail_fast`` the first failure stops calls that have not started
+        and raises ``BatchError`` holding every outcome; calls already running
+        are allowed to finish.
+        """
+        calls = list(calls)
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(calls))), thread_name_prefix="paypal-batch")
+        try:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self.run, method, params)
+                for method, params in calls
+            ]
+            if fail_fast:
+                wait(futures, return_when=FIRST_EXCEPTION)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=fail_fast)
+
+        results = []
+        for (method, params), future in zip(calls, futures):
+            if future.cancelled():
+                results.append(CallResult(method, params, cancelled=True))
+            elif future.exception() is not None:
+                results.append(CallResult(method, params, error=future.exception()))
+            else:
+                results.append(CallResult(method, params, future.result()))
+        return self._batch_outcome(results, fail_fast)
+
+    async def arun_many(self, calls: Iterable[Call], max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+                        fail_fast: bool = False) -> List[CallResult]:
+        """Async ``run_many``; with ``fail_fast`` calls still in flight are cancelled too."""
+        calls = list(calls)
+        # Clamped like run_many: a semaphore of 0 would never let a call start.
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def call(method: str, params: dict):
+            async with semaphore:
+                return await self.arun(method, params)
+
+        tasks = [asyncio.ensure_future(call(method, params)) for method, params in calls]
+        if not tasks:
+            return []
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION if fail_fast else asyncio.ALL_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = []
+        for (method, params), task in zip(calls, tasks):
+            if task.cancelled():
+                results.append(CallResult(method, params, cancelled=True))
+            elif task.exception() is not None:
+                results.append(CallResult(method, params, error=task.exception()))
+            else:
+                results.append(CallResult(method, params, task.result()))
+        return self._batch_outcome(results, fail_fast)
+
+    @staticmethod
+    def _batch_outcome(results: List[CallResult], fail_fast: bool) -> List[CallResult]:
+        failed = next((result for result in results if result.error is not None), None)
+        if fail_fast and failed is not None:
+            raise BatchError(f"{failed.method} failed: {failed.error}", results) from failed.error
+        return results
+
+    def _cached_result(self, tool: dict, params: dict):
+        if self._result_cache is None:
+            return None
+        return self._result_cache.lookup(self._cache_scope, tool, params)
+
+    def _record_result(self, tool: dict, params: dict, result) -> None:
+        if self._result_cache is not None:
+            self._result_cache.record(self._cache_scope, tool, params, result)
+
+    def _invalidate_results(self, tool: dict, params: dict) -> None:
+        if self._result_cache is not None:
+            self._result_cache.invalidate(self._cache_scope, tool, params)
+
+    def _get_async_client(self) -> AsyncPayPalClient:
+        # httpx connection pools are bound to the loop that opened them and
+        # cannot be closed once it has stopped, so each loop gets its own client.
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is None:
+            client = AsyncPayPalClient(
+                client_id=self._client_id,
+                secret=self._secret,
+                context=self._context,
+                **self._client_options(),
+            )
+            entry = self._async_clients[loop] = (client, _close_on_loop_shutdown(self._async_clients, loop, client))
+        return entry[0]
+
+    def _client_options(self) -> dict:
+        """Transport settings from the configuration, shared by the sync and async clients."""
+        configuration = self._configuration
+        if configuration is None:
+            return {}
+        return {
+            "http_pool": configuration.http_pool,
+            "retry_policy": configuration.retry_policy,
+            "rate_limiter": configuration.rate_limiter,
+            "circuit_breakers": configuration.circuit_breakers,
+            "coalesce_gets": configuration.coalesce_gets,
+        }
+
+    def _services(self, tool: dict) -> dict:
+        """The configured objects ``tool`` declares under ``services``, as keyword arguments of its handler."""
+        return {name: getattr(self._configuration, name, None) for name in tool.get("services", ())}
+
+
+async def _closing(clients, loop, client: AsyncPayPalClient):
+    try:
+        yield
+    finally:
+        clients.pop(loop, None)
+        await client.aclose()
+
 
+def _close_on_loop_shutdown(clients, loop, client: AsyncPayPalClient):
+    """
+    Start a generator that forgets and closes ``client`` when closed.
+    ``PayPalAPI.aclose`` closes it explicitly. As a fallback for callers that
+    never do, the running loop tracks it as one of its async generators, so
+    ``asyncio.run`` (or anything awaiting ``loop.shutdown_asyncgens()``)
+    closes the client before the loop is closed; a loop closed without that
+    step leaks the client's connections.
+    """
+    closer = _closing(clients, loop, client)
+    try:
+        closer.asend(None).send(None)
+    except StopIteration:
+        pass
+    return closer
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from typing import Optional
+
+from .configuration import Context
+from .http_pool import HTTP_ERRORS, TRANSIENT_ERRORS, create_async_http_session
+from .logger_util import logRequestPayload
+from .paypal_client import BasePayPalClient
+from .endpoints import endpoint_family
+from .single_flight import AsyncSingleFlight
+
+
+class AsyncPayPalClient(BasePayPalClient):
+    """
+    asyncio counterpart of ``PayPalClient`` built on ``httpx.AsyncClient``.
+
+    ``get``/``post`` are coroutines with the same arguments and return values
+    as the sync client, so handlers can await many calls concurrently. The
+    access token cache is shared with sync clients using the same credentials.
+    """
+
+    def __init__(self, client_id, secret, context: Optional[Context], **options):
+        super().__init__(client_id, secret, context, **options)
+        self._session = create_async_http_session(self.http_pool)
+
+
+    async def aclose(self):
+        """Close the pooled connections. The client must not be used afterwards."""
+        await self._session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+    async def build_headers(self, access_token: Optional[str] = None, idempotency_key: Optional[str] = None):
+        return self._headers_for(access_token or await self.get_access_token(), idempotency_key)
+
+    async def get_access_token(self):
+        """Return a valid access token, fetching a new one only when the cached token is stale."""
+        return await self._token_cache.aget(self.fetch_access_token)
+
+    async def fetch_access_token(self):
+        """Request a new token from PayPal. Returns a ``(token, expires_in)`` tuple."""
+        request = self._token_request()
+        try:
+            response = await self._session.request(**request)
+            response.raise_for_status()
+        except HTTP_ERRORS as e:
+            self.log_request_exception(e, request["url"])
+            raise RuntimeError("Failed to obtain access token from PayPal") from e
+
+        return self._parse_token_response(response)
+
+
+    async def _send(self, method, url, payload=None, idempotency_key=None):
+        family = endpoint_family(url)
+        breaker = self.circuit_breakers.get(family) if self.circuit_breakers else None
+        if breaker is None:
+            return await self._send_attempts(method, url, family, payload, idempotency_key)
+
+        probe = breaker.before_call()
+        try:
+            response = await self._send_attempts(method, url, family, payload, idempotency_key)
+        except TRANSIENT_ERRORS:
+            breaker.record_failure(probe)
+            raise
+        except BaseException:
+            breaker.record_released(probe)
+            raise
+        self._record_outcome(breaker, probe, response)
+        return response
+
+    async def _send_attempts(self, method, url, family, payload=None, idempotency_key=None):
+        stats = self._start_call(method, url)
+        idempotent = method == "GET" or bool(idempotency_key)
+        token_refreshed = False
+        try:
+            while True:
+                if self.rate_limiter:
+                    await self.rate_limiter.aacquire(self.merchant_key, family)
+                access_token = await self.get_access_token()
+                headers = await self.build_headers(access_token, idempotency_key)
+                logRequestPayload(payload, url, headers)
+                stats.attempts += 1
+                try:
+                    response = await self._session.request(
+                        method, url, headers=headers, json=payload, timeout=self.retry_policy.timeout
+                    )
+                except TRANSIENT_ERRORS as e:
+                    delay = self._retry_delay(stats, idempotent, error=e)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
+
+                stats.last_status = response.status_code
+                if not token_refreshed and self._should_refresh_token(response, url):
+                    self._token_cache.invalidate(access_token)
+                    token_refreshed = True
+                    continue
+
+                delay = self._retry_delay(stats, idempotent, response=response)
+                if delay is None:
+                    return response
+                await asyncio.sleep(delay)
+        finally:
+            stats.elapsed = time.monotonic() - stats.started_at
+
+
+    async def post(self, uri, payload, idempotency_key: Optional[str] = None):
+
+        url = f"{self.base_url}{uri}"
+        try:
+            response = await self._send("POST", url, payload, idempotency_key)
+            response.raise_for_status()
+        except HTTP_ERRORS as e:
+            self.log_request_exception(e, url)
+            raise
+
+        return self._parse_response(response)
+
+
+    async def get(self, uri):
+
+        url = f"{self.base_url}{uri}"
+        if not self.coalesce_gets:
+            return await self._get(url)
+        return await AsyncSingleFlight.for_running_loop().do(
+            self._flight_key(url), lambda: self._get(url)
+        )
+
+
+    async def _get(self, url):
+        try:
+            response = await self._send("GET", url)
+            response.raise_for_status()
+        except HTTP_ERRORS as e:
+            self.log_request_exception(e, url)
+            raise
+
+        return self._parse_response(response)
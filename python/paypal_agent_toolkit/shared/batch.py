@@ -0,0 +1,48 @@
+from typing import Any, List, Optional, Tuple
+
+# Default number of tool calls ``PayPalAPI.run_many`` runs at the same time.
+DEFAULT_BATCH_CONCURRENCY = 8
+
+Call = Tuple[str, dict]
+
+
+class CallResult:
+    """Outcome of one call of a batch: its result, the exception it raised, or that it never ran."""
+
+    def __init__(self, method: str, params: dict, result: Any = None, error: Optional[BaseException] = None,
+                 cancelled: bool = False):
+        self.method = method
+        self.params = params
+        self.result = result
+        self.error = error
+        self.cancelled = cancelled
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.cancelled
+
+    def unwrap(self) -> Any:
+        """The result, or the call's exception raised."""
+        if self.error is not None:
+            raise self.error
+        if self.cancelled:
+            raise BatchError(f"{self.method} was cancelled after another call of the batch failed", [self])
+        return self.result
+
+    def to_result(self) -> dict:
+        if self.ok:
+            return {"method": self.method, "ok": True, "result": self.result}
+        error = "cancelled" if self.error is None else f"{type(self.error).__name__}: {self.error}"
+        return {"method": self.method, "ok": False, "error": error}
+
+    def __repr__(self) -> str:
+        state = "ok" if self.ok else "cancelled" if self.error is None else f"error={self.error!r}"
+        return f"CallResult({self.method!r}, {state})"
+
+
+class BatchError(RuntimeError):
+    """A fail-fast batch stopped at a failed call; ``results`` has every call's outcome, in order."""
+
+    def __init__(self, message: str, results: List[CallResult]):
+        super().__init__(message)
+        self.results = results
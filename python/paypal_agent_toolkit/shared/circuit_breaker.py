@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+StateChangeCallback = Callable[[str, str, str], None]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without touching the network while an endpoint family's circuit is open."""
+
+    def __init__(self, family: str, retry_after: float):
+        self.family = family
+        self.retry_after = max(0.0, retry_after)
+        super().__init__(
+            f"PayPal {family} endpoints are temporarily unavailable, retry after {self.retry_after:.0f} s"
+        )
+
+    def to_result(self) -> dict:
+        """Structured tool result handed to the LLM instead of an exception."""
+        return {
+            "error": "temporarily_unavailable",
+            "endpoint_family": self.family,
+            "retry_after_seconds": round(self.retry_after, 1),
+            "message": str(self),
+        }
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker for one endpoint family.
+
+    ``failure_threshold`` consecutive failures (5xx responses or transport
+    errors) open the circuit. After ``recovery_timeout`` seconds it turns
+    half-open and lets ``half_open_max_calls`` probe calls through: a success
+    closes it again, a failure re-opens it for another full timeout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[StateChangeCallback] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def before_call(self) -> bool:
+        """
+        Admit a call or raise ``CircuitOpenError``. Returns True when the call
+        is a half-open probe; pass that flag back to ``record_*``.
+        """
+        transition = None
+        with self._lock:
+            if self._state == OPEN:
+                remaining = self._opened_at + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(self.name, remaining)
+                transition = self._set_state(HALF_OPEN)
+            if self._state == HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.name, self.recovery_timeout)
+                self._probes += 1
+                probe = True
+            else:
+                probe = False
+        self._notify(transition)
+        return probe
+
+    def record_success(self, probe: bool = False) -> None:
+        with self._lock:
+            self._failures = 0
+            if probe:
+                self._probes -= 1
+            transition = self._set_state(CLOSED) if self._state == HALF_OPEN else None
+        self._notify(transition)
+
+    def record_failure(self, probe: bool = False) -> None:
+        transition = None
+        with self._lock:
+            if probe:
+                self._probes -= 1
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                transition = self._set_state(OPEN)
+        self._notify(transition)
+
+    def record_released(self, probe: bool = False) -> None:
+        """The call ended without a verdict on endpoint health (e.g. a client-side error)."""
+        if probe:
+            with self._lock:
+                self._probes -= 1
+
+    def _set_state(self, state: str):
+        old, self._state = self._state, state
+        if state != HALF_OPEN:
+            self._probes = 0
+        return (old, state) if old != state else None
+
+    def _notify(self, transition) -> None:
+        if transition is None:
+            return
+        old, new = transition
+        logging.warning("PayPal circuit '%s' changed from %s to %s", self.name, old, new)
+        if self.on_state_change:
+            try:
+                self.on_state_change(self.name, old, new)
+            except Exception:
+                logging.exception("Circuit breaker state-change callback failed")
+
+
+class CircuitBreakerRegistry:
+    """One ``CircuitBreaker`` per endpoint family, created on first use with shared settings."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[StateChangeCallback] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, family: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = self._breakers[family] = CircuitBreaker(
+                    family,
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_max_calls=self.half_open_max_calls,
+                    on_state_change=self.on_state_change,
+                )
+            return breaker
+
+    def states(self) -> Dict[str, str]:
+        with self._lock:
+            return {family: breaker.state for family, breaker in self._breakers.items()}
@@ -0,0 +1,117 @@
+"""
+Helpers shared by the features that fan PayPal calls out over many items.
+
+``bounded_map`` runs a function over an iterable in worker threads with at
+most ``max_concurrency`` calls in flight, and ``abounded_map`` does the same
+with tasks. Items are pulled from the iterable only as slots free up, so
+inputs of any length are never held in memory, and each call runs in a copy
+of the caller's context so per-call state (stats, tracing) follows it.
+``merchant_scope`` names the environment and merchant a client acts for, the
+key under which local stores keep their per-merchant state.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Tuple, Union
+
+_END = object()
+
+
+def bounded_map(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: int,
+    ordered: bool = False,
+    thread_name_prefix: str = "paypal-worker",
+) -> Iterator[Tuple[Any, Future]]:
+    """
+    Yield ``(item, future)`` for each item once ``fn(item)`` has finished, as
+    calls complete or, with ``ordered``, in the order of ``items``. Call
+    ``future.result()`` for the outcome. Closing the iterator early cancels the
+    calls not yet started.
+    """
+    max_concurrency = max(1, max_concurrency)
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=thread_name_prefix)
+    in_flight: Dict[Future, Any] = {}
+
+    def submit_next() -> bool:
+        item = next(items, _END)
+        if item is _END:
+            return False
+        in_flight[executor.submit(contextvars.copy_context().run, fn, item)] = item
+        return True
+
+    try:
+        while len(in_flight) < max_concurrency and submit_next():
+            pass
+        while in_flight:
+            if ordered:
+                done = [next(iter(in_flight))]
+                wait(done)
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = in_flight.pop(future)
+                submit_next()
+                yield item, future
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def abounded_map(
+    fn: Callable[[Any], Awaitable[Any]],
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    max_concurrency: int,
+    ordered: bool = False,
+) -> AsyncIterator[Tuple[Any, "asyncio.Future[Any]"]]:
+    """
+    Async ``bounded_map``: ``fn`` is a coroutine function and ``items`` may be
+    an async iterable. Close the iterator (``contextlib.aclosing``) when
+    leaving it early so the tasks still in flight are cancelled.
+    """
+    max_concurrency = max(1, max_concurrency)
+    if hasattr(items, "__aiter__"):
+        iterator = aiter(items)
+
+        async def next_item():
+            return await anext(iterator, _END)
+    else:
+        iterator = iter(items)
+
+        async def next_item():
+            return next(iterator, _END)
+
+    in_flight: Dict[asyncio.Future, Any] = {}
+
+    async def submit_next() -> bool:
+        item = await next_item()
+        if item is _END:
+            return False
+        in_flight[asyncio.ensure_future(fn(item))] = item
+        return True
+
+    try:
+        while len(in_flight) < max_concurrency and await submit_next():
+            pass
+        while in_flight:
+            if ordered:
+                done = [next(iter(in_flight))]
+                await asyncio.wait(done)
+            else:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = in_flight.pop(task)
+                await submit_next()
+                yield item, task
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+def merchant_scope(client) -> str:
+    """Key of the environment and merchant ``client`` acts for."""
+    return f"{client.base_url}|{client.merchant_key}"
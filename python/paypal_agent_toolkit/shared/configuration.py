@@ -1,4 +1,15 @@
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
+if TYPE_CHECKING:
+    from .http_pool import HttpPoolConfig
+    from .retry import RetryPolicy
+    from .rate_limiter import RateLimiter
+    from .circuit_breaker import CircuitBreakerRegistry
+    from .result_cache import ToolResultCache
+    from .transactions.store import TransactionStore
+    from .tracking.batcher import TrackerBatcher
+    from .tracking.resolver import CaptureResolver
+    from .invoices.reminders import ReminderLog
 
 class Context:
 
@@ -25,9 +36,34 @@ class Context:
         self.extra = kwargs
 
 class Configuration:
-    def __init__(self, actions: Dict[str, Dict[str, bool]], context: Optional[Context] = None):
+    def __init__(
+        self,
+        actions: Dict[str, Dict[str, bool]],
+        context: Optional[Context] = None,
+        http_pool: Optional["HttpPoolConfig"] = None,
+        retry_policy: Optional["RetryPolicy"] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        circuit_breakers: Optional["CircuitBreakerRegistry"] = None,
+        coalesce_gets: bool = True,
+        result_cache: Optional["ToolResultCache"] = None,
+        transaction_store: Optional["TransactionStore"] = None,
+        tracker_batcher: Optional["TrackerBatcher"] = None,
+        capture_resolver: Optional["CaptureResolver"] = None,
+        reminder_log: Optional["ReminderLog"] = None,
+    ):
         self.actions = actions
         self.context = context
+        self.http_pool = http_pool
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        self.coalesce_gets = coalesce_gets
+        self.result_cache = result_cache
+        # Passed to the handlers of the tools that list them under "services".
+        self.transaction_store = transaction_store
+        self.tracker_batcher = tracker_batcher
+        self.capture_resolver = capture_resolver
+        self.reminder_log = reminder_log
 
 def is_tool_allowed(tool: Dict[str, Dict[str, Dict[str, bool]]], configuration: Configuration) -> bool:
     for product, product_actions in tool.get("actions", {}).items():
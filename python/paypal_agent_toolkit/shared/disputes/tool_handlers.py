@@ -1,34 +1,50 @@
-
 from urllib.parse import urlencode
 from .parameters import *
+from ..request_util import ApiRequest, send_request, send_request_async
 import json
 from typing import Union, Dict, Any
 
 
 
 def list_disputes(client, params: dict):
-    
+    return send_request(client, _build_list_disputes(params))
+
+
+def get_dispute(client, params: dict):
+    return send_request(client, _build_get_dispute(params))
+
+
+def accept_dispute_claim(client, params: dict):
+    return send_request(client, _build_accept_dispute_claim(params))
+
+
+async def list_disputes_async(client, params: dict):
+    return await send_request_async(client, _build_list_disputes(params))
+
+
+async def get_dispute_async(client, params: dict):
+    return await send_request_async(client, _build_get_dispute(params))
+
+
+async def accept_dispute_claim_async(client, params: dict):
+    return await send_request_async(client, _build_accept_dispute_claim(params))
+
+
+def _build_list_disputes(params: dict) -> ApiRequest:
+
     validated = ListDisputesParameters(**params)
     query_string = urlencode(validated.dict(exclude_none=True))
     uri = f"/v1/customer/disputes?{query_string}"
-
-    response = client.get(uri=uri)
-    return json.dumps(response) 
+    return ApiRequest("GET", uri)
 
 
-def get_dispute(client, params: dict):
+def _build_get_dispute(params: dict) -> ApiRequest:
     validated = GetDisputeParameters(**params)
     uri = f"/v1/customer/disputes/{validated.dispute_id}"
+    return ApiRequest("GET", uri)
 
-    response = client.get(uri=uri)
-    return json.dumps(response) 
 
-
-def accept_dispute_claim(client, params: dict):
+def _build_accept_dispute_claim(params: dict) -> ApiRequest:
     validated = AcceptDisputeClaimParameters(**params)
     uri = f"/v1/customer/disputes/{validated.dispute_id}/accept-claim"
-
-    response = client.post(uri=uri, payload={"note": validated.note})
-    return json.dumps(response) 
-
-
+    return ApiRequest("POST", uri, {"note": validated.note})
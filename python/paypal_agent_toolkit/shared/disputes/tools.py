@@ -0,0 +1,51 @@
+from .prompts import (
+    LIST_DISPUTES_PROMPT,
+    GET_DISPUTE_PROMPT,
+    ACCEPT_DISPUTE_CLAIM_PROMPT,
+)
+
+from .parameters import (
+    ListDisputesParameters,
+    GetDisputeParameters,
+    AcceptDisputeClaimParameters,
+)
+
+from .tool_handlers import (
+    list_disputes,
+    get_dispute,
+    accept_dispute_claim,
+    list_disputes_async,
+    get_dispute_async,
+    accept_dispute_claim_async,
+)
+
+
+tools = [
+    {
+        "method": "list_disputes",
+        "name": "List Disputes",
+        "description": LIST_DISPUTES_PROMPT.strip(),
+        "args_schema": ListDisputesParameters,
+        "actions": {"disputes": {"list": True}},
+        "execute": list_disputes,
+        "execute_async": list_disputes_async,
+    },
+    {
+        "method": "get_dispute",
+        "name": "Get Dispute",
+        "description": GET_DISPUTE_PROMPT.strip(),
+        "args_schema": GetDisputeParameters,
+        "actions": {"disputes": {"get": True}},
+        "execute": get_dispute,
+        "execute_async": get_dispute_async,
+    },
+    {
+        "method": "accept_dispute_claim",
+        "name": "Accept Dispute Claim",
+        "description": ACCEPT_DISPUTE_CLAIM_PROMPT.strip(),
+        "args_schema": AcceptDisputeClaimParameters,
+        "actions": {"disputes": {"create": True}},
+        "execute": accept_dispute_claim,
+        "execute_async": accept_dispute_claim_async,
+    },
+]
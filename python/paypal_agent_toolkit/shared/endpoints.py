@@ -0,0 +1,24 @@
+from urllib.parse import urlsplit
+
+# Endpoint families group PayPal APIs that share rate limits and failure modes.
+ENDPOINT_FAMILIES = (
+    ("/v1/oauth2/", "oauth"),
+    ("/v1/reporting/", "reporting"),
+    ("/v2/invoicing/", "invoicing"),
+    ("/v2/checkout/", "checkout"),
+    ("/v1/catalogs/", "catalog"),
+    ("/v1/billing/", "subscriptions"),
+    ("/v1/customer/disputes", "disputes"),
+    ("/v1/shipping/", "shipping"),
+)
+
+DEFAULT_FAMILY = "default"
+
+
+def endpoint_family(uri: str) -> str:
+    """Map a request URI or absolute URL to its endpoint family, e.g. ``reporting``."""
+    path = urlsplit(uri).path if "://" in uri else uri
+    for prefix, family in ENDPOINT_FAMILIES:
+        if path.startswith(prefix):
+            return family
+    return DEFAULT_FAMILY
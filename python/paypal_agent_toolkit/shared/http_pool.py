@@ -0,0 +1,94 @@
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Exceptions raised by either transport; callers catch these instead of a single library's type.
+HTTP_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+
+# Errors raised before any response arrived (connect failures, resets, timeouts).
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, httpx.TransportError)
+
+
+class HttpPoolConfig:
+    """
+    Connection pool settings for ``PayPalClient``.
+
+    pool_connections  - number of per-host pools kept alive (requests transport)
+    pool_maxsize      - maximum open connections per host
+    pool_block        - wait for a free connection instead of opening an extra one
+    keep_alive        - reuse connections between calls
+    keep_alive_expiry - idle seconds before a pooled connection is dropped (httpx transport)
+    http2             - use an HTTP/2 capable ``httpx.Client`` instead of ``requests``
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 50,
+        pool_block: bool = True,
+        keep_alive: bool = True,
+        keep_alive_expiry: float = 30.0,
+        http2: bool = False,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.keep_alive_expiry = keep_alive_expiry
+        self.http2 = http2
+
+
+def create_http_session(config: HttpPoolConfig):
+    """
+    Build the pooled session a client sends every request through. Both
+    transports expose ``request(method, url, headers=, json=, data=, auth=)``
+    and ``close()`` and are safe to share between threads.
+    """
+    if config.http2:
+        try:
+            return httpx.Client(
+                http2=True,
+                timeout=None,
+                headers=None if config.keep_alive else {"Connection": "close"},
+                limits=_httpx_limits(config),
+            )
+        except ImportError as e:
+            raise ImportError(
+                "HTTP/2 support requires the 'h2' package: pip install 'httpx[http2]'"
+            ) from e
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def create_async_http_session(config: HttpPoolConfig) -> httpx.AsyncClient:
+    """Async counterpart of ``create_http_session``; always backed by ``httpx``."""
+    try:
+        return httpx.AsyncClient(
+            http2=config.http2,
+            timeout=None,
+            headers=None if config.keep_alive else {"Connection": "close"},
+            limits=_httpx_limits(config),
+        )
+    except ImportError as e:
+        raise ImportError(
+            "HTTP/2 support requires the 'h2' package: pip install 'httpx[http2]'"
+        ) from e
+
+
+def _httpx_limits(config: HttpPoolConfig) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.pool_connections * config.pool_maxsize,
+        max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0,
+        keepalive_expiry=config.keep_alive_expiry,
+    )
@@ -0,0 +1,404 @@
+"""
+Bulk invoicing: create and send invoices from a JSONL or CSV stream.
+
+``InvoicePipeline`` reads invoice specs one at a time, validates each with
+``CreateInvoiceParameters`` and creates then sends up to ``max_concurrency``
+invoices at once.
+
+Each finished invoice is appended to the outcomes file as one JSON line
+(``key``, ``status``, ``invoice_id``, ``error``). That file is also the
+checkpoint: a rerun skips invoices already sent (or invalid), only sends those
+created but not sent, and retries the ones that failed. Creation carries a
+``PayPal-Request-Id`` derived from the spec, so an invoice whose create
+succeeded just before an interruption is not created twice.
+
+JSONL lines are ``CreateInvoiceParameters`` objects, optionally with a
+``reference`` naming the spec. CSV rows have the columns in ``CSV_FIELDS``;
+consecutive rows with the same ``reference`` are one invoice with several
+items. The reference is the invoice's key in the outcomes file; a spec
+without one is keyed by a hash of its content, so editing the source does
+not shift keys onto other invoices. Sources with a key used by two invoices
+(including CSV rows of one reference that are not consecutive) are rejected
+before anything is sent.
+
+    python -m paypal_agent_toolkit.shared.invoices.bulk invoices.csv --outcomes outcomes.jsonl
+"""
+
+import argparse
+import contextlib
+import csv
+import hashlib
+import io
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from pydantic import ValidationError
+
+from ..concurrency import abounded_map, bounded_map
+from .parameters import CreateInvoiceParameters
+from .tool_handlers import _created_invoice_id, _default_send_params
+
+INVOICES_URI = "/v2/invoicing/invoices"
+BULK_WORKERS = 8
+
+SENT = "sent"
+CREATED = "created"
+INVALID = "invalid"
+FAILED = "failed"
+# Outcomes a rerun does not redo.
+FINAL_STATUSES = (SENT, INVALID)
+
+CSV_FIELDS = (
+    "reference",
+    "currency_code",
+    "invoice_date",
+    "business_name",
+    "recipient_email",
+    "recipient_given_name",
+    "recipient_surname",
+    "item_name",
+    "item_quantity",
+    "item_unit_amount",
+    "item_tax_name",
+    "item_tax_percent",
+)
+
+Spec = Tuple[str, Union[Dict[str, Any], Exception]]
+
+
+class BulkInvoiceReport:
+    """Counts of this run's outcomes by status, and its throughput."""
+
+    def __init__(self):
+        self.counts = {SENT: 0, CREATED: 0, INVALID: 0, FAILED: 0}
+        self.skipped = 0
+        self.started = time.monotonic()
+
+    @property
+    def processed(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def invoices_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.counts,
+            "skipped": self.skipped,
+            "processed": self.processed,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "invoices_per_second": round(self.invoices_per_second, 2),
+        }
+
+    def __str__(self) -> str:
+        return (f"{self.counts[SENT]} sent, {self.counts[CREATED]} created, {self.counts[INVALID]} invalid, "
+                f"{self.counts[FAILED]} failed, {self.skipped} skipped in {self.elapsed:.1f}s "
+                f"({self.invoices_per_second:.1f} invoices/s)")
+
+
+class InvoicePipeline:
+    """
+    source           - path of a .jsonl/.csv file, or an iterable of spec dicts
+    outcomes         - outcomes file, also read back to resume; None keeps no record
+    max_concurrency  - invoices created and sent at the same time
+    send             - send each invoice after creating it
+    send_params      - overrides of the ``send_invoice`` parameters (note, send_to_recipient, ...)
+    progress         - called with the report and each invoice's outcome
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Iterable[Dict[str, Any]]],
+        outcomes: Optional[str] = None,
+        max_concurrency: int = BULK_WORKERS,
+        send: bool = True,
+        send_params: Optional[Dict[str, Any]] = None,
+        progress: Optional[Callable[[BulkInvoiceReport, Dict[str, Any]], None]] = None,
+    ):
+        self.source = source
+        self.outcomes = outcomes
+        self.max_concurrency = max(1, max_concurrency)
+        self.send = send
+        self.send_params = send_params or {}
+        self.progress = progress
+        self._lock = threading.Lock()
+
+    def run(self, client) -> BulkInvoiceReport:
+        self._check_keys()
+        report = BulkInvoiceReport()
+        done = self._load_outcomes()
+
+        def process(pending: Spec) -> Dict[str, Any]:
+            key, spec = pending
+            return self._process(client, key, spec, done.get(key))
+
+        with self._open_outcomes() as output:
+            processed = bounded_map(process, self._pending(done, report), self.max_concurrency,
+                                    thread_name_prefix="paypal-invoices")
+            with contextlib.closing(processed):
+                for _, future in processed:
+                    self._record(output, report, future.result())
+        logging.info("Bulk invoicing finished: %s", report)
+        return report
+
+    async def run_async(self, client) -> BulkInvoiceReport:
+        self._check_keys()
+        report = BulkInvoiceReport()
+        done = self._load_outcomes()
+
+        async def process(pending: Spec) -> Dict[str, Any]:
+            key, spec = pending
+            return await self._aprocess(client, key, spec, done.get(key))
+
+        with self._open_outcomes() as output:
+            async with contextlib.aclosing(abounded_map(process, self._pending(done, report), self.max_concurrency)) as processed:
+                async for _, task in processed:
+                    self._record(output, report, task.result())
+        logging.info("Bulk invoicing finished: %s", report)
+        return report
+
+    # -- one invoice -----------------------------------------------------
+
+    def _process(self, client, key: str, spec, previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(spec, Exception):
+            return _outcome(key, INVALID, error=spec)
+        invoice_id = previous.get("invoice_id") if previous else None
+        try:
+            if not invoice_id:
+                response = client.post(uri=INVOICES_URI, payload=spec, idempotency_key=_request_id(key, spec))
+                invoice_id = _created_invoice_id(response or {})
+                if not invoice_id:
+                    return _outcome(key, FAILED, error=f"Unexpected create response: {json.dumps(response)[:200]}")
+            if not self.send:
+                return _outcome(key, CREATED, invoice_id)
+            client.post(uri=f"{INVOICES_URI}/{invoice_id}/send", payload=self._send_payload(invoice_id))
+        except Exception as error:
+            return _outcome(key, CREATED if invoice_id else FAILED, invoice_id, error)
+        return _outcome(key, SENT, invoice_id)
+
+    async def _aprocess(self, client, key: str, spec, previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(spec, Exception):
+            return _outcome(key, INVALID, error=spec)
+        invoice_id = previous.get("invoice_id") if previous else None
+        try:
+            if not invoice_id:
+                response = await client.post(uri=INVOICES_URI, payload=spec, idempotency_key=_request_id(key, spec))
+                invoice_id = _created_invoice_id(response or {})
+                if not invoice_id:
+                    return _outcome(key, FAILED, error=f"Unexpected create response: {json.dumps(response)[:200]}")
+            if not self.send:
+                return _outcome(key, CREATED, invoice_id)
+            await client.post(uri=f"{INVOICES_URI}/{invoice_id}/send", payload=self._send_payload(invoice_id))
+        except Exception as error:
+            return _outcome(key, CREATED if invoice_id else FAILED, invoice_id, error)
+        return _outcome(key, SENT, invoice_id)
+
+    def _send_payload(self, invoice_id: str) -> Dict[str, Any]:
+        payload = _default_send_params(invoice_id)
+        payload.update(self.send_params)
+        return payload
+
+    # -- input and outcomes ----------------------------------------------
+
+    def _pending(self, done: Dict[str, Dict[str, Any]], report: BulkInvoiceReport) -> Iterator[Spec]:
+        """Validated specs still to do; a spec that fails validation is passed on as its error."""
+        for key, spec in _unique_keys(read_invoice_specs(self.source)):
+            previous = done.get(key)
+            if previous is not None and (previous["status"] in FINAL_STATUSES or (previous["status"] == CREATED and not self.send)):
+                report.skipped += 1
+                continue
+            if isinstance(spec, Exception):
+                yield key, spec
+                continue
+            try:
+                yield key, CreateInvoiceParameters(**spec).model_dump(exclude_none=True)
+            except ValidationError as error:
+                yield key, error
+
+    def _check_keys(self) -> None:
+        """Reject a source reusing a key before any invoice is sent; one-shot iterators are checked as they are read."""
+        if isinstance(self.source, (str, Sequence)):
+            for _ in _unique_keys(read_invoice_specs(self.source)):
+                pass
+
+    def _record(self, output, report: BulkInvoiceReport, outcome: Dict[str, Any]) -> None:
+        with self._lock:
+            report.counts[outcome["status"]] += 1
+            if output is not None:
+                output.write(json.dumps(outcome) + "\n")
+                output.flush()
+        if self.progress is not None:
+            self.progress(report, outcome)
+
+    def _load_outcomes(self) -> Dict[str, Dict[str, Any]]:
+        """Latest outcome of every key in the outcomes file."""
+        done: Dict[str, Dict[str, Any]] = {}
+        if not self.outcomes or not os.path.exists(self.outcomes):
+            return done
+        with open(self.outcomes) as f:
+            for line in f:
+                try:
+                    outcome = json.loads(line)
+                except ValueError:
+                    continue  # a line cut short by an interruption
+                done[outcome["key"]] = outcome
+        return done
+
+    def _open_outcomes(self):
+        if not self.outcomes:
+            return _NoOutput()
+        return open(self.outcomes, "a")
+
+
+class _NoOutput:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def create_invoices(client, source, **options) -> BulkInvoiceReport:
+    """Create and send every invoice in ``source``; see ``InvoicePipeline`` for ``options``."""
+    return InvoicePipeline(source, **options).run(client)
+
+
+async def acreate_invoices(client, source, **options) -> BulkInvoiceReport:
+    return await InvoicePipeline(source, **options).run_async(client)
+
+
+def read_invoice_specs(source: Union[str, Iterable[Dict[str, Any]]]) -> Iterator[Spec]:
+    """``(key, spec)`` pairs from a .jsonl/.csv path or an iterable of dicts; the key is the ``reference`` or a content hash."""
+    if not isinstance(source, str):
+        for spec in source:
+            spec = dict(spec)
+            yield str(spec.pop("reference", None) or _content_key(spec)), spec
+        return
+
+    with open(source, newline="") as f:
+        if source.lower().endswith(".csv"):
+            yield from _csv_specs(f)
+            return
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                spec = json.loads(line)
+            except ValueError as error:
+                yield _content_key(line.strip()), error
+                continue
+            if not isinstance(spec, dict):
+                yield _content_key(spec), ValueError(f"Expected a JSON object on line {number}")
+                continue
+            yield str(spec.pop("reference", None) or _content_key(spec)), spec
+
+
+def _csv_specs(f: io.TextIOBase) -> Iterator[Spec]:
+    rows = enumerate(csv.DictReader(f), 2)
+    # Rows without a reference are one invoice each, keyed by their content.
+    for _, group in itertools.groupby(rows, key=lambda row: row[1].get("reference") or row[0]):
+        group = [row for _, row in group]
+        first = group[0]
+        key = first.get("reference") or _content_key(first)
+        spec: Dict[str, Any] = {"detail": {"currency_code": first.get("currency_code")}}
+        if first.get("invoice_date"):
+            spec["detail"]["invoice_date"] = first["invoice_date"]
+        if first.get("business_name"):
+            spec["invoicer"] = {"business_name": first["business_name"]}
+        if first.get("recipient_email") or first.get("recipient_given_name") or first.get("recipient_surname"):
+            billing_info: Dict[str, Any] = {"email_address": first.get("recipient_email") or None}
+            if first.get("recipient_given_name") or first.get("recipient_surname"):
+                billing_info["name"] = {"given_name": first.get("recipient_given_name") or None,
+                                        "surname": first.get("recipient_surname") or None}
+            spec["primary_recipients"] = [{"billing_info": billing_info}]
+        items = [_csv_item(row, spec["detail"]["currency_code"]) for row in group if row.get("item_name")]
+        if items:
+            spec["items"] = items
+        yield key, spec
+
+
+def _csv_item(row: Dict[str, str], currency_code: Optional[str]) -> Dict[str, Any]:
+    item: Dict[str, Any] = {
+        "name": row["item_name"],
+        "quantity": row.get("item_quantity") or "1",
+        "unit_amount": {"currency_code": currency_code, "value": row.get("item_unit_amount")},
+    }
+    if row.get("item_tax_percent"):
+        item["tax"] = {"name": row.get("item_tax_name") or None, "percent": row["item_tax_percent"]}
+    return item
+
+
+def _unique_keys(specs: Iterable[Spec]) -> Iterator[Spec]:
+    seen = set()
+    for key, spec in specs:
+        if key in seen:
+            raise ValueError(
+                f"Invoice key {key!r} is used more than once; give every invoice its own reference "
+                f"and keep the CSV rows of one reference together"
+            )
+        seen.add(key)
+        yield key, spec
+
+
+def _content_key(content: Any) -> str:
+    digest = hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"sha256:{digest[:24]}"
+
+
+def _request_id(key: str, spec: Dict[str, Any]) -> str:
+    # Stable per spec, so a retried or resumed create is recognized by PayPal.
+    digest = hashlib.sha256(json.dumps([key, spec], sort_keys=True).encode("utf-8")).hexdigest()
+    return str(uuid.UUID(digest[:32]))
+
+
+def _outcome(key: str, status: str, invoice_id: Optional[str] = None, error=None) -> Dict[str, Any]:
+    outcome: Dict[str, Any] = {"key": key, "status": status}
+    if invoice_id:
+        outcome["invoice_id"] = invoice_id
+    if error is not None:
+        outcome["error"] = str(error)
+    return outcome
+
+
+def main(argv=None) -> None:
+    from ..configuration import Context
+    from ..paypal_client import PayPalClient
+
+    parser = argparse.ArgumentParser(description="Create and send PayPal invoices from a JSONL or CSV file.")
+    parser.add_argument("source", help="invoice specs; .csv for CSV, anything else JSONL")
+    parser.add_argument("--outcomes", help="outcomes file to append to and resume from (default: SOURCE.outcomes.jsonl)")
+    parser.add_argument("--concurrency", type=int, default=BULK_WORKERS, help="invoices processed at the same time")
+    parser.add_argument("--no-send", action="store_true", help="create the invoices as drafts without sending them")
+    parser.add_argument("--live", action="store_true", help="use the live environment instead of the sandbox")
+    args = parser.parse_args(argv)
+
+    with PayPalClient(
+        client_id=os.getenv("PAYPAL_CLIENT_ID"),
+        secret=os.getenv("PAYPAL_CLIENT_SECRET"),
+        context=Context(sandbox=not args.live),
+    ) as client:
+        report = create_invoices(
+            client, args.source,
+            outcomes=args.outcomes or args.source + ".outcomes.jsonl",
+            max_concurrency=args.concurrency,
+            send=not args.no_send,
+            progress=lambda report, outcome: print(f"\r{report}", end="", file=sys.stderr, flush=True),
+        )
+    print(file=sys.stderr)
+    print(json.dumps(report.to_dict()))
+
+
+if __name__ == "__main__":
+    main()
@@ -91,3 +91,11 @@ class GenerateInvoiceQrCodeParameters(BaseModel):
     invoice_id: str = Field(..., description="The invoice id to generate QR code for")
     width: int = Field(300, description="The QR code width")
     height: int = Field(300, description="The QR code height")
+
+
+class SendOverdueInvoiceRemindersParameters(BaseModel):
+    dry_run: bool = Field(True, description="List the invoices that would be reminded without sending anything. Set to false to send the reminders.")
+    cooldown_days: float = Field(7, ge=0, description="Skip invoices already reminded within this many days.")
+    max_reminders: Optional[int] = Field(None, ge=1, description="Send at most this many reminders.")
+    subject: Optional[str] = Field(None, description="The subject of the reminder emails.")
+    note: Optional[str] = Field(None, description="A note to the recipients.")
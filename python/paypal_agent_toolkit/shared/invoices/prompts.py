@@ -38,4 +38,10 @@ GENERATE_INVOICE_QRCODE_PROMPT = """
 Generate a QR code for an invoice.
 
 This function generates a QR code for an invoice, which can be used to pay the invoice using a mobile device or scanning app.
-"""
\ No newline at end of file
+"""
+
+SEND_OVERDUE_INVOICE_REMINDERS_PROMPT = """
+Send reminders for every unpaid invoice past its due date.
+
+This function searches for the unpaid invoices whose due date has passed, skips those already reminded within the cooldown, and sends a reminder for each of the rest. It runs as a dry run unless dry_run is false, and returns how many invoices were scanned, overdue, skipped and reminded.
+"""
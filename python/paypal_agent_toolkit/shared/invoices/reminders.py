@@ -0,0 +1,325 @@
+"""
+Reminder campaigns for unpaid, overdue invoices.
+
+``ReminderCampaign`` searches for the unpaid invoices past their due date,
+drops those reminded within the cooldown according to a ``ReminderLog``,
+and sends the remaining ``/remind`` calls no faster than ``rate`` per
+second. Each invoice is claimed in the log before its reminder is sent and
+released again when the send fails, so campaigns sharing a log never
+remind the same invoice twice. A dry run goes through the same selection
+without sending anything. The returned ``CampaignReport`` counts every
+step and lists the failures.
+"""
+
+import contextlib
+import functools
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..concurrency import abounded_map, bounded_map, merchant_scope
+from ..pagination import next_page_uri
+from ..rate_limiter import RateLimit, TokenBucket
+from .parameters import SendInvoiceReminderParameters
+
+# Statuses of invoices sent and not fully paid.
+UNPAID_STATUSES = ("SENT", "UNPAID", "PARTIALLY_PAID")
+DEFAULT_COOLDOWN = timedelta(days=7)
+REMINDER_WORKERS = 4
+SEARCH_URI = "/v2/invoicing/search-invoices"
+SEARCH_PAGE_SIZE = 100
+
+REMINDED = "reminded"
+WOULD_REMIND = "would_remind"
+FAILED = "failed"
+COOLING_DOWN = "cooling_down"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+    scope TEXT NOT NULL,
+    invoice_id TEXT NOT NULL,
+    reminded_at REAL NOT NULL,
+    PRIMARY KEY (scope, invoice_id)
+);
+"""
+
+
+class ReminderLog:
+    """When each invoice was last reminded, in SQLite; ":memory:" keeps it in this process only."""
+
+    _shared: Optional["ReminderLog"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "ReminderLog":
+        """The process-wide in-memory log, created on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def last_reminded(self, scope: str, invoice_id: str) -> Optional[float]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT reminded_at FROM reminders WHERE scope = ? AND invoice_id = ?", (scope, invoice_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(self, scope: str, invoice_id: str, reminded_at: Optional[float] = None) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO reminders (scope, invoice_id, reminded_at) VALUES (?, ?, ?)",
+                (scope, invoice_id, time.time() if reminded_at is None else reminded_at),
+            )
+
+    def claim(self, scope: str, invoice_id: str, cutoff: float) -> Optional[Tuple[float, Optional[float]]]:
+        """
+        Record the invoice as reminded now unless it was reminded after
+        ``cutoff``. Returns the claim to pass to ``release``, or None when the
+        invoice is still in its cooldown.
+        """
+        claimed_at = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT reminded_at FROM reminders WHERE scope = ? AND invoice_id = ?", (scope, invoice_id)
+            ).fetchone()
+            updated = self._db.execute(
+                "INSERT INTO reminders (scope, invoice_id, reminded_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (scope, invoice_id) DO UPDATE SET reminded_at = excluded.reminded_at "
+                "WHERE reminders.reminded_at <= ?",
+                (scope, invoice_id, claimed_at, cutoff),
+            ).rowcount
+        if not updated:
+            return None
+        return claimed_at, row[0] if row else None
+
+    def release(self, scope: str, invoice_id: str, claim: Tuple[float, Optional[float]]) -> None:
+        """Undo ``claim`` after its reminder failed, unless the invoice has been claimed again since."""
+        claimed_at, previous = claim
+        with self._lock, self._db:
+            if previous is None:
+                self._db.execute(
+                    "DELETE FROM reminders WHERE scope = ? AND invoice_id = ? AND reminded_at = ?",
+                    (scope, invoice_id, claimed_at),
+                )
+            else:
+                self._db.execute(
+                    "UPDATE reminders SET reminded_at = ? WHERE scope = ? AND invoice_id = ? AND reminded_at = ?",
+                    (previous, scope, invoice_id, claimed_at),
+                )
+
+
+class CampaignReport:
+    """What a campaign did: invoices scanned, selected, skipped for the cooldown, and reminded or failed."""
+
+    def __init__(self, dry_run: bool):
+        self.dry_run = dry_run
+        self.scanned = 0
+        self.eligible = 0
+        self.cooling_down = 0
+        self.counts = {REMINDED: 0, WOULD_REMIND: 0, FAILED: 0}
+        self.failures: List[Dict[str, Any]] = []
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    def to_result(self) -> Dict[str, Any]:
+        return {
+            "dry_run": self.dry_run,
+            "invoices_scanned": self.scanned,
+            "overdue_unpaid": self.eligible,
+            "skipped_cooldown": self.cooling_down,
+            **self.counts,
+            "failures": self.failures,
+            "elapsed_seconds": round(self.elapsed, 3),
+        }
+
+    def __str__(self) -> str:
+        sent = f"{self.counts[WOULD_REMIND]} would be reminded" if self.dry_run else f"{self.counts[REMINDED]} reminded"
+        return (f"{self.scanned} invoices scanned, {self.eligible} overdue, {self.cooling_down} in cooldown, "
+                f"{sent}, {self.counts[FAILED]} failed in {self.elapsed:.1f}s")
+
+
+class ReminderCampaign:
+    """
+    log              - ReminderLog of past reminders; the process-wide in-memory log when None
+    cooldown         - invoices reminded more recently than this are skipped
+    rate             - reminders sent per second at most
+    max_concurrency  - reminders in flight at the same time
+    overdue_only     - only invoices whose due date has passed; otherwise every unpaid invoice
+    subject, note    - the reminder email's subject and note
+    limit            - stop after this many reminders
+    dry_run          - select invoices but send nothing and record nothing
+    progress         - called with each invoice's outcome
+    """
+
+    def __init__(
+        self,
+        log: Optional[ReminderLog] = None,
+        cooldown: timedelta = DEFAULT_COOLDOWN,
+        rate: float = 2.0,
+        max_concurrency: int = REMINDER_WORKERS,
+        overdue_only: bool = True,
+        subject: Optional[str] = None,
+        note: Optional[str] = None,
+        limit: Optional[int] = None,
+        dry_run: bool = False,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.log = ReminderLog.shared() if log is None else log
+        self.cooldown = cooldown
+        self.rate = rate
+        self.max_concurrency = max(1, max_concurrency)
+        self.overdue_only = overdue_only
+        self.subject = subject
+        self.note = note
+        self.limit = limit
+        self.dry_run = dry_run
+        self.progress = progress
+
+    def run(self, client) -> CampaignReport:
+        report = CampaignReport(self.dry_run)
+        select = self._selector(client, report)
+        bucket = TokenBucket(RateLimit(self.rate))
+        selected = (invoice["id"] for invoice in _search(client, self._query()) if select(invoice))
+        remind = functools.partial(self._remind, client, bucket)
+        with contextlib.closing(bounded_map(remind, selected, self.max_concurrency, thread_name_prefix="paypal-reminders")) as reminded:
+            for _, future in reminded:
+                self._record(report, future.result())
+        return self._finish(report)
+
+    async def run_async(self, client) -> CampaignReport:
+        report = CampaignReport(self.dry_run)
+        select = self._selector(client, report)
+        bucket = TokenBucket(RateLimit(self.rate))
+        selected = (invoice["id"] async for invoice in _asearch(client, self._query()) if select(invoice))
+        remind = functools.partial(self._aremind, client, bucket)
+        async with contextlib.aclosing(abounded_map(remind, selected, self.max_concurrency)) as reminded:
+            async for _, task in reminded:
+                self._record(report, task.result())
+        return self._finish(report)
+
+    def _query(self) -> Dict[str, Any]:
+        """Search for the unpaid invoices and, with ``overdue_only``, those due before today."""
+        query: Dict[str, Any] = {"status": list(UNPAID_STATUSES)}
+        if self.overdue_only:
+            yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+            query["due_date_range"] = {"start": "1970-01-01", "end": yesterday.isoformat()}
+        return query
+
+    def _selector(self, client, report: CampaignReport) -> Callable[[Dict[str, Any]], bool]:
+        """Whether to remind an invoice, counting it into ``report``; false for all once ``limit`` are selected."""
+        scope = merchant_scope(client)
+        today = datetime.now(timezone.utc).date().isoformat()
+        cutoff = time.time() - self.cooldown.total_seconds()
+        selected = 0
+
+        def select(invoice: Dict[str, Any]) -> bool:
+            nonlocal selected
+            report.scanned += 1
+            if not self._eligible(invoice, today):
+                return False
+            report.eligible += 1
+            last = self.log.last_reminded(scope, invoice["id"])
+            if last is not None and last > cutoff:
+                report.cooling_down += 1
+                return False
+            if self.limit is not None and selected >= self.limit:
+                return False
+            selected += 1
+            return True
+
+        return select
+
+    def _eligible(self, invoice: Dict[str, Any], today: str) -> bool:
+        if not invoice.get("id") or invoice.get("status") not in UNPAID_STATUSES:
+            return False
+        if not self.overdue_only:
+            return True
+        due_date = ((invoice.get("detail") or {}).get("payment_term") or {}).get("due_date")
+        return bool(due_date) and due_date[:10] < today
+
+    def _remind(self, client, bucket: TokenBucket, invoice_id: str) -> Dict[str, Any]:
+        if self.dry_run:
+            return {"invoice_id": invoice_id, "status": WOULD_REMIND}
+        scope = merchant_scope(client)
+        claim = self.log.claim(scope, invoice_id, time.time() - self.cooldown.total_seconds())
+        if claim is None:
+            return {"invoice_id": invoice_id, "status": COOLING_DOWN}
+        try:
+            bucket.acquire()
+            client.post(uri=f"/v2/invoicing/invoices/{invoice_id}/remind", payload=self._payload(invoice_id))
+        except BaseException as error:
+            self.log.release(scope, invoice_id, claim)
+            if not isinstance(error, Exception):
+                raise
+            return {"invoice_id": invoice_id, "status": FAILED, "error": str(error)}
+        return {"invoice_id": invoice_id, "status": REMINDED}
+
+    async def _aremind(self, client, bucket: TokenBucket, invoice_id: str) -> Dict[str, Any]:
+        if self.dry_run:
+            return {"invoice_id": invoice_id, "status": WOULD_REMIND}
+        scope = merchant_scope(client)
+        claim = self.log.claim(scope, invoice_id, time.time() - self.cooldown.total_seconds())
+        if claim is None:
+            return {"invoice_id": invoice_id, "status": COOLING_DOWN}
+        try:
+            await bucket.aacquire()
+            await client.post(uri=f"/v2/invoicing/invoices/{invoice_id}/remind", payload=self._payload(invoice_id))
+        except BaseException as error:
+            self.log.release(scope, invoice_id, claim)
+            if not isinstance(error, Exception):
+                raise
+            return {"invoice_id": invoice_id, "status": FAILED, "error": str(error)}
+        return {"invoice_id": invoice_id, "status": REMINDED}
+
+    def _payload(self, invoice_id: str) -> Dict[str, Any]:
+        return SendInvoiceReminderParameters(
+            invoice_id=invoice_id, subject=self.subject, note=self.note
+        ).model_dump(exclude_none=True)
+
+    def _record(self, report: CampaignReport, outcome: Dict[str, Any]) -> None:
+        if outcome["status"] == COOLING_DOWN:
+            # Claimed by another campaign since it was selected.
+            report.cooling_down += 1
+        else:
+            report.counts[outcome["status"]] += 1
+        if outcome["status"] == FAILED:
+            report.failures.append(outcome)
+        if self.progress is not None:
+            self.progress(outcome)
+
+    def _finish(self, report: CampaignReport) -> CampaignReport:
+        report.elapsed = time.monotonic() - report.started
+        logging.info("Invoice reminder campaign finished: %s", report)
+        return report
+
+
+def _search(client, query: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield every invoice matching the ``search-invoices`` ``query``, page by page."""
+    uri = f"{SEARCH_URI}?page=1&page_size={SEARCH_PAGE_SIZE}&total_required=true"
+    while uri:
+        page = client.post(uri=uri, payload=query)
+        yield from page.get("items") or []
+        uri = next_page_uri(page, uri, client.base_url)
+
+
+async def _asearch(client, query: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    uri = f"{SEARCH_URI}?page=1&page_size={SEARCH_PAGE_SIZE}&total_required=true"
+    while uri:
+        page = await client.post(uri=uri, payload=query)
+        for invoice in page.get("items") or []:
+            yield invoice
+        uri = next_page_uri(page, uri, client.base_url)
@@ -1,105 +1,157 @@
 
 from .parameters import *
+from .reminders import ReminderCampaign, ReminderLog
+from ..request_util import ApiRequest, raw_response, send_request, send_request_async
 import json
 import httpx
-from typing import Union, Dict, Any
+from datetime import timedelta
+from functools import partial
+from typing import Union, Dict, Any, Optional
 
 
 
 def create_invoice(client, params: dict):
-    
-    validated = CreateInvoiceParameters(**params)
-    invoice_payload = validated.model_dump()
+    response = send_request(client, _build_create_invoice(params))
+    invoice_id = _created_invoice_id(response)
+    if invoice_id:
+        try:
+            return _create_invoice_result(response, send_invoice(client, _default_send_params(invoice_id)))
+        except Exception:
+            return json.dumps(response)
 
-    url = "/v2/invoicing/invoices"
-    response = client.post(uri=url, payload=invoice_payload)
+    return json.dumps(response)
 
-    if (
-        response.get("rel") == "self"
-        and "/v2/invoicing/invoices/" in response.get("href", "")
-        and response.get("method") == "GET"
-    ):
-        invoice_id = response["href"].split("/")[-1]
+
+def send_invoice(client, params: dict):
+    return send_request(client, _build_send_invoice(params))
+
+
+def list_invoices(client, params: dict):
+    return send_request(client, _build_list_invoices(params))
+
+
+def get_invoice(client, params: dict):
+    return send_request(client, _build_get_invoice(params))
+
+
+def send_invoice_reminder(client, params: dict):
+    return send_request(client, _build_send_invoice_reminder(params))
+
+
+def cancel_sent_invoice(client, params: dict):
+    return send_request(client, _build_cancel_sent_invoice(params))
+
+
+def generate_invoice_qrcode(client, params: dict):
+    return send_request(client, _build_generate_invoice_qrcode(params))
+
+
+def send_overdue_invoice_reminders(client, params: dict, reminder_log: Optional[ReminderLog] = None):
+
+    validated = SendOverdueInvoiceRemindersParameters(**params)
+    report = _reminder_campaign(reminder_log, validated).run(client)
+    return json.dumps(report.to_result())
+
+
+async def create_invoice_async(client, params: dict):
+    response = await send_request_async(client, _build_create_invoice(params))
+    invoice_id = _created_invoice_id(response)
+    if invoice_id:
         try:
-            send_result = send_invoice(client, {
-                "invoice_id": invoice_id,
-                "note": "Thank you for choosing us. If there are any issues, feel free to contact us.",
-                "send_to_recipient": True
-            })
-            return json.dumps({
-                "createResult": response,
-                "sendResult": send_result
-            })
+            return _create_invoice_result(response, await send_invoice_async(client, _default_send_params(invoice_id)))
         except Exception:
             return json.dumps(response)
 
     return json.dumps(response)
 
 
-def send_invoice(client, params: dict):
+async def send_invoice_async(client, params: dict):
+    return await send_request_async(client, _build_send_invoice(params))
+
+
+async def list_invoices_async(client, params: dict):
+    return await send_request_async(client, _build_list_invoices(params))
+
+
+async def get_invoice_async(client, params: dict):
+    return await send_request_async(client, _build_get_invoice(params))
+
+
+async def send_invoice_reminder_async(client, params: dict):
+    return await send_request_async(client, _build_send_invoice_reminder(params))
+
+
+async def cancel_sent_invoice_async(client, params: dict):
+    return await send_request_async(client, _build_cancel_sent_invoice(params))
+
+
+async def generate_invoice_qrcode_async(client, params: dict):
+    return await send_request_async(client, _build_generate_invoice_qrcode(params))
+
+
+async def send_overdue_invoice_reminders_async(client, params: dict, reminder_log: Optional[ReminderLog] = None):
+
+    validated = SendOverdueInvoiceRemindersParameters(**params)
+    report = await _reminder_campaign(reminder_log, validated).run_async(client)
+    return json.dumps(report.to_result())
+
+
+def _build_create_invoice(params: dict) -> ApiRequest:
+
+    validated = CreateInvoiceParameters(**params)
+    invoice_payload = validated.model_dump()
+
+    url = "/v2/invoicing/invoices"
+    return ApiRequest("POST", url, invoice_payload, raw_response)
+
+
+def _build_send_invoice(params: dict) -> ApiRequest:
 
     validated = SendInvoiceParameters(**params)
     payload = validated.model_dump()
 
     invoice_id = payload["invoice_id"]
     url = f"/v2/invoicing/invoices/{invoice_id}/send"
-
-    response =  client.post(uri=url, payload=payload)
-    return json.dumps(response)
+    return ApiRequest("POST", url, payload)
 
 
-def list_invoices(client, params: dict):
+def _build_list_invoices(params: dict) -> ApiRequest:
 
     validated = ListInvoicesParameters(**params)
     invoice_uri = f"/v2/invoicing/invoices?page_size={validated.page_size or 10}&page={validated.page or 1}&total_required={validated.total_required or 'true'}"
-    response = client.get(uri=invoice_uri)
-
-    return json.dumps(response)
+    return ApiRequest("GET", invoice_uri)
 
 
-def get_invoice(client, params: dict):
+def _build_get_invoice(params: dict) -> ApiRequest:
     validated = GetInvoiceParameters(**params)
     invoice_id = validated.invoice_id
 
     url = f"/v2/invoicing/invoices/{invoice_id}"
-    response = client.get(uri=url)
+    return ApiRequest("GET", url)
 
-    return json.dumps(response)
 
-
-def send_invoice_reminder(client, params: dict):
+def _build_send_invoice_reminder(params: dict) -> ApiRequest:
 
     validated = SendInvoiceReminderParameters(**params)
     payload = validated.model_dump()
 
     invoice_id = payload["invoice_id"]
     url = f"/v2/invoicing/invoices/{invoice_id}/remind"
-    print("url: ", url)
-    response = client.post(uri=url, payload=payload)
-    print("response: ", response)
+    return ApiRequest("POST", url, payload, partial(_no_content_result, invoice_id))
 
-    if response is None:
-        return {"success": True, "invoice_id": invoice_id}
-    return json.dumps(response)
 
+def _build_cancel_sent_invoice(params: dict) -> ApiRequest:
 
-def cancel_sent_invoice(client, params: dict):
-    
     validated = CancelSentInvoiceParameters(**params)
     payload = validated.model_dump()
     invoice_id = payload["invoice_id"]
     url = f"/v2/invoicing/invoices/{invoice_id}/cancel"
 
-    response = client.post(uri=url, payload=payload)
-    
     # PayPal responds with 204 No Content on successful cancellation
-    if response is None:
-        return {"success": True, "invoice_id": invoice_id}
+    return ApiRequest("POST", url, payload, partial(_no_content_result, invoice_id))
 
-    return json.dumps(response)
 
-
-def generate_invoice_qrcode(client, params: dict):
+def _build_generate_invoice_qrcode(params: dict) -> ApiRequest:
 
     validated = GenerateInvoiceQrCodeParameters(**params)
     payload = {
@@ -109,10 +161,47 @@ def generate_invoice_qrcode(client, params: dict):
 
     invoice_id = validated.invoice_id
     url = f"/v2/invoicing/invoices/{invoice_id}/generate-qr-code"
+    return ApiRequest("POST", url, payload, partial(_no_content_result, invoice_id))
+
 
-    response = client.post(uri=url, payload=payload)
+def _create_invoice_result(response, send_result):
+    return json.dumps({
+        "createResult": response,
+        "sendResult": send_result
+    })
 
+
+def _no_content_result(invoice_id, response):
     if response is None:
         return {"success": True, "invoice_id": invoice_id}
+    return json.dumps(response)
+
+
+def _created_invoice_id(response):
+    """Invoice id from the self link PayPal returns on create, or None."""
+    if (
+        response.get("rel") == "self"
+        and "/v2/invoicing/invoices/" in response.get("href", "")
+        and response.get("method") == "GET"
+    ):
+        return response["href"].split("/")[-1]
+    return None
+
+
+def _default_send_params(invoice_id):
+    return {
+        "invoice_id": invoice_id,
+        "note": "Thank you for choosing us. If there are any issues, feel free to contact us.",
+        "send_to_recipient": True
+    }
+
 
-    return json.dumps(response)
\ No newline at end of file
+def _reminder_campaign(reminder_log: Optional[ReminderLog], validated: SendOverdueInvoiceRemindersParameters) -> ReminderCampaign:
+    return ReminderCampaign(
+        log=reminder_log,
+        cooldown=timedelta(days=validated.cooldown_days),
+        subject=validated.subject,
+        note=validated.note,
+        limit=validated.max_reminders,
+        dry_run=validated.dry_run,
+    )
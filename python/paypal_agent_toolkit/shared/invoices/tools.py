@@ -0,0 +1,117 @@
+from .prompts import (
+    CREATE_INVOICE_PROMPT,
+    LIST_INVOICE_PROMPT,
+    GET_INVOICE_PROMPT,
+    SEND_INVOICE_PROMPT,
+    SEND_INVOICE_REMINDER_PROMPT,
+    CANCEL_SENT_INVOICE_PROMPT,
+    GENERATE_INVOICE_QRCODE_PROMPT,
+    SEND_OVERDUE_INVOICE_REMINDERS_PROMPT,
+)
+
+from .parameters import (
+    CreateInvoiceParameters,
+    ListInvoicesParameters,
+    GetInvoiceParameters,
+    SendInvoiceParameters,
+    SendInvoiceReminderParameters,
+    CancelSentInvoiceParameters,
+    GenerateInvoiceQrCodeParameters,
+    SendOverdueInvoiceRemindersParameters,
+)
+
+from .tool_handlers import (
+    create_invoice,
+    list_invoices,
+    get_invoice,
+    send_invoice,
+    send_invoice_reminder,
+    cancel_sent_invoice,
+    generate_invoice_qrcode,
+    send_overdue_invoice_reminders,
+    create_invoice_async,
+    list_invoices_async,
+    get_invoice_async,
+    send_invoice_async,
+    send_invoice_reminder_async,
+    cancel_sent_invoice_async,
+    generate_invoice_qrcode_async,
+    send_overdue_invoice_reminders_async,
+)
+
+
+tools = [
+    {
+        "method": "create_invoice",
+        "name": "Create PayPal Invoice",
+        "description": CREATE_INVOICE_PROMPT.strip(),
+        "args_schema": CreateInvoiceParameters,
+        "actions": {"invoices": {"create": True}},
+        "execute": create_invoice,
+        "execute_async": create_invoice_async,
+    },
+    {
+        "method": "list_invoices",
+        "name": "List Invoices",
+        "description": LIST_INVOICE_PROMPT.strip(),
+        "args_schema": ListInvoicesParameters,
+        "actions": {"invoices": {"list": True}},
+        "execute": list_invoices,
+        "execute_async": list_invoices_async,
+    },
+    {
+        "method": "get_invoice",
+        "name": "Get Invoice",
+        "description": GET_INVOICE_PROMPT.strip(),
+        "args_schema": GetInvoiceParameters,
+        "actions": {"invoices": {"get": True}},
+        "execute": get_invoice,
+        "execute_async": get_invoice_async,
+    },
+    {
+        "method": "send_invoice",
+        "name": "Send Invoice",
+        "description": SEND_INVOICE_PROMPT.strip(),
+        "args_schema": SendInvoiceParameters,
+        "actions": {"invoices": {"send": True}},
+        "execute": send_invoice,
+        "execute_async": send_invoice_async,
+    },
+    {
+        "method": "send_invoice_reminder",
+        "name": "Send Invoice Reminder",
+        "description": SEND_INVOICE_REMINDER_PROMPT.strip(),
+        "args_schema": SendInvoiceReminderParameters,
+        "actions": {"invoices": {"sendReminder": True}},
+        "execute": send_invoice_reminder,
+        "execute_async": send_invoice_reminder_async,
+    },
+    {
+        "method": "send_overdue_invoice_reminders",
+        "name": "Send Overdue Invoice Reminders",
+        "description": SEND_OVERDUE_INVOICE_REMINDERS_PROMPT.strip(),
+        "args_schema": SendOverdueInvoiceRemindersParameters,
+        "actions": {"invoices": {"sendOverdueReminders": True}},
+        "services": ("reminder_log",),
+        "execute": send_overdue_invoice_reminders,
+        "execute_async": send_overdue_invoice_reminders_async,
+    },
+    {
+        "method": "cancel_sent_invoice",
+        "name": "Cancel Sent Invoice",
+        "description": CANCEL_SENT_INVOICE_PROMPT.strip(),
+        "args_schema": CancelSentInvoiceParameters,
+        "actions": {"invoices": {"cancel": True}},
+        "execute": cancel_sent_invoice,
+        "execute_async": cancel_sent_invoice_async,
+    },
+    {
+        "method": "generate_invoice_qr_code",
+        "name": "Generate Invoice QR Code",
+        "description": GENERATE_INVOICE_QRCODE_PROMPT.strip(),
+        "args_schema": GenerateInvoiceQrCodeParameters,
+        "actions": {"invoices": {"generateQRC": True}},
+        "execute": generate_invoice_qrcode,
+        "execute_async": generate_invoice_qrcode_async,
+    },
+]
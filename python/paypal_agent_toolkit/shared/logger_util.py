@@ -23,11 +23,13 @@ def logRequestPayload(payload, url, headers):
 
 
 def logResponsePayload(response, json_response):
-    request_headers = dict(response.request.headers)
+    request_headers = response.request.headers
     masked_headers = {
-        **request_headers,
-        "Authorization": mask_bearer_token(request_headers["Authorization"])
+        **dict(request_headers),
+        # Header lookup is case-insensitive here; httpx lower-cases the dict keys
+        "Authorization": mask_bearer_token(request_headers.get("Authorization", ""))
     }
+    masked_headers.pop("authorization", None)
     logging.debug("PayPal Request Headers:\n%s", json.dumps(masked_headers, indent=2))
     logging.debug("PayPal Response Headers: %s", json.dumps(dict(response.headers), indent=2))
     logging.debug("PayPal Response Payload: %s", json.dumps(json_response, indent=2))
@@ -1,51 +1,67 @@
-
+from functools import partial
+from pydantic import ValidationError
 from .parameters import *
 from .payload_util import parse_order_details
+from ..request_util import ApiRequest, send_request, send_request_async
 import json
 
 def create_order(client, params: dict):
+    return send_request(client, _build_create_order(params))
+
+
+def capture_order(client, params: dict):
+    return send_request(client, _build_capture_order(params))
+
+
+def get_order_details(client, params: dict):
+    return send_request(client, _build_get_order_details(params))
+
+
+async def create_order_async(client, params: dict):
+    return await send_request_async(client, _build_create_order(params))
+
+
+async def capture_order_async(client, params: dict):
+    return await send_request_async(client, _build_capture_order(params))
+
+
+async def get_order_details_async(client, params: dict):
+    return await send_request_async(client, _build_get_order_details(params))
+
+
+def _build_create_order(params: dict) -> ApiRequest:
 
     try:
         validated = CreateOrderParameters(**params)
     except ValidationError as e:
-        raise ValueError(f"Bad order payload: {e}")  
+        raise ValueError(f"Bad order payload: {e}")
 
     order_payload = parse_order_details(validated.model_dump())
-    
-    order_uri = "/v2/checkout/orders"
-    response = client.post(uri=order_uri, payload=order_payload)
-    return json.dumps(response)
 
+    order_uri = "/v2/checkout/orders"
+    return ApiRequest("POST", order_uri, order_payload)
 
 
-def capture_order(client, params: dict):
+def _build_capture_order(params: dict) -> ApiRequest:
     validated = CaptureOrderParameters(**params)
     order_capture_uri = f"/v2/checkout/orders/{validated.order_id}/capture"
-    result = client.post(uri=order_capture_uri, payload=None)
-    status = result.get("status")
-    amount = result.get("purchase_units", [{}])[0].get("payments", {}).get("captures", [{}])[0].get("amount", {}).get("value")
-    currency = result.get("purchase_units", [{}])[0].get("payments", {}).get("captures", [{}])[0].get("amount", {}).get("currency_code")
+    return ApiRequest("POST", order_capture_uri, None, partial(_order_summary, validated.order_id))
 
-    return json.dumps({
-        "message": f"The PayPal order {validated.order_id} has been successfully captured.",
-        "status": status,
-        "amount": f"{currency} {amount}" if amount and currency else "N/A",
-        "raw": result 
-    })
 
-
-def get_order_details(client, params: dict):
+def _build_get_order_details(params: dict) -> ApiRequest:
     validated = OrderIdParameters(**params)
     order_get_uri = f"/v2/checkout/orders/{validated.order_id}"
-    
-    result = client.get(order_get_uri)
+    return ApiRequest("GET", order_get_uri, to_result=partial(_order_summary, validated.order_id))
+
+
+def _order_summary(order_id, result):
     status = result.get("status")
     amount = result.get("purchase_units", [{}])[0].get("payments", {}).get("captures", [{}])[0].get("amount", {}).get("value")
     currency = result.get("purchase_units", [{}])[0].get("payments", {}).get("captures", [{}])[0].get("amount", {}).get("currency_code")
 
     return json.dumps({
-        "message": f"The PayPal order {validated.order_id} has been successfully captured.",
+        "message": f"The PayPal order {order_id} has been successfully captured.",
         "status": status,
         "amount": f"{currency} {amount}" if amount and currency else "N/A",
-        "raw": result 
-    })
\ No newline at end of file
+        "raw": result
+    })
@@ -0,0 +1,50 @@
+from .prompts import (
+    CREATE_ORDER_PROMPT,
+    CAPTURE_ORDER_PROMPT,
+    GET_ORDER_PROMPT,
+)
+
+from .parameters import (
+    CreateOrderParameters,
+    OrderIdParameters,
+)
+
+from .tool_handlers import (
+    create_order,
+    capture_order,
+    get_order_details,
+    create_order_async,
+    capture_order_async,
+    get_order_details_async,
+)
+
+
+tools = [
+    {
+        "method": "create_order",
+        "name": "Create PayPal Order",
+        "description": CREATE_ORDER_PROMPT.strip(),
+        "args_schema": CreateOrderParameters,
+        "actions": {"orders": {"create": True}},
+        "execute": create_order,
+        "execute_async": create_order_async,
+    },
+    {
+        "method": "pay_order",
+        "name": "Process payment for PayPal Order",
+        "description": CAPTURE_ORDER_PROMPT.strip(),
+        "args_schema": OrderIdParameters,
+        "actions": {"orders": {"capture": True}},
+        "execute": capture_order,
+        "execute_async": capture_order_async,
+    },
+    {
+        "method": "get_order_details",
+        "name": "Get PayPal Order Details",
+        "description": GET_ORDER_PROMPT.strip(),
+        "args_schema": OrderIdParameters,
+        "actions": {"orders": {"get": True}},
+        "execute": get_order_details,
+        "execute_async": get_order_details_async,
+    },
+]
@@ -0,0 +1,201 @@
+"""
+Auto-paginating iterators over PayPal list endpoints.
+
+``iter_invoices(client, {"page_size": 50})`` yields invoices one at a time,
+following ``links[rel=next]`` (or ``page``/``total_pages``) until the last
+page; ``iter_transactions`` also shards its date range into 31-day windows.
+While the caller consumes one page the next one is fetched in the
+background, and at most two pages are held in memory. Each iterator has an
+``aiter_*`` counterpart for ``AsyncPayPalClient``.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Type
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from pydantic import BaseModel
+
+from .disputes.parameters import ListDisputesParameters
+from .invoices.parameters import ListInvoicesParameters
+from .subscriptions.parameters import ListProductsParameters, ListSubscriptionPlansParameters
+from .transactions.parameters import ListTransactionsParameters
+
+
+class ListEndpoint:
+    """A paginated list endpoint: where it lives, how it is filtered and where its records are."""
+
+    def __init__(
+        self,
+        path: str,
+        params_model: Type[BaseModel],
+        items_key: str,
+        max_page_size: int,
+        build_uri: Optional[Callable[[BaseModel], str]] = None,
+    ):
+        self.path = path
+        self.params_model = params_model
+        self.items_key = items_key
+        self.max_page_size = max_page_size
+        self.build_uri = build_uri
+
+    def first_uri(self, filters: Optional[dict]) -> str:
+        """URI of the first page; without an explicit ``page_size`` the largest allowed is used."""
+        filters = dict(filters or {})
+        filters.setdefault("page_size", self.max_page_size)
+        validated = _validated(self.params_model, filters)
+        if self.build_uri is not None:
+            return self.build_uri(validated)
+        return f"{self.path}?{_encode(validated.model_dump(mode='json', exclude_none=True))}"
+
+
+INVOICES = ListEndpoint("/v2/invoicing/invoices", ListInvoicesParameters, "items", 100)
+PRODUCTS = ListEndpoint("/v1/catalogs/products", ListProductsParameters, "products", 20)
+SUBSCRIPTION_PLANS = ListEndpoint("/v1/billing/plans", ListSubscriptionPlansParameters, "plans", 20)
+DISPUTES = ListEndpoint("/v1/customer/disputes", ListDisputesParameters, "items", 50)
+
+
+def paginate(client, uri: str, items_key: str, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+    """Yield the records under ``items_key`` from ``uri`` and every following page."""
+    for page in iter_pages(client, uri, prefetch):
+        yield from page.get(items_key) or []
+
+
+def iter_pages(client, uri: str, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+    """Yield each page response, fetching the next one in a worker thread while the current is consumed."""
+    if not prefetch:
+        while uri:
+            page = client.get(uri=uri)
+            yield page
+            uri = next_page_uri(page, uri, client.base_url)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="paypal-pagination")
+    try:
+        future = _submit(executor, client.get, uri)
+        while future is not None:
+            page = future.result()
+            uri = next_page_uri(page, uri, client.base_url)
+            future = _submit(executor, client.get, uri) if uri else None
+            yield page
+    finally:
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def apaginate(client, uri: str, items_key: str, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+    async for page in aiter_pages(client, uri, prefetch):
+        for item in page.get(items_key) or []:
+            yield item
+
+
+async def aiter_pages(client, uri: str, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+    """Async ``iter_pages``; the next page is fetched in a task while the current is consumed."""
+    if not prefetch:
+        while uri:
+            page = await client.get(uri=uri)
+            yield page
+            uri = next_page_uri(page, uri, client.base_url)
+        return
+
+    task = asyncio.ensure_future(client.get(uri=uri))
+    try:
+        while task is not None:
+            page = await task
+            uri = next_page_uri(page, uri, client.base_url)
+            task = asyncio.ensure_future(client.get(uri=uri)) if uri else None
+            yield page
+    finally:
+        if task is not None and not task.done():
+            task.cancel()
+
+
+def next_page_uri(page: Dict[str, Any], uri: str, base_url: str = "") -> Optional[str]:
+    """
+    URI of the page after ``page``, or None on the last page. Prefers the
+    ``next`` HATEOAS link and falls back to ``page``/``total_pages``.
+    """
+    for link in page.get("links") or []:
+        if link.get("rel") == "next" and link.get("href"):
+            href = link["href"]
+            if href.startswith(base_url):
+                href = href[len(base_url):]
+            else:
+                parts = urlsplit(href)
+                href = f"{parts.path}?{parts.query}" if parts.query else parts.path
+            return href if href != uri else None
+
+    total_pages = page.get("total_pages")
+    if total_pages is None:
+        return None
+    path, _, query = uri.partition("?")
+    query_params = dict(parse_qsl(query))
+    current = int(page.get("page") or query_params.get("page") or 1)
+    if current >= int(total_pages):
+        return None
+    query_params["page"] = str(current + 1)
+    return f"{path}?{urlencode(query_params)}"
+
+
+def _submit(executor: ThreadPoolExecutor, fn: Callable, uri: str):
+    # Run in a copy of the caller's context so per-call state (stats, tracing) follows the request.
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, uri=uri)
+
+
+def _validated(params_model: Type[BaseModel], filters: Dict[str, Any]) -> BaseModel:
+    # Unknown keys would otherwise be dropped silently, returning unfiltered records.
+    unknown = sorted(set(filters) - set(params_model.model_fields))
+    if unknown:
+        raise ValueError(
+            f"Unsupported filters for {params_model.__name__}: {', '.join(unknown)}. "
+            f"Supported: {', '.join(params_model.model_fields)}"
+        )
+    return params_model(**filters)
+
+
+def _encode(query: Dict[str, Any]) -> str:
+    return urlencode({key: str(value).lower() if isinstance(value, bool) else value for key, value in query.items()})
+
+
+def _iterators(name: str, endpoint: ListEndpoint):
+    """``iter_<name>`` and ``aiter_<name>`` for ``endpoint``; ``filters`` are the list tool's parameters."""
+    def iterate(client, filters: Optional[dict] = None, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        return paginate(client, endpoint.first_uri(filters), endpoint.items_key, prefetch)
+
+    def aiterate(client, filters: Optional[dict] = None, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        return apaginate(client, endpoint.first_uri(filters), endpoint.items_key, prefetch)
+
+    iterate.__name__ = iterate.__qualname__ = f"iter_{name}"
+    aiterate.__name__ = aiterate.__qualname__ = f"aiter_{name}"
+    iterate.__doc__ = f"Yield every {name.replace('_', ' ')[:-1]} matching ``filters`` ({endpoint.params_model.__name__}), across all pages."
+    aiterate.__doc__ = f"Async ``iter_{name}``."
+    return iterate, aiterate
+
+
+iter_invoices, aiter_invoices = _iterators("invoices", INVOICES)
+iter_products, aiter_products = _iterators("products", PRODUCTS)
+iter_subscription_plans, aiter_subscription_plans = _iterators("subscription_plans", SUBSCRIPTION_PLANS)
+iter_disputes, aiter_disputes = _iterators("disputes", DISPUTES)
+
+
+def iter_transactions(client, filters: Optional[dict] = None, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every transaction matching ``filters`` (ListTransactionsParameters),
+    oldest first. Ranges longer than 31 days are split into windows that are
+    fetched ahead in parallel unless ``prefetch`` is False.
+    """
+    from .transactions.planner import QUERY_WORKERS, stream_transactions
+
+    validated = _validated(ListTransactionsParameters, dict(filters or {}))
+    return stream_transactions(client, validated, QUERY_WORKERS if prefetch else 1)
+
+
+def aiter_transactions(client, filters: Optional[dict] = None, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+    """Async ``iter_transactions``."""
+    from .transactions.planner import QUERY_WORKERS, astream_transactions
+
+    validated = _validated(ListTransactionsParameters, dict(filters or {}))
+    return astream_transactions(client, validated, QUERY_WORKERS if prefetch else 1)
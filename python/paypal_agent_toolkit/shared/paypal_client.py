@@ -1,26 +1,58 @@
 import json
+import time
 from typing import Optional
-import requests
 
 from ..shared.telemetry import Telemetry
 
 from .logger_util import logRequestPayload, logResponsePayload
 from .constants import *
 from .configuration import Context
+from .token_cache import AccessTokenCache
+from .http_pool import HTTP_ERRORS, TRANSIENT_ERRORS, HttpPoolConfig, create_http_session
+from .retry import CallStats, RetryPolicy, _last_call_stats
+from .rate_limiter import RateLimiter
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from .single_flight import shared_single_flight
+from .endpoints import endpoint_family
 import logging
 
+# Lifetime assumed when a token response has no ``expires_in``.
+DEFAULT_TOKEN_LIFETIME = 300.0
 
-class PayPalClient:
-    def __init__(self, client_id, secret, context: Optional[Context]):
+
+class BasePayPalClient:
+    """State and request/response handling shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        client_id,
+        secret,
+        context: Optional[Context],
+        http_pool: Optional[HttpPoolConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        coalesce_gets: bool = True,
+    ):
         self.client_id = client_id
         self.secret = secret
         self.context = context
         self.sandbox = context.sandbox
         self.base_url = SANDBOX_BASE_URL if self.sandbox  else LIVE_BASE_URL
-    
+        if context.access_token:
+            self._token_cache = AccessTokenCache(static_token=context.access_token)
+        else:
+            self._token_cache = AccessTokenCache.for_credentials(self.base_url, client_id, secret)
+        self.http_pool = http_pool or HttpPoolConfig()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        # Rate limits are shared by every session acting for the same merchant.
+        self.merchant_key = context.merchant_id or client_id
+        self.circuit_breakers = circuit_breakers
+        self.coalesce_gets = coalesce_gets
 
 
-    def log_request_exception(self, e: requests.exceptions.RequestException, url: Optional[str] = None):
+    def log_request_exception(self, e: Exception, url: Optional[str] = None):
         response = getattr(e, 'response', None)
         if response is not None:
             try:
@@ -34,55 +66,90 @@ class PayPalClient:
             logging.error("HTTP request failed: %s", str(e))
 
 
-    def build_headers(self):
+    def _headers_for(self, access_token: str, idempotency_key: Optional[str] = None):
         headers = {
-                "Authorization": f"Bearer {self.get_access_token()}",
-                "Content-Type": "application/json",
-                "User-Agent" : Telemetry.generate_user_agent(source=self.context.source)
-            }
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+            "User-Agent" : Telemetry.generate_user_agent(source=self.context.source)
+        }
+        if idempotency_key:
+            headers["PayPal-Request-Id"] = idempotency_key
         return headers
 
-    def get_access_token(self):
-        token_url = f"{self.base_url}/v1/oauth2/token"
-        try:
-            response = requests.post(
-                token_url,
-                headers={"Accept": "application/json"},
-                data={"grant_type": "client_credentials"},
-                auth=(self.client_id, self.secret)
-            )
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            self.log_request_exception(e, token_url)
-            raise RuntimeError("Failed to obtain access token from PayPal") from e
-        
-        
+    def _token_request(self):
+        """Arguments of the OAuth client-credentials request, for either transport."""
+        return {
+            "method": "POST",
+            "url": f"{self.base_url}/v1/oauth2/token",
+            "headers": {"Accept": "application/json"},
+            "data": {"grant_type": "client_credentials"},
+            "auth": (self.client_id, self.secret),
+            "timeout": self.retry_policy.timeout,
+        }
+
+    def _parse_token_response(self, response):
         logging.debug("PayPal Response Headers: %s", json.dumps(dict(response.headers), indent=2))
 
         token_data = response.json()
         if "access_token" not in token_data:
             raise ValueError("Access token not found in PayPal response")
 
-        return token_data["access_token"]
+        return token_data["access_token"], token_data.get("expires_in", DEFAULT_TOKEN_LIFETIME)
 
+    def _should_refresh_token(self, response, url):
+        """A 401 means the token was revoked or expired early; drop it and retry once."""
+        if response.status_code == 401 and not self._token_cache.is_static:
+            logging.info("PayPal returned 401 for %s, refreshing access token", url)
+            return True
+        return False
 
-    def post(self, uri, payload):
-       
-        url = f"{self.base_url}{uri}"
-        headers = self.build_headers()
-        logRequestPayload(payload, url, headers)
+    def _start_call(self, method, url) -> CallStats:
+        stats = CallStats(method, url)
+        _last_call_stats.set(stats)
+        return stats
 
-        try:
-            response = requests.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            self.log_request_exception(e, url)
-            raise
+    def _retry_delay(self, stats: CallStats, idempotent: bool, response=None, error=None) -> Optional[float]:
+        """Seconds to wait before retrying ``stats``' call, or None to give up."""
+        if response is not None:
+            delay = self.retry_policy.next_delay(
+                stats, idempotent, response.status_code, response.headers.get("Retry-After")
+            )
+            reason = f"HTTP {response.status_code}"
+        else:
+            delay = self.retry_policy.next_delay(stats, idempotent)
+            reason = f"{type(error).__name__}: {error}"
+
+        if delay is not None:
+            logging.info(
+                "Retrying PayPal %s %s in %.2fs after %s (attempt %d of %d)",
+                stats.method, stats.url, delay, reason, stats.attempts + 1, self.retry_policy.max_attempts,
+            )
+            if self.retry_policy.on_retry:
+                self.retry_policy.on_retry(stats, delay, reason)
+        return delay
+
+    def _record_outcome(self, breaker: CircuitBreaker, probe: bool, response):
+        """5xx responses count against the endpoint family; anything else proves it healthy."""
+        if response.status_code >= 500:
+            breaker.record_failure(probe)
+        else:
+            breaker.record_success(probe)
+
+    def _flight_key(self, url):
+        # The token cache identifies the credentials: it is shared per client id
+        # and secret, and private to clients given their own access token.
+        return (id(self._token_cache), url)
 
+    @property
+    def last_call_stats(self) -> Optional[CallStats]:
+        """Attempts, last status and elapsed time of the latest call in this thread or task."""
+        return _last_call_stats.get()
+
+    def _parse_response(self, response):
         if response.status_code == 204:
             logging.debug("Response Status: 204 No Content")
             return {}
-        
+
         try:
             json_response = response.json()
         except ValueError:
@@ -94,33 +161,131 @@ class PayPalClient:
         return json_response
 
 
+class PayPalClient(BasePayPalClient):
+    def __init__(self, client_id, secret, context: Optional[Context], **options):
+        super().__init__(client_id, secret, context, **options)
+        self._session = create_http_session(self.http_pool)
 
-    def get(self, uri):
 
-        url = f"{self.base_url}{uri}"
-        headers = self.build_headers()
-        
-        logRequestPayload( None, url, headers)
+    def close(self):
+        """Close the pooled connections. The client must not be used afterwards."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+    def build_headers(self, access_token: Optional[str] = None, idempotency_key: Optional[str] = None):
+        return self._headers_for(access_token or self.get_access_token(), idempotency_key)
+
+    def get_access_token(self):
+        """Return a valid access token, fetching a new one only when the cached token is stale."""
+        return self._token_cache.get(self.fetch_access_token)
 
+    def fetch_access_token(self):
+        """Request a new token from PayPal. Returns a ``(token, expires_in)`` tuple."""
+        request = self._token_request()
         try:
-            response = requests.get(url, headers=headers)
+            response = self._session.request(**request)
             response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            self.log_request_exception(e, url)
-            logging.error("HTTP request failed: %s", str(e))
+        except HTTP_ERRORS as e:
+            self.log_request_exception(e, request["url"])
+            raise RuntimeError("Failed to obtain access token from PayPal") from e
+
+        return self._parse_token_response(response)
+
+
+    def _send(self, method, url, payload=None, idempotency_key=None):
+        family = endpoint_family(url)
+        breaker = self.circuit_breakers.get(family) if self.circuit_breakers else None
+        if breaker is None:
+            return self._send_attempts(method, url, family, payload, idempotency_key)
+
+        probe = breaker.before_call()
+        try:
+            response = self._send_attempts(method, url, family, payload, idempotency_key)
+        except TRANSIENT_ERRORS:
+            breaker.record_failure(probe)
+            raise
+        except BaseException:
+            breaker.record_released(probe)
             raise
+        self._record_outcome(breaker, probe, response)
+        return response
 
+    def _send_attempts(self, method, url, family, payload=None, idempotency_key=None):
+        stats = self._start_call(method, url)
+        idempotent = method == "GET" or bool(idempotency_key)
+        token_refreshed = False
         try:
-            json_response = response.json()
-        except ValueError:
-            logging.warning("Response body is not valid JSON or empty")
-            return {}
+            while True:
+                if self.rate_limiter:
+                    self.rate_limiter.acquire(self.merchant_key, family)
+                access_token = self.get_access_token()
+                headers = self.build_headers(access_token, idempotency_key)
+                logRequestPayload(payload, url, headers)
+                stats.attempts += 1
+                try:
+                    response = self._session.request(
+                        method, url, headers=headers, json=payload, timeout=self.retry_policy.timeout
+                    )
+                except TRANSIENT_ERRORS as e:
+                    delay = self._retry_delay(stats, idempotent, error=e)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
 
-        logResponsePayload(response, json_response)
+                stats.last_status = response.status_code
+                if not token_refreshed and self._should_refresh_token(response, url):
+                    self._token_cache.invalidate(access_token)
+                    token_refreshed = True
+                    continue
 
-        return json_response
+                delay = self._retry_delay(stats, idempotent, response=response)
+                if delay is None:
+                    return response
+                time.sleep(delay)
+        finally:
+            stats.elapsed = time.monotonic() - stats.started_at
 
 
+    def post(self, uri, payload, idempotency_key: Optional[str] = None):
+        """
+        POST ``payload`` to ``uri``. Passing ``idempotency_key`` sends it as
+        ``PayPal-Request-Id``, which also makes the call safe to retry.
+        """
+        url = f"{self.base_url}{uri}"
+        try:
+            response = self._send("POST", url, payload, idempotency_key)
+            response.raise_for_status()
+        except HTTP_ERRORS as e:
+            self.log_request_exception(e, url)
+            raise
+
+        return self._parse_response(response)
+
+
+    def get(self, uri):
+        """
+        GET ``uri``. Concurrent GETs of the same URL with the same credentials
+        share one network call unless ``coalesce_gets`` is disabled.
+        """
+        url = f"{self.base_url}{uri}"
+        if not self.coalesce_gets:
+            return self._get(url)
+        return shared_single_flight.do(self._flight_key(url), lambda: self._get(url))
+
+
+    def _get(self, url):
+        try:
+            response = self._send("GET", url)
+            response.raise_for_status()
+        except HTTP_ERRORS as e:
+            self.log_request_exception(e, url)
+            raise
 
-    
-    
+        return self._parse_response(response)
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .endpoints import DEFAULT_FAMILY
+
+
+class RateLimit:
+    """``rate`` requests per second on average, with bursts of up to ``burst`` requests."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+
+
+class TokenBucket:
+    """
+    Token bucket that queues callers instead of rejecting them.
+
+    Each caller reserves a token up front; when the bucket is empty the
+    balance goes negative and the caller sleeps until its token has been
+    refilled, so waiting callers are released in arrival order at ``rate``.
+    """
+
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.limit.burst), self._tokens + (now - self._updated) * self.limit.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.limit.rate
+
+    def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """
+    Client-side rate limiting keyed by merchant and endpoint family.
+
+    ``limits`` maps an endpoint family (see ``endpoints.ENDPOINT_FAMILIES``)
+    to its ``RateLimit``; the ``"default"`` entry applies to families without
+    their own limit, and families with no applicable limit are not throttled.
+    Share one instance between toolkits to throttle every session that uses
+    the same merchant credentials together.
+    """
+
+    def __init__(self, limits: Dict[str, RateLimit]):
+        self.limits = dict(limits)
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, merchant_key: str, family: str) -> Optional[TokenBucket]:
+        limit = self.limits.get(family) or self.limits.get(DEFAULT_FAMILY)
+        if limit is None:
+            return None
+        key = (merchant_key, family)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(limit)
+            return bucket
+
+    def acquire(self, merchant_key: str, family: str) -> float:
+        """Block until a request to ``family`` is allowed. Returns the time waited."""
+        bucket = self.bucket(merchant_key, family)
+        return bucket.acquire() if bucket else 0.0
+
+    async def aacquire(self, merchant_key: str, family: str) -> float:
+        bucket = self.bucket(merchant_key, family)
+        return await bucket.aacquire() if bucket else 0.0
@@ -0,0 +1,114 @@
+import importlib
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from .configuration import Configuration
+
+
+# Product key used in ``Configuration.actions`` -> module defining its tools.
+# Module order is the order tools are listed in; relative names resolve
+# against this package.
+PRODUCT_MODULES: Dict[str, str] = {
+    "orders": ".orders.tools",
+    "products": ".subscriptions.tools",
+    "subscriptionPlans": ".subscriptions.tools",
+    "subscriptions": ".subscriptions.tools",
+    "invoices": ".invoices.tools",
+    "disputes": ".disputes.tools",
+    "shipment": ".tracking.tools",
+    "transactions": ".transactions.tools",
+}
+
+
+class ToolRegistry:
+    """
+    Tool definitions indexed by method name. A product's prompts, parameters
+    and handlers are only imported the first time one of its tools is needed,
+    so a toolkit enabling orders alone never loads the other products.
+    """
+
+    def __init__(self, product_modules: Optional[Dict[str, str]] = None):
+        self.product_modules = dict(PRODUCT_MODULES if product_modules is None else product_modules)
+        self._modules: List[str] = list(dict.fromkeys(self.product_modules.values()))
+        self._tools_by_module: Dict[str, List[dict]] = {}
+        self._index: Dict[str, dict] = {}
+        self._extra: List[dict] = []
+        self._lock = threading.RLock()
+
+    def register(self, tool: dict) -> None:
+        """Add a tool defined outside the product modules, replacing any tool with the same method."""
+        with self._lock:
+            previous = self._index.get(tool["method"])
+            if previous is not None and previous in self._extra:
+                self._extra.remove(previous)
+            self._index[tool["method"]] = tool
+            self._extra.append(tool)
+
+    def get_tool(self, method: str) -> Optional[dict]:
+        """The tool registered under ``method``, or None. Loads products until it is found."""
+        tool = self._index.get(method)
+        if tool is not None:
+            return tool
+        for module in self._modules:
+            if module not in self._tools_by_module:
+                self._load(module)
+                tool = self._index.get(method)
+                if tool is not None:
+                    return tool
+        return None
+
+    def enabled_tools(self, configuration: Optional["Configuration"]) -> List[dict]:
+        """Tools allowed by ``configuration.actions``, importing only the products it enables."""
+        from .configuration import is_tool_allowed
+
+        if configuration is None:
+            return []
+        modules = {
+            self.product_modules[product]
+            for product, actions in configuration.actions.items()
+            if product in self.product_modules and any(actions.values())
+        }
+        return [
+            tool for tool in self._tools(self.load_products(modules))
+            if is_tool_allowed(tool, configuration)
+        ] + [tool for tool in self._extra if is_tool_allowed(tool, configuration)]
+
+    def all_tools(self) -> List[dict]:
+        """Every tool of every product, loading them all."""
+        return self._tools(self.load_products(self._modules)) + list(self._extra)
+
+    def load_products(self, modules: Iterable[str]) -> List[str]:
+        modules = set(modules)
+        ordered = [module for module in self._modules if module in modules]
+        for module in ordered:
+            if module not in self._tools_by_module:
+                self._load(module)
+        return ordered
+
+    def _tools(self, modules: List[str]) -> List[dict]:
+        # Skip module tools shadowed by an explicitly registered one.
+        return [
+            tool
+            for module in modules
+            for tool in self._tools_by_module[module]
+            if self._index.get(tool["method"]) is tool
+        ]
+
+    def _load(self, module: str) -> None:
+        with self._lock:
+            if module in self._tools_by_module:
+                return
+            tools = importlib.import_module(module, __package__).tools
+            for tool in tools:
+                # Tools registered explicitly take precedence.
+                self._index.setdefault(tool["method"], tool)
+            self._tools_by_module[module] = tools
+
+
+registry = ToolRegistry()
+
+
+def get_tool(method: str) -> Optional[dict]:
+    """Look up a tool definition by method name in the default registry."""
+    return registry.get_tool(method)
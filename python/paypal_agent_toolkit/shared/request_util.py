@@ -0,0 +1,39 @@
+"""
+Request construction shared by the sync and async tool handlers.
+
+A handler's ``_build_<op>(params)`` validates the parameters and returns the
+``ApiRequest`` to make, including how to turn the response into the tool
+result. ``send_request`` and ``send_request_async`` make it with either
+client, so the two variants of a handler differ only in the call.
+"""
+
+import json
+from typing import Any, Callable, NamedTuple, Optional
+
+
+class ApiRequest(NamedTuple):
+    method: str
+    uri: str
+    payload: Optional[Any] = None
+    to_result: Callable[[Any], Any] = json.dumps
+
+
+def send_request(client, request: ApiRequest):
+    if request.method == "GET":
+        response = client.get(uri=request.uri)
+    else:
+        response = client.post(uri=request.uri, payload=request.payload)
+    return request.to_result(response)
+
+
+async def send_request_async(client, request: ApiRequest):
+    if request.method == "GET":
+        response = await client.get(uri=request.uri)
+    else:
+        response = await client.post(uri=request.uri, payload=request.payload)
+    return request.to_result(response)
+
+
+def raw_response(response):
+    """``to_result`` for requests whose response the handler goes on to use itself."""
+    return response
@@ -0,0 +1,236 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from pydantic import ValidationError
+
+
+# Read tools that may be cached: method -> (default TTL in seconds, tag templates).
+# The tags name the resources the result was read from, so writes can drop it.
+CACHEABLE_TOOLS: Dict[str, Tuple[float, Union[str, Tuple[str, ...]]]] = {
+    "get_order_details": (30, "order:{order_id}"),
+    "show_product_details": (300, "product:{product_id}"),
+    "list_products": (60, "products"),
+    "show_subscription_plan_details": (300, "plan:{plan_id}"),
+    "list_subscription_plans": (60, "plans"),
+    "show_subscription_details": (60, "subscription:{subscription_id}"),
+    # "invoice:*" lets writes that touch any number of invoices drop them all.
+    "get_invoice": (60, ("invoice:{invoice_id}", "invoice:*")),
+    "list_invoices": (60, "invoices"),
+    "get_dispute": (60, "dispute:{dispute_id}"),
+    "list_disputes": (60, "disputes"),
+}
+
+# Invalidation graph: write method -> tags of the cached reads it makes stale.
+INVALIDATIONS: Dict[str, List[str]] = {
+    "pay_order": ["order:{order_id}"],
+    "create_product": ["products"],
+    "create_subscription_plan": ["plans"],
+    "create_subscription": ["plans"],
+    "cancel_subscription": ["subscription:{subscription_id}"],
+    "create_invoice": ["invoices"],
+    "send_invoice": ["invoice:{invoice_id}", "invoices"],
+    "send_invoice_reminder": ["invoice:{invoice_id}"],
+    "cancel_sent_invoice": ["invoice:{invoice_id}", "invoices"],
+    "send_overdue_invoice_reminders": ["invoice:*", "invoices"],
+    "accept_dispute_claim": ["dispute:{dispute_id}", "disputes"],
+}
+
+
+class CacheBackend:
+    """Storage interface for ``ToolResultCache``. Implementations must be thread-safe."""
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Drop every entry carrying one of ``tags``; returns how many were dropped."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """LRU backend bounded by entry count and by the approximate size of the stored results."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (value, expires_at, size, tags)
+        self._entries: "OrderedDict[str, Tuple[Any, float, int, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+        size = _approximate_size(value)
+        if size > self.max_bytes:
+            return
+        tags = tuple(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl, size, tags)
+            self._bytes += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, _, size, tags = self._entries.pop(key)
+        self._bytes -= size
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class ToolResultCache:
+    """
+    Opt-in cache of read tool results for ``PayPalAPI.run``/``arun``.
+
+    Entries are keyed by merchant, method and the validated, normalized
+    parameters, so ``{"page": 1}`` and ``{}`` hit the same entry when 1 is the
+    default. Successful writes drop the cached reads they make stale, following
+    ``INVALIDATIONS``. ``ttls`` overrides the per-method defaults; a TTL of 0
+    disables caching for that method.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        invalidations: Optional[Dict[str, List[str]]] = None,
+    ):
+        self.backend = backend or InMemoryCacheBackend()
+        self.ttls = {method: ttl for method, (ttl, _) in CACHEABLE_TOOLS.items()}
+        self.ttls.update(ttls or {})
+        self.invalidations = {**INVALIDATIONS, **(invalidations or {})}
+
+    def lookup(self, scope: str, tool: dict, params: dict) -> Optional[Any]:
+        key, _ = self._key(scope, tool, params)
+        if key is None:
+            return None
+        value = self.backend.get(key)
+        return value if isinstance(value, str) else copy.deepcopy(value)
+
+    def record(self, scope: str, tool: dict, params: dict, result: Any) -> None:
+        """Store the result of a read tool, or apply the invalidations of a write tool."""
+        method = tool["method"]
+        if method in self.invalidations:
+            self.invalidate(scope, tool, params)
+            return
+
+        key, normalized = self._key(scope, tool, params)
+        if key is None or _is_error_result(result):
+            return
+        templates = CACHEABLE_TOOLS[method][1]
+        tags = [_format_tag(scope, template, normalized)
+                for template in ((templates,) if isinstance(templates, str) else templates)]
+        self.backend.set(key, result, self.ttls[method], [tag for tag in tags if tag])
+
+    def invalidate(self, scope: str, tool: dict, params: dict) -> None:
+        """
+        Drop the reads made stale by the write ``tool``. Also called when the
+        write failed, since PayPal may have applied it before the error.
+        """
+        templates = self.invalidations.get(tool["method"])
+        if not templates:
+            return
+        normalized = _normalize(tool, params) or params
+        tags = [_format_tag(scope, template, normalized) for template in templates]
+        self.backend.invalidate_tags(tag for tag in tags if tag)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def _key(self, scope: str, tool: dict, params: dict) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        method = tool["method"]
+        if method not in CACHEABLE_TOOLS or self.ttls.get(method, 0) <= 0:
+            return None, None
+        normalized = _normalize(tool, params)
+        if normalized is None:
+            return None, None
+        return f"{scope}|{method}|{json.dumps(normalized, sort_keys=True, separators=(',', ':'))}", normalized
+
+
+def _normalize(tool: dict, params: dict) -> Optional[Dict[str, Any]]:
+    """Validated parameters with defaults applied; None when they do not validate."""
+    args_schema = tool.get("args_schema")
+    if args_schema is None:
+        return params
+    try:
+        return args_schema(**params).model_dump(mode="json", exclude_none=True)
+    except ValidationError:
+        return None
+
+
+def _format_tag(scope: str, template: str, params: Dict[str, Any]) -> Optional[str]:
+    try:
+        return f"{scope}|{template.format_map(params)}"
+    except (KeyError, ValueError):
+        return None
+
+
+def _is_error_result(result: Any) -> bool:
+    """Whether a handler returned a PayPal error body (``name`` and ``debug_id``) or an ``error`` rather than data."""
+    if isinstance(result, str):
+        if '"error' not in result and '"debug_id"' not in result:
+            return False
+        try:
+            result = json.loads(result)
+        except ValueError:
+            return False
+    if not isinstance(result, dict):
+        return False
+    return "error" in result or ("name" in result and "debug_id" in result)
+
+
+def _approximate_size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
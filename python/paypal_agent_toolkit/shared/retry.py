@@ -0,0 +1,126 @@
+import contextvars
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Optional
+
+
+class CallStats:
+    """Outcome of the most recent ``PayPalClient`` call made in the current thread or task."""
+
+    def __init__(self, method: str, url: str):
+        self.method = method
+        self.url = url
+        self.attempts = 0
+        self.last_status: Optional[int] = None
+        self.started_at = time.monotonic()
+        self.elapsed = 0.0
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    def __repr__(self):
+        return (
+            f"<CallStats {self.method} {self.url} attempts={self.attempts} "
+            f"last_status={self.last_status} elapsed={self.elapsed:.3f}s>"
+        )
+
+
+_last_call_stats: contextvars.ContextVar[Optional[CallStats]] = contextvars.ContextVar(
+    "paypal_last_call_stats", default=None
+)
+
+
+def last_call_stats() -> Optional[CallStats]:
+    """Stats of the last PayPal call made from the current thread or asyncio task."""
+    return _last_call_stats.get()
+
+
+class RetryPolicy:
+    """
+    When and how ``PayPalClient`` retries a failed call.
+
+    Only idempotent calls are retried: GETs, and POSTs sent with an
+    ``idempotency_key`` (``PayPal-Request-Id``). Retries use exponential
+    backoff with full jitter, honour a ``Retry-After`` header and stop once
+    ``max_retry_time`` seconds have been spent on the call.
+
+    max_attempts    - total attempts including the first one; 1 disables retries
+    backoff_base    - delay cap before the first retry, doubled on every attempt
+    backoff_max     - upper bound of a single delay
+    jitter          - pick the delay uniformly in [0, cap] instead of using the cap
+    max_retry_time  - retry budget per call in seconds
+    timeout         - per-attempt timeout in seconds passed to the transport
+    retry_statuses  - HTTP statuses considered transient
+    on_retry        - optional ``callback(stats, delay, reason)`` invoked before each retry
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        jitter: bool = True,
+        max_retry_time: float = 30.0,
+        timeout: Optional[float] = 30.0,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        on_retry: Optional[Callable[[CallStats, float, str], None]] = None,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.max_retry_time = max_retry_time
+        self.timeout = timeout
+        self.retry_statuses = frozenset(retry_statuses)
+        self.on_retry = on_retry
+
+    @classmethod
+    def disabled(cls, timeout: Optional[float] = 30.0) -> "RetryPolicy":
+        return cls(max_attempts=1, timeout=timeout)
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1-based), ignoring Retry-After."""
+        cap = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, cap) if self.jitter else cap
+
+    def next_delay(
+        self,
+        stats: CallStats,
+        idempotent: bool,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None when the call must not
+        be retried. ``status`` is None for transport errors (timeouts, resets).
+        """
+        if not idempotent or stats.attempts >= self.max_attempts:
+            return None
+        if status is not None and status not in self.retry_statuses:
+            return None
+
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.backoff(stats.attempts)
+
+        spent = time.monotonic() - stats.started_at
+        if spent + delay > self.max_retry_time:
+            return None
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,181 @@
+"""
+Tool parameter schemas, compiled once per process.
+
+Every adapter needs the JSON Schema of each tool's ``args_schema`` in a
+slightly different shape. ``SchemaCompiler`` generates it once per model,
+keyed by a fingerprint of the model's fields, and serves each variant from
+the cache. Schemas can also be compiled ahead of time into a JSON artifact::
+
+    python -m paypal_agent_toolkit.shared.schemas --output paypal_agent_toolkit/shared/schemas.json
+
+The artifact next to this module is loaded automatically when present;
+entries whose fingerprint no longer matches the model are recompiled.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, Optional, Type, get_args
+
+from pydantic import BaseModel
+
+ARTIFACT_VERSION = 1
+DEFAULT_ARTIFACT = os.path.join(os.path.dirname(__file__), "schemas.json")
+
+
+def _openai_agents(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Parameters schema for an OpenAI Agents ``FunctionTool``."""
+    schema.update({"additionalProperties": False, "type": "object"})
+    for key in ["description", "title"]:
+        schema.pop(key, None)
+    for prop in schema.get("properties", {}).values():
+        for key in ["title", "default"]:
+            prop.pop(key, None)
+    return schema
+
+
+def _adk_oas3(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """OpenAPI 3.0 request schema plus the ``components/schemas`` it references."""
+    from ..adk.openapi_schema import json_schema_to_oas3
+
+    converted, components = json_schema_to_oas3(schema)
+    return {"schema": converted, "components": components}
+
+
+def _langchain(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """What LangChain's ``BaseTool.args`` reports: the top-level properties."""
+    return schema.get("properties", {})
+
+
+# Variant name -> transformation of the model's JSON Schema. Each receives a
+# private copy it may modify.
+VARIANTS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "json_schema": lambda schema: schema,
+    "openai_chat": lambda schema: schema,
+    "openai_agents": _openai_agents,
+    "adk_oas3": _adk_oas3,
+    "langchain": _langchain,
+}
+
+
+class SchemaCompiler:
+    """
+    Process-wide cache of tool parameter schemas. ``get`` returns a fresh
+    copy on every call, so adapters may modify what they receive.
+    """
+
+    def __init__(self, artifact: Optional[str] = None):
+        # fingerprint -> variant -> serialized schema
+        self._compiled: Dict[str, Dict[str, str]] = {}
+        self._fingerprints: "weakref.WeakKeyDictionary[type, str]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        if artifact is not None:
+            self.load(artifact)
+
+    def get(self, model: Type[BaseModel], variant: str = "json_schema") -> Dict[str, Any]:
+        return json.loads(self._compile(model, variant))
+
+    def fingerprint(self, model: Type[BaseModel]) -> str:
+        """Hash of the model's fields and config, nested models included."""
+        fingerprint = self._fingerprints.get(model)
+        if fingerprint is None:
+            source = _describe(model, set())
+            fingerprint = hashlib.sha256(source.encode()).hexdigest()[:32]
+            self._fingerprints[model] = fingerprint
+        return fingerprint
+
+    def precompile(self, models: Iterable[Type[BaseModel]], variants: Optional[Iterable[str]] = None) -> None:
+        variants = list(variants or VARIANTS)
+        for model in models:
+            for variant in variants:
+                self._compile(model, variant)
+
+    def load(self, path: str) -> int:
+        """Add the schemas of an artifact written by ``export``; returns how many models it held."""
+        with open(path, encoding="utf-8") as f:
+            artifact = json.load(f)
+        if artifact.get("version") != ARTIFACT_VERSION:
+            logging.warning("Ignoring schema artifact %s with unsupported version %s", path, artifact.get("version"))
+            return 0
+        with self._lock:
+            for fingerprint, variants in artifact["schemas"].items():
+                compiled = self._compiled.setdefault(fingerprint, {})
+                for variant, schema in variants.items():
+                    compiled.setdefault(variant, json.dumps(schema))
+        return len(artifact["schemas"])
+
+    def export(self, path: str, models: Iterable[Type[BaseModel]], variants: Optional[Iterable[str]] = None) -> None:
+        """Compile ``models`` and write them, with every requested variant, to ``path``."""
+        models = list(models)
+        variants = list(variants or VARIANTS)
+        self.precompile(models, variants)
+        schemas = {
+            self.fingerprint(model): {
+                variant: json.loads(self._compiled[self.fingerprint(model)][variant]) for variant in variants
+            }
+            for model in models
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": ARTIFACT_VERSION, "schemas": schemas}, f, sort_keys=True, indent=1)
+
+    def _compile(self, model: Type[BaseModel], variant: str) -> str:
+        builder = VARIANTS.get(variant)
+        if builder is None:
+            raise ValueError(f"Unknown schema variant: {variant}")
+
+        fingerprint = self.fingerprint(model)
+        compiled = self._compiled.get(fingerprint, {})
+        if variant in compiled:
+            return compiled[variant]
+
+        base = compiled.get("json_schema")
+        if base is None:
+            base = json.dumps(model.model_json_schema())
+        serialized = json.dumps(builder(json.loads(base)))
+        with self._lock:
+            compiled = self._compiled.setdefault(fingerprint, {})
+            compiled.setdefault("json_schema", base)
+            return compiled.setdefault(variant, serialized)
+
+
+def _describe(model: type, seen: set) -> str:
+    """Text describing ``model`` that changes whenever its JSON Schema can."""
+    if model in seen:
+        return f"<{model.__module__}.{model.__qualname__}>"
+    seen.add(model)
+    parts = [f"{model.__module__}.{model.__qualname__}", repr(sorted(model.model_config.items(), key=str))]
+    for name, field in model.model_fields.items():
+        parts.append(f"{name}={field!r}")
+        for nested in _nested_models(field.annotation):
+            parts.append(_describe(nested, seen))
+    return "\n".join(parts)
+
+
+def _nested_models(annotation) -> Iterable[type]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _nested_models(arg)
+
+
+schema_compiler = SchemaCompiler(DEFAULT_ARTIFACT if os.path.exists(DEFAULT_ARTIFACT) else None)
+
+
+def main(argv=None) -> None:
+    from .registry import registry
+
+    parser = argparse.ArgumentParser(description="Compile every tool's parameter schemas into a JSON artifact.")
+    parser.add_argument("--output", default=DEFAULT_ARTIFACT, help="artifact path")
+    args = parser.parse_args(argv)
+
+    models = list(dict.fromkeys(tool["args_schema"] for tool in registry.all_tools()))
+    SchemaCompiler().export(args.output, models)
+    print(f"Wrote schemas of {len(models)} models to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
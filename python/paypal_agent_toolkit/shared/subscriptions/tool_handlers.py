@@ -1,79 +1,146 @@
-
 from .parameters import *
+from ..request_util import ApiRequest, send_request, send_request_async
 import json
 
- 
+
 def create_product(client, params: dict):
+    return send_request(client, _build_create_product(params))
+
+
+def list_products(client, params: dict):
+    return send_request(client, _build_list_products(params))
+
+
+def show_product_details(client, params: dict):
+    return send_request(client, _build_show_product_details(params))
+
+
+def create_subscription_plan(client, params: dict):
+    return send_request(client, _build_create_subscription_plan(params))
+
+
+def list_subscription_plans(client, params: dict):
+    return send_request(client, _build_list_subscription_plans(params))
+
+
+def show_subscription_plan_details(client, params: dict):
+    return send_request(client, _build_show_subscription_plan_details(params))
+
+
+def create_subscription(client, params: dict):
+    return send_request(client, _build_create_subscription(params))
+
+
+def show_subscription_details(client, params: dict):
+    return send_request(client, _build_show_subscription_details(params))
+
+
+def cancel_subscription(client, params: dict):
+    return send_request(client, _build_cancel_subscription(params))
+
+
+async def create_product_async(client, params: dict):
+    return await send_request_async(client, _build_create_product(params))
+
+
+async def list_products_async(client, params: dict):
+    return await send_request_async(client, _build_list_products(params))
+
+
+async def show_product_details_async(client, params: dict):
+    return await send_request_async(client, _build_show_product_details(params))
+
+
+async def create_subscription_plan_async(client, params: dict):
+    return await send_request_async(client, _build_create_subscription_plan(params))
+
+
+async def list_subscription_plans_async(client, params: dict):
+    return await send_request_async(client, _build_list_subscription_plans(params))
+
+
+async def show_subscription_plan_details_async(client, params: dict):
+    return await send_request_async(client, _build_show_subscription_plan_details(params))
+
+
+async def create_subscription_async(client, params: dict):
+    return await send_request_async(client, _build_create_subscription(params))
+
+
+async def show_subscription_details_async(client, params: dict):
+    return await send_request_async(client, _build_show_subscription_details(params))
+
+
+async def cancel_subscription_async(client, params: dict):
+    return await send_request_async(client, _build_cancel_subscription(params))
+
+
+def _build_create_product(params: dict) -> ApiRequest:
 
     validated = CreateProductParameters(**params)
     product_uri = "/v1/catalogs/products"
-    result = client.post(uri = product_uri, payload = validated.model_dump())
-    return json.dumps(result)
+    return ApiRequest("POST", product_uri, validated.model_dump())
 
 
-def list_products(client, params: dict):
+def _build_list_products(params: dict) -> ApiRequest:
 
     validated = ListProductsParameters(**params)
     product_uri = f"/v1/catalogs/products?page_size={validated.page_size or 10}&page={validated.page or 1}&total_required={validated.total_required or 'true'}"
-    result = client.get(uri = product_uri)
-    return json.dumps(result)
+    return ApiRequest("GET", product_uri)
 
 
-def show_product_details(client, params: dict):
+def _build_show_product_details(params: dict) -> ApiRequest:
 
     validated = ShowProductDetailsParameters(**params)
     product_uri = f"/v1/catalogs/products/{validated.product_id}"
-    result = client.get(uri = product_uri)
-    return json.dumps(result)
+    return ApiRequest("GET", product_uri)
 
 
-def create_subscription_plan(client, params: dict):
+def _build_create_subscription_plan(params: dict) -> ApiRequest:
 
     validated = CreateSubscriptionPlanParameters(**params)
     subscription_plan_uri = "/v1/billing/plans"
-    result = client.post(uri = subscription_plan_uri, payload = validated.model_dump())
-    return json.dumps(result)
+    return ApiRequest("POST", subscription_plan_uri, validated.model_dump())
 
 
-def list_subscription_plans(client, params: dict):
+def _build_list_subscription_plans(params: dict) -> ApiRequest:
 
     validated = ListSubscriptionPlansParameters(**params)
     subscription_plan_uri = f"/v1/billing/plans?page_size={validated.page_size or 10}&page={validated.page or 1}&total_required={validated.total_required or True}"
     if validated.product_id:
         subscription_plan_uri += f"&product_id={validated.product_id}"
-    result = client.get(uri = subscription_plan_uri)
-    return json.dumps(result)
+    return ApiRequest("GET", subscription_plan_uri)
 
 
-def show_subscription_plan_details(client, params: dict):
+def _build_show_subscription_plan_details(params: dict) -> ApiRequest:
 
     validated = ShowSubscriptionPlanDetailsParameters(**params)
     subscription_plan_uri = f"/v1/billing/plans/{validated.plan_id}"
-    result = client.get(uri = subscription_plan_uri)
-    return json.dumps(result)
+    return ApiRequest("GET", subscription_plan_uri)
 
 
-def create_subscription(client, params: dict):
+def _build_create_subscription(params: dict) -> ApiRequest:
 
     validated = CreateSubscriptionParameters(**params)
     subscription_plan_uri = "/v1/billing/subscriptions"
-    result = client.post(uri = subscription_plan_uri, payload = validated.model_dump())
-    return json.dumps(result)
+    return ApiRequest("POST", subscription_plan_uri, validated.model_dump())
 
 
-def show_subscription_details(client, params: dict):
+def _build_show_subscription_details(params: dict) -> ApiRequest:
 
     validated = ShowSubscriptionDetailsParameters(**params)
     subscription_plan_uri = f"/v1/billing/subscriptions/{validated.subscription_id}"
-    result = client.get(uri = subscription_plan_uri)
-    return json.dumps(result)
+    return ApiRequest("GET", subscription_plan_uri)
 
 
-def cancel_subscription(client, params: dict):
+def _build_cancel_subscription(params: dict) -> ApiRequest:
 
     validated = CancelSubscriptionParameters(**params)
     subscription_plan_uri = f"/v1/billing/subscriptions/{validated.subscription_id}/cancel"
-    result = client.post(uri = subscription_plan_uri, payload = validated.payload.model_dump())
+    return ApiRequest("POST", subscription_plan_uri, validated.payload.model_dump(), _cancel_subscription_result)
+
+
+def _cancel_subscription_result(result):
     if not result:
         return "Successfully cancelled the subscription."
-    return json.dumps(result)
\ No newline at end of file
+    return json.dumps(result)
@@ -0,0 +1,129 @@
+from .prompts import (
+    CREATE_PRODUCT_PROMPT,
+    LIST_PRODUCTS_PROMPT,
+    SHOW_PRODUCT_DETAILS_PROMPT,
+    CREATE_SUBSCRIPTION_PLAN_PROMPT,
+    LIST_SUBSCRIPTION_PLANS_PROMPT,
+    SHOW_SUBSCRIPTION_PLAN_DETAILS_PROMPT,
+    CREATE_SUBSCRIPTION_PROMPT,
+    SHOW_SUBSCRIPTION_DETAILS_PROMPT,
+    CANCEL_SUBSCRIPTION_PROMPT,
+)
+
+from .parameters import (
+    CreateProductParameters,
+    ListProductsParameters,
+    ShowProductDetailsParameters,
+    CreateSubscriptionPlanParameters,
+    ListSubscriptionPlansParameters,
+    ShowSubscriptionPlanDetailsParameters,
+    CreateSubscriptionParameters,
+    ShowSubscriptionDetailsParameters,
+    CancelSubscriptionParameters,
+)
+
+from .tool_handlers import (
+    create_product,
+    list_products,
+    show_product_details,
+    create_subscription_plan,
+    list_subscription_plans,
+    show_subscription_plan_details,
+    create_subscription,
+    show_subscription_details,
+    cancel_subscription,
+    create_product_async,
+    list_products_async,
+    show_product_details_async,
+    create_subscription_plan_async,
+    list_subscription_plans_async,
+    show_subscription_plan_details_async,
+    create_subscription_async,
+    show_subscription_details_async,
+    cancel_subscription_async,
+)
+
+
+tools = [
+    {
+        "method": "create_product",
+        "name": "Create PayPal Product",
+        "description": CREATE_PRODUCT_PROMPT.strip(),
+        "args_schema": CreateProductParameters,
+        "actions": {"products": {"create": True}},
+        "execute": create_product,
+        "execute_async": create_product_async,
+    },
+    {
+        "method": "list_products",
+        "name": "List PayPal Products",
+        "description": LIST_PRODUCTS_PROMPT.strip(),
+        "args_schema": ListProductsParameters,
+        "actions": {"products": {"list": True}},
+        "execute": list_products,
+        "execute_async": list_products_async,
+    },
+    {
+        "method": "show_product_details",
+        "name": "Show PayPal Product Details",
+        "description": SHOW_PRODUCT_DETAILS_PROMPT.strip(),
+        "args_schema": ShowProductDetailsParameters,
+        "actions": {"products": {"show": True}},
+        "execute": show_product_details,
+        "execute_async": show_product_details_async,
+    },
+    {
+        "method": "create_subscription_plan",
+        "name": "Create PayPal Subscription Plan",
+        "description": CREATE_SUBSCRIPTION_PLAN_PROMPT.strip(),
+        "args_schema": CreateSubscriptionPlanParameters,
+        "actions": {"subscriptionPlans": {"create": True}},
+        "execute": create_subscription_plan,
+        "execute_async": create_subscription_plan_async,
+    },
+    {
+        "method": "list_subscription_plans",
+        "name": "List PayPal Subscription Plans",
+        "description": LIST_SUBSCRIPTION_PLANS_PROMPT.strip(),
+        "args_schema": ListSubscriptionPlansParameters,
+        "actions": {"subscriptionPlans": {"list": True}},
+        "execute": list_subscription_plans,
+        "execute_async": list_subscription_plans_async,
+    },
+    {
+        "method": "show_subscription_plan_details",
+        "name": "List PayPal Subscription Plan Details",
+        "description": SHOW_SUBSCRIPTION_PLAN_DETAILS_PROMPT.strip(),
+        "args_schema": ShowSubscriptionPlanDetailsParameters,
+        "actions": {"subscriptionPlans": {"show": True}},
+        "execute": show_subscription_plan_details,
+        "execute_async": show_subscription_plan_details_async,
+    },
+    {
+        "method": "create_subscription",
+        "name": "Create PayPal Subscription",
+        "description": CREATE_SUBSCRIPTION_PROMPT.strip(),
+        "args_schema": CreateSubscriptionParameters,
+        "actions": {"subscriptions": {"create": True}},
+        "execute": create_subscription,
+        "execute_async": create_subscription_async,
+    },
+    {
+        "method": "show_subscription_details",
+        "name": "Show PayPal Subscription Details",
+        "description": SHOW_SUBSCRIPTION_DETAILS_PROMPT.strip(),
+        "args_schema": ShowSubscriptionDetailsParameters,
+        "actions": {"subscriptions": {"show": True}},
+        "execute": show_subscription_details,
+        "execute_async": show_subscription_details_async,
+    },
+    {
+        "method": "cancel_subscription",
+        "name": "Cancel PayPal Subscription",
+        "description": CANCEL_SUBSCRIPTION_PROMPT.strip(),
+        "args_schema": CancelSubscriptionParameters,
+        "actions": {"subscriptions": {"cancel": True}},
+        "execute": cancel_subscription,
+        "execute_async": cancel_subscription_async,
+    },
+]
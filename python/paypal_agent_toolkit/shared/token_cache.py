@@ -0,0 +1,144 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+# A fetcher returns the raw token and its lifetime in seconds (``expires_in``).
+TokenFetcher = Callable[[], Tuple[str, float]]
+AsyncTokenFetcher = Callable[[], Awaitable[Tuple[str, float]]]
+
+
+class AccessTokenCache:
+    """
+    Thread-safe cache for a PayPal OAuth access token.
+
+    The token is reused until it expires. Once it enters the refresh window
+    (``refresh_margin`` seconds before expiry) a single background refresh is
+    started while callers keep using the still valid token. When there is no
+    usable token, exactly one caller fetches a new one and every other caller,
+    sync or async, waits for that result instead of issuing its own request.
+    """
+
+    _shared: Dict[Tuple[str, str, str], "AccessTokenCache"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, refresh_margin: float = 300.0, static_token: Optional[str] = None):
+        self.refresh_margin = refresh_margin
+        self._lock = threading.Lock()
+        self._token: Optional[str] = static_token
+        self._expires_at = float("inf") if static_token else 0.0
+        self._refresh_at = self._expires_at
+        self._pending: Optional[Future] = None
+        self._background_task: Optional[asyncio.Task] = None
+        self._static = static_token is not None
+
+    @classmethod
+    def for_credentials(cls, base_url: str, client_id: str, secret: str) -> "AccessTokenCache":
+        """Return the process-wide cache shared by every client using these credentials."""
+        secret_digest = hashlib.sha256((secret or "").encode("utf-8")).hexdigest()
+        key = (base_url, client_id or "", secret_digest)
+        with cls._shared_lock:
+            cache = cls._shared.get(key)
+            if cache is None:
+                cache = cls._shared[key] = cls()
+            return cache
+
+    @property
+    def is_static(self) -> bool:
+        """True when the token was supplied by the caller and cannot be refreshed."""
+        return self._static
+
+    def get(self, fetch: TokenFetcher) -> str:
+        token, pending, owner = self._acquire()
+        if token is not None:
+            if owner:
+                threading.Thread(target=self._refresh, args=(pending, fetch), daemon=True).start()
+            return token
+        if owner:
+            return self._refresh(pending, fetch)
+        return pending.result()
+
+    async def aget(self, fetch: AsyncTokenFetcher) -> str:
+        token, pending, owner = self._acquire()
+        if token is not None:
+            if owner:
+                self._background_task = asyncio.ensure_future(self._arefresh(pending, fetch))
+            return token
+        if owner:
+            return await self._arefresh(pending, fetch)
+        return await asyncio.wrap_future(pending)
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """Drop the cached token, unless it has already been replaced by a newer one."""
+        if self._static:
+            return
+        with self._lock:
+            if token is None or token == self._token:
+                self._token = None
+                self._expires_at = self._refresh_at = 0.0
+
+    def _acquire(self) -> Tuple[Optional[str], Optional[Future], bool]:
+        """
+        Returns ``(token, pending, owner)``. ``owner`` means the caller must run
+        the refresh for ``pending``: in the background when a token is also
+        returned, inline otherwise.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._token is not None and now < self._expires_at:
+                if not self._static and self._pending is None and now >= self._refresh_at:
+                    self._pending = Future()
+                    return self._token, self._pending, True
+                return self._token, None, False
+            if self._pending is None:
+                self._pending = Future()
+                return None, self._pending, True
+            return None, self._pending, False
+
+    def _refresh(self, pending: Future, fetch: TokenFetcher) -> Optional[str]:
+        try:
+            token, expires_in = fetch()
+            expires_in = _lifetime(expires_in)
+        except Exception as e:
+            return self._fail(pending, e)
+        return self._complete(pending, token, expires_in)
+
+    async def _arefresh(self, pending: Future, fetch: AsyncTokenFetcher) -> Optional[str]:
+        try:
+            token, expires_in = await fetch()
+            expires_in = _lifetime(expires_in)
+        except Exception as e:
+            return self._fail(pending, e)
+        return self._complete(pending, token, expires_in)
+
+    def _complete(self, pending: Future, token: str, expires_in: float) -> str:
+        with self._lock:
+            self._token = token
+            self._expires_at = time.monotonic() + expires_in
+            # Short-lived tokens refresh halfway through their lifetime instead.
+            self._refresh_at = self._expires_at - min(self.refresh_margin, expires_in / 2)
+            self._pending = None
+        pending.set_result(token)
+        return token
+
+    def _fail(self, pending: Future, error: Exception) -> Optional[str]:
+        with self._lock:
+            background = self._token is not None and time.monotonic() < self._expires_at
+            self._pending = None
+        pending.set_exception(error)
+        if background:
+            logging.warning("Background refresh of PayPal access token failed: %s", error)
+            return None
+        raise error
+
+
+def _lifetime(expires_in) -> float:
+    """``expires_in`` as seconds; raises ValueError unless it is a finite, non-negative number."""
+    seconds = float(expires_in)
+    if not 0 <= seconds < float("inf"):
+        raise ValueError(f"Invalid access token lifetime: {expires_in!r}")
+    return seconds
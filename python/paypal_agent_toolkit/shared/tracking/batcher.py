@@ -0,0 +1,196 @@
+"""
+Micro-batching of shipment trackers into ``/v1/shipping/trackers-batch`` calls.
+
+``TrackerBatcher.submit`` queues one tracker and returns a future. Trackers
+queued for the same client within ``max_delay`` seconds, up to
+``max_batch`` of them, are sent in a single POST, and the response is split
+back so that each future gets the ``tracker_identifiers`` and ``errors``
+that concern its own tracker. A failed POST fails every future of the batch.
+Set it with ``Configuration(tracker_batcher=TrackerBatcher())`` and
+``create_shipment_tracking`` calls made concurrently share requests.
+"""
+
+import asyncio
+import contextvars
+import re
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Set
+
+TRACKERS_BATCH_URI = "/v1/shipping/trackers-batch"
+# Most trackers one trackers-batch request may carry.
+MAX_TRACKERS_PER_BATCH = 20
+
+_TRACKER_INDEX = re.compile(r"trackers/(\d+)")
+
+
+class _Batch:
+    def __init__(self, client):
+        self.client = client
+        self.trackers: List[Dict[str, Any]] = []
+        self.futures: List[Any] = []
+        self.timer: Any = None
+
+
+class TrackerBatcher:
+    """
+    max_batch  - trackers per request; a full batch is sent straight away
+    max_delay  - seconds the first tracker of a batch waits for others
+    """
+
+    def __init__(self, max_batch: int = MAX_TRACKERS_PER_BATCH, max_delay: float = 0.05):
+        self.max_batch = max(1, min(max_batch, MAX_TRACKERS_PER_BATCH))
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._pending: Dict[int, _Batch] = {}
+        self._sending: Set[asyncio.Task] = set()
+
+    def submit(self, client, tracker: Dict[str, Any]) -> Future:
+        """Queue ``tracker`` for ``client``; the future resolves to its share of the batch response."""
+        future: Future = Future()
+        with self._lock:
+            batch, full = self._add(client, tracker, future)
+            if batch.timer is None and not full:
+                # The timer thread sends in the submitter's context, like a full batch would.
+                context = contextvars.copy_context()
+                batch.timer = threading.Timer(self.max_delay, context.run, (self._flush, id(client), batch))
+                batch.timer.daemon = True
+                batch.timer.start()
+        if full:
+            if batch.timer is not None:
+                batch.timer.cancel()
+            self._send(batch)
+        return future
+
+    async def submit_async(self, client, tracker: Dict[str, Any]) -> Dict[str, Any]:
+        """Async ``submit`` for an ``AsyncPayPalClient``; returns the tracker's share of the response."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            batch, full = self._add(client, tracker, future)
+            if batch.timer is None and not full:
+                batch.timer = loop.call_later(self.max_delay, self._aflush, id(client), batch)
+        if full:
+            if batch.timer is not None:
+                batch.timer.cancel()
+            self._start_async_send(batch)
+        return await future
+
+    def flush(self) -> None:
+        """Send every queued sync batch now."""
+        with self._lock:
+            batches = [batch for batch in self._pending.values() if isinstance(batch.timer, threading.Timer)]
+            for batch in batches:
+                del self._pending[id(batch.client)]
+        for batch in batches:
+            batch.timer.cancel()
+            self._send(batch)
+
+    def _add(self, client, tracker: Dict[str, Any], future):
+        batch = self._pending.get(id(client))
+        if batch is None:
+            batch = self._pending[id(client)] = _Batch(client)
+        batch.trackers.append(tracker)
+        batch.futures.append(future)
+        full = len(batch.trackers) >= self.max_batch
+        if full:
+            del self._pending[id(client)]
+        return batch, full
+
+    def _take(self, key: int, batch: _Batch) -> bool:
+        with self._lock:
+            if self._pending.get(key) is not batch:
+                return False
+            del self._pending[key]
+            return True
+
+    def _flush(self, key: int, batch: _Batch) -> None:
+        if self._take(key, batch):
+            self._send(batch)
+
+    def _aflush(self, key: int, batch: _Batch) -> None:
+        if self._take(key, batch):
+            self._start_async_send(batch)
+
+    def _send(self, batch: _Batch) -> None:
+        try:
+            response = batch.client.post(uri=TRACKERS_BATCH_URI, payload={"trackers": batch.trackers})
+            results = split_batch_response(batch.trackers, response)
+        except Exception as error:
+            _fail(batch.futures, error)
+            return
+        _resolve(batch.futures, results)
+
+    def _start_async_send(self, batch: _Batch) -> None:
+        # Sent in a task of its own so a cancelled submitter cannot strand the other futures.
+        task = asyncio.ensure_future(self._asend(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _asend(self, batch: _Batch) -> None:
+        try:
+            response = await batch.client.post(uri=TRACKERS_BATCH_URI, payload={"trackers": batch.trackers})
+            results = split_batch_response(batch.trackers, response)
+        except Exception as error:
+            _fail(batch.futures, error)
+            return
+        _resolve(batch.futures, results)
+
+
+# Futures cancelled by their submitter are skipped; the rest of the batch still resolves.
+def _resolve(futures: List[Any], results: List[Dict[str, Any]]) -> None:
+    for future, result in zip(futures, results):
+        if not future.done():
+            future.set_result(result)
+
+
+def _fail(futures: List[Any], error: Exception) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_exception(error)
+
+
+def split_batch_response(trackers: List[Dict[str, Any]], response: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Each tracker's share of a trackers-batch response, in ``trackers`` order.
+    Identifiers are matched on transaction ID and tracking number; errors on
+    a ``trackers/<index>`` field or a detail value naming the tracker. Errors
+    that match no tracker go to every tracker that got no identifier.
+    """
+    response = response or {}
+    results = [{"tracker_identifiers": [], "errors": []} for _ in trackers]
+    positions: Dict[Any, List[int]] = {}
+    for index, tracker in enumerate(trackers):
+        positions.setdefault((tracker.get("transaction_id"), tracker.get("tracking_number")), []).append(index)
+
+    for identifier in response.get("tracker_identifiers") or []:
+        for index in positions.get((identifier.get("transaction_id"), identifier.get("tracking_number")), []):
+            results[index]["tracker_identifiers"].append(identifier)
+
+    unmatched = []
+    for error in response.get("errors") or []:
+        indexes = _error_trackers(error, trackers)
+        if not indexes:
+            unmatched.append(error)
+        for index in indexes:
+            results[index]["errors"].append(error)
+    for result in results:
+        if not result["tracker_identifiers"] and not result["errors"]:
+            result["errors"].extend(unmatched)
+    return results
+
+
+def _error_trackers(error: Dict[str, Any], trackers: List[Dict[str, Any]]) -> List[int]:
+    indexes = set()
+    for detail in error.get("details") or []:
+        match = _TRACKER_INDEX.search(str(detail.get("field") or ""))
+        if match and int(match.group(1)) < len(trackers):
+            indexes.add(int(match.group(1)))
+            continue
+        value = detail.get("value")
+        if value:
+            indexes.update(
+                index for index, tracker in enumerate(trackers)
+                if value in (tracker.get("transaction_id"), tracker.get("tracking_number"))
+            )
+    return sorted(indexes)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional, Literal
 
 
 class CreateShipmentParameters(BaseModel):
@@ -25,6 +25,14 @@ class CreateShipmentParameters(BaseModel):
     )
 
 
+class CreateShipmentTrackingsParameters(BaseModel):
+    trackers: List[CreateShipmentParameters] = Field(
+        ...,
+        min_length=1,
+        description="The shipments to add tracking information for."
+    )
+
+
 class GetShipmentTrackingParameters(BaseModel):
     order_id: Optional[str] = Field(
         default=None,
@@ -34,3 +42,20 @@ class GetShipmentTrackingParameters(BaseModel):
         default=None,
         description="The transaction ID associated with the shipment tracking to retrieve."
     )
+
+
+class GetShipmentTrackingsParameters(BaseModel):
+    order_ids: List[str] = Field(
+        default_factory=list,
+        description="IDs of the orders whose shipment tracking to retrieve."
+    )
+    transaction_ids: List[str] = Field(
+        default_factory=list,
+        description="Transaction IDs whose shipment tracking to retrieve."
+    )
+
+    @model_validator(mode="after")
+    def _check_ids(self):
+        if not self.order_ids and not self.transaction_ids:
+            raise ValueError("Either order_ids or transaction_ids must be provided.")
+        return self
@@ -18,4 +18,29 @@ Get tracking information for a shipment by ID.
 This function retrieves tracking information for a specific shipment using the transaction ID and tracking number.
 The transaction_id can fetch from the captured payment details in the order information.
 Below is the payload request structure:
-"""
\ No newline at end of file
+"""
+
+CREATE_SHIPMENT_TRACKINGS_PROMPT = """
+Add tracking information for many shipments at once in PayPal.
+This function takes a list of shipments and submits them in batches of up to 20 per request, which is much faster than creating them one at a time.
+Each shipment takes the same fields as create_shipment_tracking: tracking_number, transaction_id, status (optional) and carrier (optional).
+The result lists the tracker_identifiers that were created and the errors for shipments that could not be added.
+Below is the payload request structure:
+{
+    "trackers": [
+        {"tracking_number": "1234567890", "transaction_id": "9XJ12345ABC67890", "status": "SHIPPED", "carrier": "UPS"},
+        {"tracking_number": "1234567891", "transaction_id": "8MC58520KP746392H", "status": "SHIPPED", "carrier": "FEDEX"}
+    ]
+}
+"""
+
+GET_SHIPMENT_TRACKINGS_PROMPT = """
+Get tracking information for the shipments of many orders or transactions at once.
+This function looks up the tracking of every order_id and transaction_id given, several at a time. Order IDs are resolved to their capture's transaction ID first.
+The result has one entry per order or transaction, with either its tracking information or the error that prevented the lookup.
+Below is the payload request structure:
+{
+    "order_ids": ["5O190127TN364715T", "8MC58520KP746392H"],
+    "transaction_ids": ["9XJ12345ABC67890"]
+}
+"""
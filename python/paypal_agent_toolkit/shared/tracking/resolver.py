@@ -0,0 +1,142 @@
+"""
+Order ID -> capture (transaction) ID resolution for shipment tracking.
+
+Tracking is keyed by the capture's transaction ID, which an order only
+reveals through ``GET /v2/checkout/orders/{id}``. A capture never changes
+once made, so ``CaptureResolver`` remembers every mapping it resolves in a
+SQLite table bounded as an LRU; with a file path the mappings outlive the
+process. Orders without a capture yet are never remembered. Lookups only
+read the table: when each mapping was last used is kept in memory and
+written back in batches, and always before the least recent are dropped.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from ..concurrency import merchant_scope
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS captures (
+    scope TEXT NOT NULL,
+    order_id TEXT NOT NULL,
+    capture_id TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (scope, order_id)
+);
+CREATE INDEX IF NOT EXISTS captures_last_used ON captures (last_used);
+"""
+
+
+class CaptureResolver:
+    """
+    path         - SQLite database file; ":memory:" keeps the mappings in this process only
+    max_entries  - mappings kept; the least recently used are dropped beyond it
+    touch_batch  - lookups whose recency is buffered before it is written back
+    """
+
+    _shared: Optional["CaptureResolver"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str = ":memory:", max_entries: int = 100_000, touch_batch: int = 256):
+        self.path = path
+        self.max_entries = max_entries
+        self.touch_batch = touch_batch
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._count = self._db.execute("SELECT COUNT(*) FROM captures").fetchone()[0]
+        self._touched: Dict[Tuple[str, str], float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> "CaptureResolver":
+        """The process-wide in-memory resolver, created on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def close(self) -> None:
+        with self._lock:
+            self._write_touched()
+            self._db.close()
+
+    def resolve(self, client, order_id: str) -> str:
+        """The capture ID of ``order_id``; raises ValueError when the order has no capture."""
+        scope = merchant_scope(client)
+        capture_id = self.lookup(scope, order_id)
+        if capture_id is None:
+            capture_id = capture_id_from_order(client.get(uri=f"/v2/checkout/orders/{order_id}"))
+            self.remember(scope, order_id, capture_id)
+        return capture_id
+
+    async def resolve_async(self, client, order_id: str) -> str:
+        scope = merchant_scope(client)
+        capture_id = self.lookup(scope, order_id)
+        if capture_id is None:
+            capture_id = capture_id_from_order(await client.get(uri=f"/v2/checkout/orders/{order_id}"))
+            self.remember(scope, order_id, capture_id)
+        return capture_id
+
+    def lookup(self, scope: str, order_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT capture_id FROM captures WHERE scope = ? AND order_id = ?", (scope, order_id)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[(scope, order_id)] = time.time()
+            if len(self._touched) >= self.touch_batch:
+                self._write_touched()
+            return row[0]
+
+    def remember(self, scope: str, order_id: str, capture_id: str) -> None:
+        with self._lock, self._db:
+            inserted = self._db.execute(
+                "INSERT OR IGNORE INTO captures (scope, order_id, capture_id, last_used) VALUES (?, ?, ?, ?)",
+                (scope, order_id, capture_id, time.time()),
+            ).rowcount
+            if not inserted:
+                self._db.execute(
+                    "UPDATE captures SET capture_id = ?, last_used = ? WHERE scope = ? AND order_id = ?",
+                    (capture_id, time.time(), scope, order_id),
+                )
+                return
+            self._count += 1
+            if self._count > self.max_entries:
+                # Evict on up-to-date recency.
+                self._write_touched()
+                self._count -= self._db.execute(
+                    "DELETE FROM captures WHERE rowid IN (SELECT rowid FROM captures ORDER BY last_used LIMIT ?)",
+                    (self._count - self.max_entries,),
+                ).rowcount
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _write_touched(self) -> None:
+        # Called with the lock held.
+        if not self._touched:
+            return
+        with self._db:
+            self._db.executemany(
+                "UPDATE captures SET last_used = ? WHERE scope = ? AND order_id = ?",
+                [(used, scope, order_id) for (scope, order_id), used in self._touched.items()],
+            )
+        self._touched.clear()
+
+
+def capture_id_from_order(order_details: Dict[str, Any]) -> str:
+    if order_details and "purchase_units" in order_details and len(order_details["purchase_units"]) > 0:
+        purchase_unit = order_details["purchase_units"][0]
+
+        if "payments" in purchase_unit and "captures" in purchase_unit["payments"] and len(purchase_unit["payments"]["captures"]) > 0:
+            capture_details = purchase_unit["payments"]["captures"][0]
+            return capture_details["id"]
+        raise ValueError("Could not find capture id in the purchase unit details.")
+    raise ValueError("Could not find purchase unit details in order details.")
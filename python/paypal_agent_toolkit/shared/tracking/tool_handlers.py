@@ -1,31 +1,52 @@
-
+import asyncio
 import json
-from typing import Dict, Any
-from .parameters import CreateShipmentParameters, GetShipmentTrackingParameters
+from typing import Dict, Any, List, Optional, Tuple
+from .batcher import MAX_TRACKERS_PER_BATCH, TRACKERS_BATCH_URI, TrackerBatcher
+from .parameters import (
+    CreateShipmentParameters,
+    CreateShipmentTrackingsParameters,
+    GetShipmentTrackingParameters,
+    GetShipmentTrackingsParameters,
+)
+from .resolver import CaptureResolver
+from ..concurrency import abounded_map, bounded_map
+from ..request_util import ApiRequest, raw_response, send_request, send_request_async
+
+# Orders or transactions get_shipment_trackings looks up at the same time.
+TRACKING_WORKERS = 8
 
 
-def create_shipment_tracking(client, params: dict) -> Dict[str, Any]:
+def create_shipment_tracking(client, params: dict, tracker_batcher: Optional[TrackerBatcher] = None) -> Dict[str, Any]:
     """
     Create a shipment tracking entry.
     """
     validated = CreateShipmentParameters(**params)
-    uri = "/v1/shipping/trackers-batch"
-   
-    # Prepare trackers data - wrapping single shipment in an array
-    trackers_data = {
-        "trackers": [{
-            "tracking_number": validated.tracking_number,
-            "transaction_id": validated.transaction_id,
-            "status": validated.status,
-            "carrier": validated.carrier
-        }]
-    }
-    response = client.post(uri=uri, payload=trackers_data)
-    return json.dumps(response)
 
+    # Concurrent calls share trackers-batch requests when a batcher is configured
+    if tracker_batcher is not None:
+        return json.dumps(tracker_batcher.submit(client, _tracker(validated)).result())
+
+    return send_request(client, _build_create_shipment_tracking(validated))
 
 
-def get_shipment_tracking(client, params: dict) -> Dict[str, Any]:
+def create_shipment_trackings(client, params: dict) -> Dict[str, Any]:
+    """
+    Create shipment tracking entries in batches.
+    """
+    validated = CreateShipmentTrackingsParameters(**params)
+    chunks = _chunks(validated)
+    responses = []
+    for chunk in chunks:
+        # A failed batch is reported on its trackers; the other batches still go out
+        try:
+            responses.append(send_request(client, _build_trackers_batch(chunk, raw_response)))
+        except Exception as error:
+            responses.append(error)
+    return json.dumps(_merged_response(validated, chunks, responses))
+
+
+
+def get_shipment_tracking(client, params: dict, capture_resolver: Optional[CaptureResolver] = None) -> Dict[str, Any]:
     """
     Retrieve shipment tracking information.
     """
@@ -35,25 +56,163 @@ def get_shipment_tracking(client, params: dict) -> Dict[str, Any]:
     # Check if order_id is provided and transaction_id is not
     if validated.order_id and not transaction_id:
         try:
-            order_details = client.get_order_details(order_id=validated.order_id)
-
-            if order_details and "purchase_units" in order_details and len(order_details["purchase_units"]) > 0:
-                purchase_unit = order_details["purchase_units"][0]
-
-                if "payments" in purchase_unit and "captures" in purchase_unit["payments"] and len(purchase_unit["payments"]["captures"]) > 0:
-                    capture_details = purchase_unit["payments"]["captures"][0]
-                    transaction_id = capture_details["id"]
-                else:
-                    raise ValueError("Could not find capture id in the purchase unit details.")
-            else:
-                raise ValueError("Could not find purchase unit details in order details.")
+            transaction_id = _resolver(capture_resolver).resolve(client, validated.order_id)
+        except Exception as error:
+            raise ValueError(f"Error extracting transaction_id from order details: {str(error)}")
+
+    return send_request(client, _build_get_shipment_tracking(transaction_id))
+
+
+def get_shipment_trackings(client, params: dict, capture_resolver: Optional[CaptureResolver] = None) -> Dict[str, Any]:
+    """
+    Retrieve shipment tracking information for many orders or transactions concurrently.
+    """
+    validated = GetShipmentTrackingsParameters(**params)
+    resolver = _resolver(capture_resolver)
+
+    def lookup(order_id: Optional[str], transaction_id: Optional[str]) -> Dict[str, Any]:
+        try:
+            transaction_id = transaction_id or resolver.resolve(client, order_id)
+            tracking = send_request(client, _build_get_shipment_tracking(transaction_id, raw_response))
+        except Exception as error:
+            return _lookup_result(order_id, transaction_id, error=error)
+        return _lookup_result(order_id, transaction_id, tracking)
+
+    looked_up = bounded_map(lambda ids: lookup(*ids), _lookups(validated), TRACKING_WORKERS, ordered=True,
+                            thread_name_prefix="paypal-tracking")
+    return json.dumps({"results": [future.result() for _, future in looked_up]})
+
+
+async def create_shipment_tracking_async(client, params: dict, tracker_batcher: Optional[TrackerBatcher] = None) -> Dict[str, Any]:
+    validated = CreateShipmentParameters(**params)
+
+    if tracker_batcher is not None:
+        return json.dumps(await tracker_batcher.submit_async(client, _tracker(validated)))
+
+    return await send_request_async(client, _build_create_shipment_tracking(validated))
+
+
+async def create_shipment_trackings_async(client, params: dict) -> Dict[str, Any]:
+    validated = CreateShipmentTrackingsParameters(**params)
+    chunks = _chunks(validated)
+    responses = await asyncio.gather(*(
+        send_request_async(client, _build_trackers_batch(chunk, raw_response))
+        for chunk in chunks
+    ), return_exceptions=True)
+    return json.dumps(_merged_response(validated, chunks, responses))
+
+
+async def get_shipment_tracking_async(client, params: dict, capture_resolver: Optional[CaptureResolver] = None) -> Dict[str, Any]:
+    validated = GetShipmentTrackingParameters(**params)
+    transaction_id = validated.transaction_id
+
+    if validated.order_id and not transaction_id:
+        try:
+            transaction_id = await _resolver(capture_resolver).resolve_async(client, validated.order_id)
         except Exception as error:
             raise ValueError(f"Error extracting transaction_id from order details: {str(error)}")
 
+    return await send_request_async(client, _build_get_shipment_tracking(transaction_id))
+
+
+async def get_shipment_trackings_async(client, params: dict, capture_resolver: Optional[CaptureResolver] = None) -> Dict[str, Any]:
+    validated = GetShipmentTrackingsParameters(**params)
+    resolver = _resolver(capture_resolver)
+
+    async def lookup(order_id: Optional[str], transaction_id: Optional[str]) -> Dict[str, Any]:
+        try:
+            transaction_id = transaction_id or await resolver.resolve_async(client, order_id)
+            tracking = await send_request_async(client, _build_get_shipment_tracking(transaction_id, raw_response))
+        except Exception as error:
+            return _lookup_result(order_id, transaction_id, error=error)
+        return _lookup_result(order_id, transaction_id, tracking)
+
+    looked_up = abounded_map(lambda ids: lookup(*ids), _lookups(validated), TRACKING_WORKERS, ordered=True)
+    return json.dumps({"results": [task.result() async for _, task in looked_up]})
+
+
+def _build_create_shipment_tracking(validated: CreateShipmentParameters) -> ApiRequest:
+    # Prepare trackers data - wrapping single shipment in an array
+    return _build_trackers_batch([_tracker(validated)])
+
+
+def _build_trackers_batch(trackers: List[Dict[str, Any]], to_result=json.dumps) -> ApiRequest:
+    return ApiRequest("POST", TRACKERS_BATCH_URI, {"trackers": trackers}, to_result)
+
+
+def _build_get_shipment_tracking(transaction_id: Optional[str], to_result=json.dumps) -> ApiRequest:
     if not transaction_id:
         raise ValueError("Either transaction_id or order_id must be provided.")
 
     uri = f"/v1/shipping/trackers?transaction_id={transaction_id}"
-    response = client.get(uri=uri)
-    return json.dumps(response)
-    
\ No newline at end of file
+    return ApiRequest("GET", uri, to_result=to_result)
+
+
+def _tracker(validated: CreateShipmentParameters) -> Dict[str, Any]:
+    return {
+        "tracking_number": validated.tracking_number,
+        "transaction_id": validated.transaction_id,
+        "status": validated.status,
+        "carrier": validated.carrier
+    }
+
+
+def _chunks(validated: CreateShipmentTrackingsParameters) -> List[List[Dict[str, Any]]]:
+    trackers = [_tracker(tracker) for tracker in validated.trackers]
+    return [trackers[i:i + MAX_TRACKERS_PER_BATCH] for i in range(0, len(trackers), MAX_TRACKERS_PER_BATCH)]
+
+
+def _merged_response(validated: CreateShipmentTrackingsParameters, chunks: List[List[Dict[str, Any]]],
+                     responses: List[Any]) -> Dict[str, Any]:
+    """Identifiers and errors of every batch; a batch that raised gets one error per tracker."""
+    identifiers, errors, failed = [], [], 0
+    offset = 0
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, BaseException):
+            if not isinstance(response, Exception):
+                raise response
+            failed += 1
+            errors.extend(_batch_failure(response, chunk, offset))
+        else:
+            identifiers.extend((response or {}).get("tracker_identifiers") or [])
+            errors.extend((response or {}).get("errors") or [])
+        offset += len(chunk)
+    return {
+        "tracker_identifiers": identifiers,
+        "errors": errors,
+        "submitted": len(validated.trackers),
+        "batches": len(responses),
+        "failed_batches": failed,
+    }
+
+
+def _batch_failure(error: Exception, chunk: List[Dict[str, Any]], offset: int) -> List[Dict[str, Any]]:
+    # Shaped like the errors of a trackers-batch response, naming the tracker by its index in the call.
+    return [
+        {
+            "name": "BATCH_REQUEST_FAILED",
+            "message": str(error),
+            "details": [{"field": f"trackers/{offset + index}", "value": tracker.get("transaction_id")}],
+        }
+        for index, tracker in enumerate(chunk)
+    ]
+
+
+def _resolver(capture_resolver: Optional[CaptureResolver]) -> CaptureResolver:
+    return CaptureResolver.shared() if capture_resolver is None else capture_resolver
+
+
+def _lookups(validated: GetShipmentTrackingsParameters) -> List[Tuple[Optional[str], Optional[str]]]:
+    return [(order_id, None) for order_id in validated.order_ids] + [
+        (None, transaction_id) for transaction_id in validated.transaction_ids
+    ]
+
+
+def _lookup_result(order_id: Optional[str], transaction_id: Optional[str], tracking=None, error=None) -> Dict[str, Any]:
+    result = {"order_id": order_id} if order_id else {}
+    result["transaction_id"] = transaction_id
+    if error is not None:
+        result["error"] = str(error)
+    else:
+        result["tracking"] = tracking
+    return result
@@ -0,0 +1,67 @@
+from .prompts import (
+    CREATE_SHIPMENT_PROMPT,
+    CREATE_SHIPMENT_TRACKINGS_PROMPT,
+    GET_SHIPMENT_TRACKING_PROMPT,
+    GET_SHIPMENT_TRACKINGS_PROMPT,
+)
+
+from .parameters import (
+    CreateShipmentParameters,
+    CreateShipmentTrackingsParameters,
+    GetShipmentTrackingParameters,
+    GetShipmentTrackingsParameters,
+)
+
+from .tool_handlers import (
+    create_shipment_tracking,
+    create_shipment_trackings,
+    get_shipment_tracking,
+    get_shipment_trackings,
+    create_shipment_tracking_async,
+    create_shipment_trackings_async,
+    get_shipment_tracking_async,
+    get_shipment_trackings_async,
+)
+
+
+tools = [
+    {
+        "method": "create_shipment_tracking",
+        "name": "Create Shipment",
+        "description": CREATE_SHIPMENT_PROMPT.strip(),
+        "args_schema": CreateShipmentParameters,
+        "actions": {"shipment": {"create": True}},
+        "services": ("tracker_batcher",),
+        "execute": create_shipment_tracking,
+        "execute_async": create_shipment_tracking_async,
+    },
+    {
+        "method": "create_shipment_trackings",
+        "name": "Create Shipments",
+        "description": CREATE_SHIPMENT_TRACKINGS_PROMPT.strip(),
+        "args_schema": CreateShipmentTrackingsParameters,
+        "actions": {"shipment": {"create": True}},
+        "execute": create_shipment_trackings,
+        "execute_async": create_shipment_trackings_async,
+    },
+    {
+        "method": "get_shipment_tracking",
+        "name": "Get Shipment Tracking",
+        "description": GET_SHIPMENT_TRACKING_PROMPT.strip(),
+        "args_schema": GetShipmentTrackingParameters,
+        "actions": {"shipment": {"get": True}},
+        "services": ("capture_resolver",),
+        "execute": get_shipment_tracking,
+        "execute_async": get_shipment_tracking_async,
+    },
+    {
+        "method": "get_shipment_trackings",
+        "name": "Get Shipment Trackings",
+        "description": GET_SHIPMENT_TRACKINGS_PROMPT.strip(),
+        "args_schema": GetShipmentTrackingsParameters,
+        "actions": {"shipment": {"get": True}},
+        "services": ("capture_resolver",),
+        "execute": get_shipment_trackings,
+        "execute_async": get_shipment_trackings_async,
+    },
+]
@@ -0,0 +1,272 @@
+"""
+Column-oriented aggregation of reporting transactions.
+
+``TransactionColumns`` loads transaction records into flat columns: amounts
+and fees as float arrays, and currency, status, event code, category and UTC
+day as integer codes into small label tables. ``summarize`` groups those
+columns and computes counts, sums, averages and percentiles per group. With
+NumPy installed every aggregate is a handful of array operations; without it
+the same results are computed from ``array`` columns in one pass per group.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+from .planner import parse_date
+
+GROUP_KEYS = ("currency", "status", "event_code", "category", "day")
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+
+# Transaction event code groups (the T-code table of the Transaction Search
+# API), from the first three characters of the code.
+EVENT_CATEGORIES = {
+    "T00": "payment",
+    "T01": "fee",
+    "T02": "currency_conversion",
+    "T03": "bank_deposit",
+    "T04": "bank_withdrawal",
+    "T05": "debit_card",
+    "T06": "credit_card_withdrawal",
+    "T07": "credit_card_deposit",
+    "T08": "bonus",
+    "T09": "incentive",
+    "T10": "bill_pay",
+    "T11": "reversal",
+    "T12": "adjustment",
+    "T13": "authorization",
+    "T14": "dividend",
+    "T15": "hold",
+    "T16": "buyer_credit",
+    "T17": "non_bank_withdrawal",
+    "T18": "buyer_credit_withdrawal",
+    "T19": "account_correction",
+    "T20": "funds_transfer",
+    "T21": "reserve",
+    "T22": "transfer",
+    "T30": "generic",
+    "T50": "collections_disbursements",
+    "T97": "payables_receivables",
+    "T98": "display_only",
+    "T99": "other",
+}
+
+
+class TransactionColumns:
+    """Transactions as parallel columns; categorical columns hold codes into ``labels``."""
+
+    def __init__(self):
+        self.amount = array("d")
+        self.fee = array("d")
+        self.codes: Dict[str, array] = {key: array("q") for key in GROUP_KEYS}
+        self.labels: Dict[str, List[str]] = {key: [] for key in GROUP_KEYS}
+        self._lookup: Dict[str, Dict[str, int]] = {key: {} for key in GROUP_KEYS}
+
+    def __len__(self) -> int:
+        return len(self.amount)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "TransactionColumns":
+        columns = cls()
+        columns.extend(records)
+        return columns
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append ``records``; records can be streamed, they are not kept."""
+        for record in records:
+            info = record.get("transaction_info") or {}
+            amount = info.get("transaction_amount") or {}
+            event_code = info.get("transaction_event_code") or ""
+            self.amount.append(_number(amount.get("value")))
+            self.fee.append(_number((info.get("fee_amount") or {}).get("value")))
+            self._code("currency", amount.get("currency_code") or "")
+            self._code("status", info.get("transaction_status") or "")
+            self._code("event_code", event_code)
+            self._code("category", EVENT_CATEGORIES.get(event_code[:3], "other" if event_code else ""))
+            self._code("day", _day(info.get("transaction_initiation_date")))
+
+    def select(self, rows: Sequence[int]) -> "TransactionColumns":
+        """A copy holding only ``rows``, in that order."""
+        selected = TransactionColumns()
+        selected.labels = self.labels
+        selected._lookup = self._lookup
+        if numpy is not None and isinstance(rows, numpy.ndarray):
+            selected.amount.frombytes(numpy.frombuffer(self.amount, dtype=numpy.float64)[rows].tobytes())
+            selected.fee.frombytes(numpy.frombuffer(self.fee, dtype=numpy.float64)[rows].tobytes())
+            for key, codes in self.codes.items():
+                selected.codes[key].frombytes(numpy.frombuffer(codes, dtype=numpy.int64)[rows].tobytes())
+            return selected
+        selected.amount = array("d", (self.amount[row] for row in rows))
+        selected.fee = array("d", (self.fee[row] for row in rows))
+        selected.codes = {key: array("q", (codes[row] for row in rows)) for key, codes in self.codes.items()}
+        return selected
+
+    def matching(self, key: str, predicate, use_numpy: bool = False) -> Sequence[int]:
+        """Indexes of the rows whose ``key`` label satisfies ``predicate``."""
+        wanted = [code for code, label in enumerate(self.labels[key]) if predicate(label)]
+        if use_numpy:
+            return numpy.flatnonzero(numpy.isin(numpy.frombuffer(self.codes[key], dtype=numpy.int64), wanted))
+        wanted = set(wanted)
+        return [row for row, code in enumerate(self.codes[key]) if code in wanted]
+
+    def _code(self, key: str, label: str) -> None:
+        lookup = self._lookup[key]
+        code = lookup.get(label)
+        if code is None:
+            code = lookup[label] = len(self.labels[key])
+            self.labels[key].append(label)
+        self.codes[key].append(code)
+
+
+def summarize(
+    columns: TransactionColumns,
+    group_by: Sequence[str] = ("currency",),
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    event_code: Optional[str] = None,
+    use_numpy: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """
+    Per-group ``count``, ``total``, ``fees``, ``net``, ``average``, ``min``,
+    ``max`` and ``p<q>`` amounts, groups ordered by key. Amounts in different
+    currencies are never added together: ``currency`` is always a group key.
+    ``event_code`` keeps only transactions whose event code starts with it.
+    """
+    keys = _group_keys(group_by)
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if event_code:
+        columns = columns.select(columns.matching("event_code", lambda label: label.startswith(event_code), use_numpy))
+
+    aggregate = _aggregate_numpy if use_numpy else _aggregate_array
+    groups = aggregate(columns, keys, list(percentiles))
+    return {
+        "transaction_count": len(columns),
+        "group_by": keys,
+        "groups": groups,
+        "engine": "numpy" if use_numpy else "array",
+    }
+
+
+def _group_keys(group_by: Sequence[str]) -> List[str]:
+    unknown = [key for key in group_by if key not in GROUP_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown group_by keys {unknown}; expected any of {list(GROUP_KEYS)}")
+    keys = list(dict.fromkeys(group_by))
+    return keys if "currency" in keys else ["currency"] + keys
+
+
+def _aggregate_numpy(columns: TransactionColumns, keys: List[str], percentiles: List[float]) -> List[Dict[str, Any]]:
+    if not len(columns):
+        return []
+    amount = numpy.frombuffer(columns.amount, dtype=numpy.float64)
+    fee = numpy.frombuffer(columns.fee, dtype=numpy.float64)
+
+    # One integer per row identifying its group: the key codes in mixed radix.
+    combined = numpy.zeros(len(columns), dtype=numpy.int64)
+    for key in keys:
+        combined = combined * len(columns.labels[key]) + numpy.frombuffer(columns.codes[key], dtype=numpy.int64)
+    group_ids, first_rows, group = numpy.unique(combined, return_index=True, return_inverse=True)
+    count = numpy.bincount(group)
+    total = numpy.bincount(group, weights=amount)
+    fees = numpy.bincount(group, weights=fee)
+
+    # Rows sorted by group, then amount: each group is a sorted slice starting at ``start``.
+    order = numpy.lexsort((amount, group))
+    ordered = amount[order]
+    start = numpy.concatenate(([0], numpy.cumsum(count)[:-1]))
+    quantiles = {}
+    for q in percentiles:
+        position = start + (count - 1) * (q / 100.0)
+        low = numpy.floor(position).astype(numpy.int64)
+        high = numpy.ceil(position).astype(numpy.int64)
+        quantiles[q] = ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+    groups = []
+    for index in range(len(group_ids)):
+        row = first_rows[index]
+        groups.append(_group_result(
+            {key: columns.labels[key][columns.codes[key][row]] for key in keys},
+            int(count[index]),
+            float(total[index]),
+            float(fees[index]),
+            float(ordered[start[index]]),
+            float(ordered[start[index] + count[index] - 1]),
+            {q: float(values[index]) for q, values in quantiles.items()},
+        ))
+    return _sorted(groups, keys)
+
+
+def _aggregate_array(columns: TransactionColumns, keys: List[str], percentiles: List[float]) -> List[Dict[str, Any]]:
+    members: Dict[Tuple[int, ...], array] = {}
+    key_codes = [columns.codes[key] for key in keys]
+    for row in range(len(columns)):
+        group = tuple(codes[row] for codes in key_codes)
+        rows = members.get(group)
+        if rows is None:
+            rows = members[group] = array("q")
+        rows.append(row)
+
+    groups = []
+    for group, rows in members.items():
+        amounts = sorted(columns.amount[row] for row in rows)
+        groups.append(_group_result(
+            {key: columns.labels[key][code] for key, code in zip(keys, group)},
+            len(amounts),
+            sum(amounts),
+            sum(columns.fee[row] for row in rows),
+            amounts[0],
+            amounts[-1],
+            {q: _percentile(amounts, q) for q in percentiles},
+        ))
+    return _sorted(groups, keys)
+
+
+def _group_result(key: Dict[str, str], count: int, total: float, fees: float, low: float, high: float,
+                  quantiles: Dict[float, float]) -> Dict[str, Any]:
+    result = dict(key)
+    result.update(
+        count=count,
+        total=round(total, 2),
+        fees=round(fees, 2),
+        net=round(total + fees, 2),
+        average=round(total / count, 2),
+        min=round(low, 2),
+        max=round(high, 2),
+    )
+    for q, value in quantiles.items():
+        result[f"p{q:g}"] = round(value, 2)
+    return result
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    # Linear interpolation between closest ranks, like numpy.percentile.
+    position = (len(ordered) - 1) * (q / 100.0)
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _sorted(groups: List[Dict[str, Any]], keys: List[str]) -> List[Dict[str, Any]]:
+    return sorted(groups, key=lambda group: tuple(group[key] for key in keys))
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value) if value is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _day(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    if value.endswith(("Z", "+0000", "+00:00")):
+        return value[:10]
+    try:
+        return parse_date(value).date().isoformat()
+    except ValueError:
+        return value[:10]
@@ -0,0 +1,279 @@
+"""
+Streaming export of reporting transactions to NDJSON or CSV.
+
+``export_transactions(client, "march.ndjson", {"start_date": ..., "end_date": ...})``
+walks the range's 31-day windows oldest first and appends each page to the
+file as soon as it arrives, so at most one page (500 records) is held in
+memory however large the export. After every page the file is flushed and a
+checkpoint beside it records the byte offset, the page to fetch next and the
+windows still to go; an interrupted export started again with the same
+arguments truncates the file to that offset and carries on from there.
+
+    python -m paypal_agent_toolkit.shared.transactions.export march.csv \\
+        --start-date 2025-03-01T00:00:00Z --end-date 2025-04-01T00:00:00Z
+"""
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from ..http_pool import HTTP_ERRORS
+from ..pagination import next_page_uri
+from .parameters import ListTransactionsParameters
+from .planner import ResultCapExceeded, check_cap, plan_windows, requested_range, split_window
+from .search import Window, window_uri
+
+EXPORT_FORMATS = ("ndjson", "csv")
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+# CSV column -> path into the transaction record.
+CSV_COLUMNS = {
+    "transaction_id": ("transaction_info", "transaction_id"),
+    "initiation_date": ("transaction_info", "transaction_initiation_date"),
+    "updated_date": ("transaction_info", "transaction_updated_date"),
+    "event_code": ("transaction_info", "transaction_event_code"),
+    "status": ("transaction_info", "transaction_status"),
+    "amount": ("transaction_info", "transaction_amount", "value"),
+    "currency": ("transaction_info", "transaction_amount", "currency_code"),
+    "fee": ("transaction_info", "fee_amount", "value"),
+    "invoice_id": ("transaction_info", "invoice_id"),
+    "reference_id": ("transaction_info", "paypal_reference_id"),
+    "custom_field": ("transaction_info", "custom_field"),
+    "payer_email": ("payer_info", "email_address"),
+    "payer_name": ("payer_info", "payer_name", "alternate_full_name"),
+}
+
+
+class ExportStats:
+    """Progress of an export; ``rows`` and ``bytes`` include what a resumed export had already written."""
+
+    def __init__(self, rows: int = 0, bytes_written: int = 0):
+        self.rows = rows
+        self.bytes = bytes_written
+        self.pages = 0
+        self.windows = 0
+        self.resumed_rows = rows
+        self.started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        return (self.rows - self.resumed_rows) / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "pages": self.pages,
+            "windows": self.windows,
+            "resumed_rows": self.resumed_rows,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+    def __str__(self) -> str:
+        return (f"{self.rows} rows, {self.bytes / 1e6:.1f} MB, {self.pages} pages in {self.elapsed:.1f}s "
+                f"({self.rows_per_second:.0f} rows/s)")
+
+
+class TransactionExport:
+    """
+    path        - output file
+    filters     - ListTransactionsParameters filters; the range may span any number of windows
+    format      - "ndjson" or "csv"; by default from the file extension
+    checkpoint  - checkpoint file; by default ``path`` + ".checkpoint"
+    progress    - called with the ExportStats after every page
+    """
+
+    def __init__(
+        self,
+        path: str,
+        filters: Optional[dict] = None,
+        format: Optional[str] = None,
+        checkpoint: Optional[str] = None,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ):
+        self.path = path
+        self.filters = dict(filters or {})
+        self.format = format or ("csv" if path.lower().endswith(".csv") else "ndjson")
+        if self.format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format {self.format!r}; expected one of {EXPORT_FORMATS}")
+        self.checkpoint = checkpoint or path + CHECKPOINT_SUFFIX
+        self.progress = progress
+        self.validated = ListTransactionsParameters(**self.filters)
+
+    def run(self, client) -> ExportStats:
+        windows, uri, stats, output = self._open()
+        with output:
+            while windows:
+                page_uri = uri or window_uri(self.validated, windows[0])
+                try:
+                    page = client.get(uri=page_uri)
+                    if uri is None:
+                        check_cap(page, windows[0])
+                except (ResultCapExceeded, *HTTP_ERRORS) as error:
+                    if uri is not None:
+                        raise
+                    windows[0:1] = split_window(windows[0], error)
+                    continue
+                uri = self._write_page(output, page, page_uri, windows, stats, client.base_url)
+        return self._finish(stats)
+
+    async def run_async(self, client) -> ExportStats:
+        windows, uri, stats, output = self._open()
+        with output:
+            while windows:
+                page_uri = uri or window_uri(self.validated, windows[0])
+                try:
+                    page = await client.get(uri=page_uri)
+                    if uri is None:
+                        check_cap(page, windows[0])
+                except (ResultCapExceeded, *HTTP_ERRORS) as error:
+                    if uri is not None:
+                        raise
+                    windows[0:1] = split_window(windows[0], error)
+                    continue
+                uri = self._write_page(output, page, page_uri, windows, stats, client.base_url)
+        return self._finish(stats)
+
+    def _open(self):
+        """Windows to go, the next page's URI, the stats so far and the output file, resuming from a checkpoint if any."""
+        state = self._load_checkpoint()
+        if state is None:
+            windows = plan_windows(*requested_range(self.validated))
+            output = open(self.path, "wb")
+            stats = ExportStats()
+            if self.format == "csv":
+                stats.bytes += output.write(self._encode_header())
+            return windows, None, stats, output
+
+        windows = [(datetime.fromisoformat(start), datetime.fromisoformat(end)) for start, end in state["windows"]]
+        output = open(self.path, "r+b")
+        output.truncate(state["offset"])
+        output.seek(state["offset"])
+        logging.info("Resuming export to %s after %d rows", self.path, state["rows"])
+        return windows, state["uri"], ExportStats(state["rows"], state["offset"]), output
+
+    def _write_page(self, output, page: Dict[str, Any], uri: str, windows: List[Window], stats: ExportStats,
+                    base_url: str) -> Optional[str]:
+        records = page.get("transaction_details") or []
+        stats.bytes += output.write(self._encode(records))
+        stats.rows += len(records)
+        stats.pages += 1
+
+        next_uri = next_page_uri(page, uri, base_url)
+        if next_uri is None:
+            windows.pop(0)
+            stats.windows += 1
+        output.flush()
+        os.fsync(output.fileno())
+        self._save_checkpoint(windows, next_uri, stats)
+        if self.progress is not None:
+            self.progress(stats)
+        return next_uri
+
+    def _finish(self, stats: ExportStats) -> ExportStats:
+        if os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+        logging.info("Exported transactions to %s: %s", self.path, stats)
+        return stats
+
+    def _encode(self, records: List[Dict[str, Any]]) -> bytes:
+        if self.format == "ndjson":
+            return "".join(json.dumps(record) + "\n" for record in records).encode("utf-8")
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([_field(record, path) for path in CSV_COLUMNS.values()] for record in records)
+        return buffer.getvalue().encode("utf-8")
+
+    def _encode_header(self) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(CSV_COLUMNS)
+        return buffer.getvalue().encode("utf-8")
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(self.checkpoint) or not os.path.exists(self.path):
+            return None
+        with open(self.checkpoint) as f:
+            state = json.load(f)
+        if state.get("filters") != self.filters or state.get("format") != self.format:
+            raise ValueError(f"Checkpoint {self.checkpoint} belongs to a different export; remove it to start over")
+        return state
+
+    def _save_checkpoint(self, windows: List[Window], uri: Optional[str], stats: ExportStats) -> None:
+        state = {
+            "filters": self.filters,
+            "format": self.format,
+            "windows": [[start.isoformat(), end.isoformat()] for start, end in windows],
+            "uri": uri,
+            "rows": stats.rows,
+            "offset": stats.bytes,
+        }
+        temporary = self.checkpoint + ".tmp"
+        with open(temporary, "w") as f:
+            json.dump(state, f)
+        os.replace(temporary, self.checkpoint)
+
+
+def export_transactions(client, path: str, filters: Optional[dict] = None, **options) -> ExportStats:
+    """Export every transaction matching ``filters`` to ``path``; see ``TransactionExport`` for ``options``."""
+    return TransactionExport(path, filters, **options).run(client)
+
+
+async def aexport_transactions(client, path: str, filters: Optional[dict] = None, **options) -> ExportStats:
+    return await TransactionExport(path, filters, **options).run_async(client)
+
+
+def _field(record: Dict[str, Any], path) -> Any:
+    value = record
+    for key in path:
+        if not isinstance(value, dict):
+            return ""
+        value = value.get(key)
+    return "" if value is None else value
+
+
+def main(argv=None) -> None:
+    from ..configuration import Context
+    from ..paypal_client import PayPalClient
+
+    parser = argparse.ArgumentParser(description="Export PayPal transactions to NDJSON or CSV.")
+    parser.add_argument("output", help="output file; .csv exports CSV, anything else NDJSON")
+    parser.add_argument("--start-date", help="ISO8601 start of the range")
+    parser.add_argument("--end-date", help="ISO8601 end of the range")
+    parser.add_argument("--status", choices=["D", "P", "S", "V", "all"], default="S", help="transaction status")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, help="output format")
+    parser.add_argument("--live", action="store_true", help="use the live environment instead of the sandbox")
+    args = parser.parse_args(argv)
+
+    filters = {"transaction_status": None if args.status == "all" else args.status, "fields": "all"}
+    if args.start_date:
+        filters["start_date"] = args.start_date
+    if args.end_date:
+        filters["end_date"] = args.end_date
+
+    with PayPalClient(
+        client_id=os.getenv("PAYPAL_CLIENT_ID"),
+        secret=os.getenv("PAYPAL_CLIENT_SECRET"),
+        context=Context(sandbox=not args.live),
+    ) as client:
+        stats = export_transactions(
+            client, args.output, filters, format=args.format,
+            progress=lambda stats: print(f"\r{stats}", end="", file=sys.stderr, flush=True),
+        )
+    print(file=sys.stderr)
+    print(json.dumps(stats.to_dict()))
+
+
+if __name__ == "__main__":
+    main()
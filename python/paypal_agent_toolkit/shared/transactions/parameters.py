@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional, Literal
 from datetime import datetime, timedelta
 
 
@@ -26,11 +26,55 @@ class ListTransactionsParameters(BaseModel):
     )
     end_date: Optional[str] = Field(
         default_factory=default_end_date,
-        description="Filters the transactions in the response by an end date and time, in ISO8601 format. Maximum range is 31 days."
+        description="Filters the transactions in the response by an end date and time, in ISO8601 format. Ranges longer than 31 days are queried in 31-day windows."
     )
     search_months: Optional[int] = Field(
         default=12,
         description="Number of months to search back for a transaction by ID. Default is 12 months."
     )
-    page_size: Optional[int] = Field(default=100)
-    page: Optional[int] = Field(default=1)
+    fields: Optional[str] = Field(
+        default=None,
+        description="Comma-separated field groups to include, for example 'transaction_info,payer_info', or 'all'."
+    )
+    page_size: Optional[int] = Field(
+        default=100,
+        description="Transactions per page. Ranges longer than 31 days are paged across all their windows."
+    )
+    page: Optional[int] = Field(
+        default=1,
+        description="Page to return, starting at 1. For ranges longer than 31 days, continue with start_date set to the result's next_start_date instead."
+    )
+
+
+class SummarizeTransactionsParameters(BaseModel):
+    start_date: Optional[str] = Field(
+        default_factory=default_start_date,
+        description="Start of the period to summarize, in ISO8601 format."
+    )
+    end_date: Optional[str] = Field(
+        default_factory=default_end_date,
+        description="End of the period to summarize, in ISO8601 format. Periods longer than 31 days are queried in 31-day windows."
+    )
+    transaction_status: Optional[Literal["D", "P", "S", "V"]] = Field(
+        default="S",
+        description="Only summarize transactions with this status: D, P, S, or V. Null summarizes every status."
+    )
+    event_code: Optional[str] = Field(
+        default=None,
+        description="Only summarize transactions whose event code starts with this prefix, for example 'T1107' for payment refunds or 'T11' for all reversals."
+    )
+    group_by: List[Literal["currency", "status", "event_code", "category", "day"]] = Field(
+        default_factory=lambda: ["currency"],
+        description="Keys to group by. Currency is always included; 'day' buckets by UTC date and 'category' by event code group, such as payment or reversal."
+    )
+    percentiles: List[float] = Field(
+        default_factory=lambda: [50.0, 90.0, 99.0],
+        description="Amount percentiles to report for each group, between 0 and 100."
+    )
+
+    @field_validator("percentiles")
+    @classmethod
+    def _check_percentiles(cls, value: List[float]) -> List[float]:
+        if any(q < 0 or q > 100 for q in value):
+            raise ValueError("percentiles must be between 0 and 100")
+        return value
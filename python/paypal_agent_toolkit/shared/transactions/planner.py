@@ -0,0 +1,139 @@
+"""
+Transaction queries over any date range.
+
+The reporting API accepts at most 31 days per request and caps the number of
+results per query. ``plan_windows`` shards a range into compliant windows;
+``stream_transactions`` fetches several ahead, follows every page, halves any
+window that hits the result cap, and yields the transactions in timestamp
+order.
+"""
+
+import contextlib
+import functools
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from ..concurrency import abounded_map, bounded_map
+from ..http_pool import HTTP_ERRORS
+from ..pagination import aiter_pages, iter_pages
+from .parameters import ListTransactionsParameters
+from .search import WINDOW_DAYS, Window, window_uri
+
+QUERY_WORKERS = 4
+# Reporting queries matching more transactions than this fail or are truncated.
+RESULT_CAP = 10000
+RESULT_CAP_ERRORS = ("RESULTSET_TOO_LARGE",)
+MIN_WINDOW = timedelta(minutes=1)
+
+
+class ResultCapExceeded(Exception):
+    """A window matched more transactions than the reporting API returns."""
+
+
+def plan_windows(start: datetime, end: datetime, max_days: int = WINDOW_DAYS) -> List[Window]:
+    """Split ``[start, end)`` into consecutive windows of at most ``max_days``, oldest first."""
+    windows = []
+    step = timedelta(days=max_days)
+    while start < end:
+        windows.append((start, min(start + step, end)))
+        start += step
+    return windows
+
+
+def requested_range(validated: ListTransactionsParameters) -> Tuple[datetime, datetime]:
+    """The query's range in naive UTC; a missing bound is 31 days from the other one (or from now)."""
+    start = parse_date(validated.start_date) if validated.start_date else None
+    end = parse_date(validated.end_date) if validated.end_date else None
+    if end is None:
+        end = start + timedelta(days=WINDOW_DAYS) if start else datetime.utcnow()
+    if start is None:
+        start = end - timedelta(days=WINDOW_DAYS)
+    return start, end
+
+
+def parse_date(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def stream_transactions(client, validated: ListTransactionsParameters, max_workers: int = QUERY_WORKERS) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every transaction in the query's range, oldest first. Up to
+    ``max_workers`` windows are fetched ahead of the one being consumed.
+    """
+    fetch = functools.partial(fetch_window, client, validated)
+    windows = plan_windows(*requested_range(validated))
+    with contextlib.closing(bounded_map(fetch, windows, max_workers, ordered=True, thread_name_prefix="paypal-txn-query")) as fetched:
+        for _, future in fetched:
+            yield from future.result()
+
+
+async def astream_transactions(client, validated: ListTransactionsParameters, max_workers: int = QUERY_WORKERS) -> AsyncIterator[Dict[str, Any]]:
+    """Async ``stream_transactions``."""
+    fetch = functools.partial(afetch_window, client, validated)
+    windows = plan_windows(*requested_range(validated))
+    async with contextlib.aclosing(abounded_map(fetch, windows, max_workers, ordered=True)) as fetched:
+        async for _, task in fetched:
+            for record in task.result():
+                yield record
+
+
+def fetch_window(client, validated: ListTransactionsParameters, window: Window) -> List[Dict[str, Any]]:
+    """All transactions of one window sorted by time, halving the window while it exceeds the result cap."""
+    try:
+        records = []
+        for page in iter_pages(client, window_uri(validated, window), prefetch=False):
+            check_cap(page, window)
+            records.extend(page.get("transaction_details") or [])
+    except (ResultCapExceeded, *HTTP_ERRORS) as error:
+        halves = split_window(window, error)
+        return fetch_window(client, validated, halves[0]) + fetch_window(client, validated, halves[1])
+    records.sort(key=transaction_time)
+    return records
+
+
+async def afetch_window(client, validated: ListTransactionsParameters, window: Window) -> List[Dict[str, Any]]:
+    try:
+        records = []
+        async for page in aiter_pages(client, window_uri(validated, window), prefetch=False):
+            check_cap(page, window)
+            records.extend(page.get("transaction_details") or [])
+    except (ResultCapExceeded, *HTTP_ERRORS) as error:
+        halves = split_window(window, error)
+        return await afetch_window(client, validated, halves[0]) + await afetch_window(client, validated, halves[1])
+    records.sort(key=transaction_time)
+    return records
+
+
+def transaction_time(transaction: Dict[str, Any]) -> str:
+    return (transaction.get("transaction_info") or {}).get("transaction_initiation_date") or ""
+
+
+def check_cap(page: Dict[str, Any], window: Window) -> None:
+    if int(page.get("total_items") or 0) > RESULT_CAP and _splittable(window):
+        raise ResultCapExceeded(f"{page['total_items']} transactions between {window[0]} and {window[1]}")
+
+
+def split_window(window: Window, error: Exception) -> Tuple[Window, Window]:
+    """Split ``window`` when ``error`` says it is too large; re-raise anything else."""
+    if not isinstance(error, ResultCapExceeded) and not (_is_cap_error(error) and _splittable(window)):
+        raise error
+    start, end = window
+    middle = start + (end - start) / 2
+    return (start, middle), (middle, end)
+
+
+def _is_cap_error(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    if response is None or response.status_code != 400:
+        return False
+    try:
+        return response.json().get("name") in RESULT_CAP_ERRORS
+    except ValueError:
+        return False
+
+
+def _splittable(window: Window) -> bool:
+    return window[1] - window[0] >= 2 * MIN_WINDOW
@@ -1,7 +1,7 @@
 LIST_TRANSACTIONS_PROMPT = """
 List transactions from PayPal.
 
-This tool is used to list transactions with optional filtering parameters within a date range of 31 days. This tool can also be used to list details of a transaction given the transaction ID.
+This tool is used to list transactions with optional filtering parameters within a date range. Ranges longer than 31 days are split into 31-day windows and merged in time order, page_size transactions at a time; when has_more is true, call again with start_date set to the returned next_start_date (or page set to next_page, when that is returned instead) and the same other filters for the rest. This tool can also be used to list details of a transaction given the transaction ID.
 
 - The start_date and end_date should be specified in ISO8601 date and time format. Example dates: 1996-12-19T16:39:57-08:00, 1985-04-12T23:20:50.52Z, 1990-12-31T23:59:60Z
 - The transaction_status accepts the following 4 values:
@@ -10,4 +10,15 @@ This tool is used to list transactions with optional filtering parameters within
     3. "S" - represents successful transactions.
     4. "V" - represents transactions that were reversed.
 - The transaction_id is the unique identifier for the transaction.
-"""
\ No newline at end of file
+"""
+
+SUMMARIZE_TRANSACTIONS_PROMPT = """
+Summarize PayPal transactions over a period without listing them.
+
+This tool returns per-group totals instead of raw transactions: the count, total, fees, net, average, minimum, maximum and amount percentiles of each group. Use it for questions such as "total refunds by currency last quarter" or "daily sales this month".
+
+- The start_date and end_date should be specified in ISO8601 date and time format.
+- group_by accepts "currency", "status", "event_code", "category" and "day". Amounts are always grouped by currency.
+- event_code filters by event code prefix, for example "T0006" for checkout payments, "T1107" for payment refunds or "T11" for all reversals.
+- transaction_status accepts "D", "P", "S" or "V" as in list_transactions.
+"""
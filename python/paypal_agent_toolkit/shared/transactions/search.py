@@ -0,0 +1,162 @@
+"""
+Transaction-ID search across the reporting API's 31-day windows.
+
+Windows walking back from now are searched a few at a time, each through all
+of its pages. The first match ends the search: windows not started are
+dropped and running ones stop after their current page.
+"""
+
+import contextlib
+import functools
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from ..concurrency import abounded_map, bounded_map
+from ..pagination import next_page_uri
+from .parameters import ListTransactionsParameters
+
+WINDOW_DAYS = 31
+SEARCH_WORKERS = 4
+SEARCH_PAGE_SIZE = 500
+
+Window = Tuple[datetime, datetime]
+
+
+class SearchResult:
+    """Outcome of a search: the transaction and where it was found, or how much was searched."""
+
+    def __init__(self, transaction_id: str, search_months: int, transaction: Optional[Dict[str, Any]] = None,
+                 window: Optional[Window] = None, page: Optional[int] = None, windows_failed: int = 0):
+        self.transaction_id = transaction_id
+        self.search_months = search_months
+        self.transaction = transaction
+        self.window = window
+        self.page = page
+        self.windows_failed = windows_failed
+
+    @property
+    def found(self) -> bool:
+        return self.transaction is not None
+
+    def to_result(self) -> Dict[str, Any]:
+        """Tool result in the shape ``list_transactions`` has always returned."""
+        if self.found:
+            result = {
+                "found": True,
+                "transaction_details": [self.transaction],
+                "total_items": 1,
+            }
+            if self.window is not None:
+                result["window"] = {"start_date": _iso(self.window[0]), "end_date": _iso(self.window[1])}
+                result["page"] = self.page
+            return result
+        result = {
+            "found": False,
+            "transaction_details": [],
+            "total_items": 0,
+            "message": f"The transaction ID {self.transaction_id} was not found in the last {self.search_months} months.",
+        }
+        if self.windows_failed:
+            result["windows_failed"] = self.windows_failed
+        return result
+
+
+def search_windows(search_months: int, now: Optional[datetime] = None) -> List[Window]:
+    """Consecutive 31-day windows walking back from ``now``, most recent first."""
+    end_date = now or datetime.utcnow()
+    windows = []
+    for _ in range(search_months):
+        start_date = end_date - timedelta(days=WINDOW_DAYS)
+        windows.append((start_date, end_date))
+        end_date = start_date
+    return windows
+
+
+def window_uri(validated: ListTransactionsParameters, window: Window, page_size: int = SEARCH_PAGE_SIZE) -> str:
+    query_params = validated.model_dump(exclude={"search_months"}, exclude_none=True)
+    query_params["start_date"] = _iso(window[0])
+    query_params["end_date"] = _iso(window[1])
+    query_params["page_size"] = page_size
+    query_params["page"] = 1
+    return "/v1/reporting/transactions?" + urlencode(query_params)
+
+
+def find_transaction(client, validated: ListTransactionsParameters, max_workers: int = SEARCH_WORKERS) -> SearchResult:
+    """Search the last ``validated.search_months`` windows for ``validated.transaction_id``."""
+    search_months = validated.search_months or 12
+    stop = threading.Event()
+    failed = 0
+
+    search = functools.partial(_search_window, client, validated, stop=stop)
+    searches = bounded_map(search, search_windows(search_months), max_workers, thread_name_prefix="paypal-txn-search")
+    with contextlib.closing(searches):
+        for window, future in searches:
+            try:
+                found = future.result()
+            except Exception as error:
+                failed += 1
+                logging.warning("Error searching transactions from %s to %s: %s", _iso(window[0]), _iso(window[1]), error)
+                continue
+            if found is not None:
+                stop.set()
+                transaction, page = found
+                return SearchResult(validated.transaction_id, search_months, transaction, window, page)
+
+    return SearchResult(validated.transaction_id, search_months, windows_failed=failed)
+
+
+async def afind_transaction(client, validated: ListTransactionsParameters, max_concurrency: int = SEARCH_WORKERS) -> SearchResult:
+    """Async ``find_transaction``; at most ``max_concurrency`` windows are searched at a time."""
+    search_months = validated.search_months or 12
+    failed = 0
+
+    search = functools.partial(_asearch_window, client, validated)
+    async with contextlib.aclosing(abounded_map(search, search_windows(search_months), max_concurrency)) as searches:
+        async for window, task in searches:
+            try:
+                found = task.result()
+            except Exception as error:
+                failed += 1
+                logging.warning("Error searching transactions from %s to %s: %s", _iso(window[0]), _iso(window[1]), error)
+                continue
+            if found is not None:
+                transaction, page = found
+                return SearchResult(validated.transaction_id, search_months, transaction, window, page)
+
+    return SearchResult(validated.transaction_id, search_months, windows_failed=failed)
+
+
+def _search_window(client, validated, window: Window, stop: threading.Event):
+    uri, page = window_uri(validated, window), 1
+    while uri and not stop.is_set():
+        response = client.get(uri=uri)
+        transaction = _find_in_page(response, validated.transaction_id)
+        if transaction:
+            return transaction, page
+        uri, page = next_page_uri(response, uri, client.base_url), page + 1
+    return None
+
+
+async def _asearch_window(client, validated, window: Window):
+    uri, page = window_uri(validated, window), 1
+    while uri:
+        response = await client.get(uri=uri)
+        transaction = _find_in_page(response, validated.transaction_id)
+        if transaction:
+            return transaction, page
+        uri, page = next_page_uri(response, uri, client.base_url), page + 1
+    return None
+
+
+def _find_in_page(response_data, transaction_id):
+    for transaction in response_data.get("transaction_details") or []:
+        if transaction["transaction_info"]["transaction_id"] == transaction_id:
+            return transaction
+    return None
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat() + "Z"
@@ -0,0 +1,331 @@
+"""
+Local SQLite index of reporting transactions.
+
+``TransactionStore`` pulls ``/v1/reporting/transactions`` incrementally from a
+per-merchant high-water mark and indexes the keys reconciliation agents look
+up: transaction ID, invoice ID, PayPal reference ID, payer email and amount.
+Set it with ``Configuration(transaction_store=TransactionStore("txns.db"))``
+and ``list_transactions`` answers from the index while it is fresh enough;
+once it goes stale, calls are answered by the API while a sync runs in the
+background.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..concurrency import merchant_scope
+from .parameters import ListTransactionsParameters
+from .planner import astream_transactions, parse_date, requested_range, stream_transactions, transaction_time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    scope TEXT NOT NULL,
+    transaction_id TEXT NOT NULL,
+    initiated_at TEXT,
+    status TEXT,
+    event_code TEXT,
+    invoice_id TEXT,
+    reference_id TEXT,
+    payer_email TEXT,
+    amount REAL,
+    currency TEXT,
+    record TEXT NOT NULL,
+    PRIMARY KEY (scope, transaction_id)
+);
+CREATE INDEX IF NOT EXISTS transactions_time ON transactions (scope, initiated_at);
+CREATE INDEX IF NOT EXISTS transactions_invoice ON transactions (scope, invoice_id);
+CREATE INDEX IF NOT EXISTS transactions_reference ON transactions (scope, reference_id);
+CREATE INDEX IF NOT EXISTS transactions_payer ON transactions (scope, payer_email);
+CREATE INDEX IF NOT EXISTS transactions_amount ON transactions (scope, currency, amount);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    covered_from TEXT NOT NULL,
+    watermark TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+_COLUMNS = ("transaction_id", "initiated_at", "status", "event_code", "invoice_id", "reference_id",
+            "payer_email", "amount", "currency", "record")
+
+
+class TransactionStore:
+    """
+    path           - SQLite database file; ":memory:" keeps the index in this process only
+    max_staleness  - seconds after a sync during which lookups are answered locally
+    initial_days   - how far back the first sync of a merchant goes
+    overlap        - how far before the watermark each sync restarts, since the
+                     reporting API can take up to three hours to list a transaction
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_staleness: float = 300.0,
+        initial_days: int = 93,
+        overlap: timedelta = timedelta(hours=3),
+    ):
+        self.path = path
+        self.max_staleness = max_staleness
+        self.initial_days = initial_days
+        self.overlap = overlap
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+        self._sync_locks: Dict[str, threading.Lock] = {}
+        self._sync_tasks: Set[asyncio.Task] = set()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # -- syncing ---------------------------------------------------------
+
+    def sync(self, client) -> int:
+        """Fetch everything since the watermark (minus ``overlap``); returns how many records were stored."""
+        with self._sync_lock(merchant_scope(client)):
+            return self._sync(client)
+
+    async def sync_async(self, client) -> int:
+        lock = self._sync_lock(merchant_scope(client))
+        await _acquire_async(lock)
+        try:
+            return await self._sync_async(client)
+        finally:
+            lock.release()
+
+    def refresh(self, client) -> bool:
+        """
+        Whether the index is fresh; when it is not, start a sync in a background
+        thread unless one is already running for this merchant.
+        """
+        if self.is_fresh(client):
+            return True
+        lock = self._sync_lock(merchant_scope(client))
+        if lock.acquire(blocking=False):
+            threading.Thread(target=self._background_sync, args=(client, lock), name="paypal-txn-sync", daemon=True).start()
+        return False
+
+    async def refresh_async(self, client) -> bool:
+        """``refresh`` for an ``AsyncPayPalClient``: the sync runs as a task of the running loop."""
+        if await asyncio.to_thread(self.is_fresh, client):
+            return True
+        lock = self._sync_lock(merchant_scope(client))
+        if lock.acquire(blocking=False):
+            task = asyncio.ensure_future(self._abackground_sync(client, lock))
+            self._sync_tasks.add(task)
+            task.add_done_callback(self._sync_tasks.discard)
+        return False
+
+    def ensure_fresh(self, client, max_staleness: Optional[float] = None) -> None:
+        if not self.is_fresh(client, max_staleness):
+            self.sync(client)
+
+    async def ensure_fresh_async(self, client, max_staleness: Optional[float] = None) -> None:
+        if not await asyncio.to_thread(self.is_fresh, client, max_staleness):
+            await self.sync_async(client)
+
+    def is_fresh(self, client, max_staleness: Optional[float] = None) -> bool:
+        state = self._state(merchant_scope(client))
+        limit = self.max_staleness if max_staleness is None else max_staleness
+        return state is not None and time.time() - state[2] <= limit
+
+    # -- lookups ---------------------------------------------------------
+
+    def get(self, client, transaction_id: str) -> Optional[Dict[str, Any]]:
+        rows = self.find(client, transaction_id=transaction_id)
+        return rows[0] if rows else None
+
+    def find(
+        self,
+        client,
+        transaction_id: Optional[str] = None,
+        invoice_id: Optional[str] = None,
+        reference_id: Optional[str] = None,
+        payer_email: Optional[str] = None,
+        amount: Optional[float] = None,
+        currency: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Transactions matching every given key, oldest first."""
+        conditions, values = [], []
+        for column, value in (
+            ("transaction_id", transaction_id),
+            ("invoice_id", invoice_id),
+            ("reference_id", reference_id),
+            ("payer_email", payer_email.lower() if payer_email else None),
+            ("amount", amount),
+            ("currency", currency),
+            ("status", status),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                values.append(value)
+        if start_date:
+            conditions.append("initiated_at >= ?")
+            values.append(_sortable(parse_date(start_date)))
+        if end_date:
+            conditions.append("initiated_at < ?")
+            values.append(_sortable(parse_date(end_date)))
+        return self._select(merchant_scope(client), " AND ".join(conditions) or "1", values, limit, offset)
+
+    def covers(self, client, validated: ListTransactionsParameters) -> bool:
+        """Whether the query's whole range has been synced and the index is fresh."""
+        state = self._state(merchant_scope(client))
+        if state is None or not self.is_fresh(client):
+            return False
+        start, _ = requested_range(validated)
+        return _sortable(start) >= state[0]
+
+    def query(self, client, validated: ListTransactionsParameters, limit: Optional[int] = None,
+              offset: int = 0) -> List[Dict[str, Any]]:
+        """The records ``list_transactions`` would return for ``validated``; ``limit``/``offset`` select a page."""
+        start, end = requested_range(validated)
+        return self.find(
+            client,
+            status=validated.transaction_status,
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
+            limit=limit,
+            offset=offset,
+        )
+
+    # -- internals -------------------------------------------------------
+
+    def _sync_lock(self, scope: str) -> threading.Lock:
+        with self._lock:
+            return self._sync_locks.setdefault(scope, threading.Lock())
+
+    def _sync(self, client) -> int:
+        scope = merchant_scope(client)
+        start, end = self._sync_range(scope)
+        return self._commit(scope, stream_transactions(client, self._sync_query(start, end)), start, end)
+
+    async def _sync_async(self, client) -> int:
+        # SQLite work runs in a worker thread so the event loop keeps serving other calls.
+        scope = merchant_scope(client)
+        start, end = await asyncio.to_thread(self._sync_range, scope)
+        records = [record async for record in astream_transactions(client, self._sync_query(start, end))]
+        return await asyncio.to_thread(self._commit, scope, records, start, end)
+
+    def _commit(self, scope: str, records: Iterable[Dict[str, Any]], start: datetime, end: datetime) -> int:
+        stored = self._store(scope, records)
+        self._advance(scope, start, end)
+        return stored
+
+    def _background_sync(self, client, lock: threading.Lock) -> None:
+        try:
+            self._sync(client)
+        except Exception as error:
+            logging.warning("Background transaction sync failed: %s", error)
+        finally:
+            lock.release()
+
+    async def _abackground_sync(self, client, lock: threading.Lock) -> None:
+        try:
+            await self._sync_async(client)
+        except Exception as error:
+            logging.warning("Background transaction sync failed: %s", error)
+        finally:
+            lock.release()
+
+    def _sync_range(self, scope: str) -> Tuple[datetime, datetime]:
+        end = datetime.utcnow().replace(microsecond=0)
+        state = self._state(scope)
+        if state is None:
+            return end - timedelta(days=self.initial_days), end
+        return datetime.fromisoformat(state[1]) - self.overlap, end
+
+    def _sync_query(self, start: datetime, end: datetime) -> ListTransactionsParameters:
+        # Every status, with payer details so payer emails can be indexed.
+        return ListTransactionsParameters(
+            start_date=start.isoformat() + "Z",
+            end_date=end.isoformat() + "Z",
+            transaction_status=None,
+            fields="all",
+        )
+
+    def _store(self, scope: str, records: Iterable[Dict[str, Any]]) -> int:
+        rows = [(scope,) + _row(record) for record in records]
+        rows = [row for row in rows if row[1]]
+        with self._lock, self._db:
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO transactions (scope, {', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(_COLUMNS) + 1))})",
+                rows,
+            )
+        return len(rows)
+
+    def _advance(self, scope: str, start: datetime, end: datetime) -> None:
+        state = self._state(scope)
+        covered_from = min(state[0], _sortable(start)) if state else _sortable(start)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state (scope, covered_from, watermark, synced_at) VALUES (?, ?, ?, ?)",
+                (scope, covered_from, _sortable(end), time.time()),
+            )
+
+    def _state(self, scope: str) -> Optional[Tuple[str, str, float]]:
+        with self._lock:
+            return self._db.execute(
+                "SELECT covered_from, watermark, synced_at FROM sync_state WHERE scope = ?", (scope,)
+            ).fetchone()
+
+    def _select(self, scope: str, where: str, values: List[Any], limit: Optional[int] = None,
+                offset: int = 0) -> List[Dict[str, Any]]:
+        sql = f"SELECT record FROM transactions WHERE scope = ? AND {where} ORDER BY initiated_at, transaction_id"
+        if limit:
+            sql += f" LIMIT {int(limit)} OFFSET {int(offset)}"
+        with self._lock:
+            rows = self._db.execute(sql, [scope] + values).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+async def _acquire_async(lock: threading.Lock) -> None:
+    """Acquire ``lock``, which sync() may hold in another thread, without blocking the event loop."""
+    if lock.acquire(blocking=False):
+        return
+    acquiring = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+    try:
+        await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        # The thread still takes the lock; hand it back once it does.
+        acquiring.add_done_callback(lambda _: lock.release())
+        raise
+
+
+def _row(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    info = record.get("transaction_info") or {}
+    amount = info.get("transaction_amount") or {}
+    email = (record.get("payer_info") or {}).get("email_address")
+    initiated = transaction_time(record)
+    try:
+        value = float(amount["value"]) if "value" in amount else None
+    except (TypeError, ValueError):
+        value = None
+    return (
+        info.get("transaction_id"),
+        _sortable(parse_date(initiated)) if initiated else None,
+        info.get("transaction_status"),
+        info.get("transaction_event_code"),
+        info.get("invoice_id"),
+        info.get("paypal_reference_id"),
+        email.lower() if email else None,
+        value,
+        amount.get("currency_code"),
+        json.dumps(record),
+    )
+
+
+def _sortable(value: datetime) -> str:
+    return value.replace(microsecond=0).isoformat()
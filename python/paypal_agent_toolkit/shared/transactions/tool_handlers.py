@@ -1,83 +1,221 @@
+import asyncio
+import contextlib
+import itertools
 import json
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
-from .parameters import ListTransactionsParameters
+from .analytics import TransactionColumns, summarize
+from .parameters import ListTransactionsParameters, SummarizeTransactionsParameters
+from .search import WINDOW_DAYS, SearchResult, afind_transaction, find_transaction, search_windows
+from .store import TransactionStore
+from .planner import astream_transactions, parse_date, plan_windows, requested_range, stream_transactions, transaction_time
+from ..request_util import ApiRequest, send_request, send_request_async
 
 
 
-def list_transactions(client, params: dict) -> Dict[str, Any]:
+def list_transactions(client, params: dict, transaction_store: Optional[TransactionStore] = None) -> Dict[str, Any]:
     """
     List transactions or search for a specific transaction by ID.
     """
     validated = ListTransactionsParameters(**params)
 
-    # If searching for a specific transaction by ID
+    # A stale index is refreshed in the background; the API answers meanwhile
+    if transaction_store is not None and transaction_store.refresh(client):
+        local = _local_result(transaction_store, client, validated)
+        if local is not None:
+            return local
+
+    # If searching for a specific transaction by ID, search the windows in parallel
     if validated.transaction_id:
-        search_months = validated.search_months or 12
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=31)
-
-        for month in range(search_months):
-            query_params = validated.dict(exclude={"search_months"})
-            query_params["end_date"] = end_date.isoformat() + "Z"
-            query_params["start_date"] = start_date.isoformat() + "Z"
-
-            uri = f"/v1/reporting/transactions"
-            try:
-                response = client.get(uri=uri, payload=query_params)
-                response_data = json.loads(response)
-
-                if response_data.get("transaction_details"):
-                    for transaction in response_data["transaction_details"]:
-                        if transaction["transaction_info"]["transaction_id"] == validated.transaction_id:
-                            return {
-                                "found": True,
-                                "transaction_details": [transaction],
-                                "total_items": 1
-                            }
-
-                # Move back one month for the next search
-                end_date = start_date
-                start_date = start_date - timedelta(days=31)
-
-            except Exception as error:
-                # Log and continue to the next month
-                print(f"Error searching transactions for month {month + 1}: {str(error)}")
-
-        # If transaction not found after searching all months
-        return {
-            "found": False,
-            "transaction_details": [],
-            "total_items": 0,
-            "message": f"The transaction ID {validated.transaction_id} was not found in the last {search_months} months."
-        }
+        return find_transaction(client, validated).to_result()
+
+    elif _spans_windows(validated):
+        # Longer than one reporting window: page through the merged windows
+        with contextlib.closing(stream_transactions(client, validated)) as records:
+            return json.dumps(_merged_result(validated, *_page_of(validated, records)))
 
     else:
         # Listing transactions without a specific ID
-        query_params = validated.dict(exclude={"search_months"})
+        return send_request(client, _build_list_transactions(validated))
+
 
-        if not query_params.get("end_date") and not query_params.get("start_date"):
-            query_params["end_date"] = datetime.utcnow().isoformat() + "Z"
-            query_params["start_date"] = (datetime.utcnow() - timedelta(days=31)).isoformat() + "Z"
-        elif not query_params.get("end_date"):
-            start_date = datetime.fromisoformat(query_params["start_date"].replace("Z", ""))
-            query_params["end_date"] = (start_date + timedelta(days=31)).isoformat() + "Z"
-        elif not query_params.get("start_date"):
-            end_date = datetime.fromisoformat(query_params["end_date"].replace("Z", ""))
-            query_params["start_date"] = (end_date - timedelta(days=31)).isoformat() + "Z"
-        else:
-            start_date = datetime.fromisoformat(query_params["start_date"].replace("Z", ""))
-            end_date = datetime.fromisoformat(query_params["end_date"].replace("Z", ""))
-            day_range = (end_date - start_date).days
+async def list_transactions_async(client, params: dict, transaction_store: Optional[TransactionStore] = None) -> Dict[str, Any]:
+    validated = ListTransactionsParameters(**params)
+
+    if transaction_store is not None and await transaction_store.refresh_async(client):
+        local = await asyncio.to_thread(_local_result, transaction_store, client, validated)
+        if local is not None:
+            return local
+
+    if validated.transaction_id:
+        return (await afind_transaction(client, validated)).to_result()
+
+    if _spans_windows(validated):
+        async with contextlib.aclosing(astream_transactions(client, validated)) as records:
+            return json.dumps(_merged_result(validated, *await _apage_of(validated, records)))
+
+    return await send_request_async(client, _build_list_transactions(validated))
+
+
+def summarize_transactions(client, params: dict, transaction_store: Optional[TransactionStore] = None) -> Dict[str, Any]:
+    """
+    Aggregate the transactions of a period into per-group totals.
+    """
+    validated = SummarizeTransactionsParameters(**params)
+    query = _summary_query(validated)
+
+    records = None
+    if transaction_store is not None and transaction_store.refresh(client):
+        records = _local_records(transaction_store, client, query)
+    if records is not None:
+        columns, source = TransactionColumns.from_records(records), "local_index"
+    else:
+        columns, source = TransactionColumns.from_records(stream_transactions(client, query)), "api"
+    return json.dumps(_summary_result(validated, query, columns, source))
 
-            if day_range > 31:
-                query_params["start_date"] = (end_date - timedelta(days=31)).isoformat() + "Z"
 
-        query_string = urlencode(query_params)
-        uri = f"/v1/reporting/transactions?" + query_string
+async def summarize_transactions_async(client, params: dict, transaction_store: Optional[TransactionStore] = None) -> Dict[str, Any]:
+    validated = SummarizeTransactionsParameters(**params)
+    query = _summary_query(validated)
+
+    records = None
+    if transaction_store is not None and await transaction_store.refresh_async(client):
+        records = await asyncio.to_thread(_local_records, transaction_store, client, query)
+    columns = TransactionColumns()
+    if records is not None:
+        columns.extend(records)
+        source = "local_index"
+    else:
+        async for record in astream_transactions(client, query):
+            columns.extend((record,))
+        source = "api"
+    return json.dumps(_summary_result(validated, query, columns, source))
+
+
+def _local_records(store: TransactionStore, client, query: ListTransactionsParameters) -> Optional[List[Dict[str, Any]]]:
+    """The index's records for ``query``, or None when it does not cover the range."""
+    return store.query(client, query) if store.covers(client, query) else None
+
+
+def _summary_query(validated: SummarizeTransactionsParameters) -> ListTransactionsParameters:
+    return ListTransactionsParameters(
+        start_date=validated.start_date,
+        end_date=validated.end_date,
+        transaction_status=validated.transaction_status,
+    )
+
+
+def _summary_result(validated: SummarizeTransactionsParameters, query: ListTransactionsParameters,
+                    columns: TransactionColumns, source: str) -> Dict[str, Any]:
+    start, end = requested_range(query)
+    result = {"start_date": start.isoformat() + "Z", "end_date": end.isoformat() + "Z"}
+    result.update(summarize(columns, validated.group_by, validated.percentiles, validated.event_code))
+    result["source"] = source
+    return result
+
+
+def _local_result(store: TransactionStore, client, validated: ListTransactionsParameters):
+    """The answer from the local transaction index, or None when the API has to be asked."""
+    if validated.transaction_id:
+        # Same filters as the window search: status and the months searched
+        search_months = validated.search_months or 12
+        found = store.find(
+            client,
+            transaction_id=validated.transaction_id,
+            status=validated.transaction_status,
+            start_date=search_windows(search_months)[-1][0].isoformat(),
+            limit=1,
+        )
+        if not found:
+            return None
+        result = SearchResult(validated.transaction_id, search_months, found[0]).to_result()
+        result["source"] = "local_index"
+        return result
+
+    if not store.covers(client, validated):
+        return None
+    first, last = _page_bounds(validated)
+    # One record past the page tells whether more follow
+    records = store.query(client, validated, limit=last - first + 1, offset=first)
+    following = records.pop() if len(records) > last - first else None
+    result = _merged_result(validated, records, following)
+    result["source"] = "local_index"
+    return json.dumps(result)
+
+
+def _spans_windows(validated: ListTransactionsParameters) -> bool:
+    start, end = requested_range(validated)
+    return end - start > timedelta(days=WINDOW_DAYS)
+
+
+def _page_of(validated: ListTransactionsParameters, records: Iterator[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """The records of the requested page and the one after it, if any; ``records`` is read no further."""
+    first, last = _page_bounds(validated)
+    page = list(itertools.islice(records, first, last))
+    return page, next(records, None)
+
+
+async def _apage_of(validated: ListTransactionsParameters, records: AsyncIterator[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    first, last = _page_bounds(validated)
+    page, index = [], 0
+    async for record in records:
+        if index == last:
+            return page, record
+        if index >= first:
+            page.append(record)
+        index += 1
+    return page, None
+
+
+def _page_bounds(validated: ListTransactionsParameters) -> Tuple[int, int]:
+    page_size = validated.page_size or 100
+    first = ((validated.page or 1) - 1) * page_size
+    return first, first + page_size
+
+
+def _merged_result(validated: ListTransactionsParameters, records: List[Dict[str, Any]],
+                   following: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    start, end = requested_range(validated)
+    result = {
+        "transaction_details": records,
+        "page": validated.page or 1,
+        "page_size": validated.page_size or 100,
+        "has_more": following is not None,
+        "start_date": start.isoformat() + "Z",
+        "end_date": end.isoformat() + "Z",
+        "windows": len(plan_windows(start, end)),
+    }
+    if following is None:
+        return result
+
+    # Continue from the time of the next transaction rather than by page
+    # number, so the next call does not fetch this range again. Transactions
+    # sharing that time move to the next call, which starts at it.
+    resume_at = transaction_time(following)
+    kept = len(records)
+    while kept and transaction_time(records[kept - 1]) == resume_at:
+        kept -= 1
+    if resume_at and kept:
+        del records[kept:]
+        result["next_start_date"] = parse_date(resume_at).isoformat() + "Z"
+    else:
+        result["next_page"] = result["page"] + 1
+    return result
+
 
-        response = client.get(uri=uri)
-        return json.dumps(response)
+def _build_list_transactions(validated: ListTransactionsParameters) -> ApiRequest:
+    query_params = validated.model_dump(exclude={"search_months"}, exclude_none=True)
 
+    if not query_params.get("end_date") and not query_params.get("start_date"):
+        query_params["end_date"] = datetime.utcnow().isoformat() + "Z"
+        query_params["start_date"] = (datetime.utcnow() - timedelta(days=31)).isoformat() + "Z"
+    elif not query_params.get("end_date"):
+        start_date = datetime.fromisoformat(query_params["start_date"].replace("Z", ""))
+        query_params["end_date"] = (start_date + timedelta(days=31)).isoformat() + "Z"
+    elif not query_params.get("start_date"):
+        end_date = datetime.fromisoformat(query_params["end_date"].replace("Z", ""))
+        query_params["start_date"] = (end_date - timedelta(days=31)).isoformat() + "Z"
 
+    query_string = urlencode(query_params)
+    return ApiRequest("GET", f"/v1/reporting/transactions?" + query_string)
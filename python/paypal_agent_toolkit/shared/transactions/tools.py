@@ -0,0 +1,40 @@
+from .prompt import (
+    LIST_TRANSACTIONS_PROMPT,
+    SUMMARIZE_TRANSACTIONS_PROMPT,
+)
+
+from .parameters import (
+    ListTransactionsParameters,
+    SummarizeTransactionsParameters,
+)
+
+from .tool_handlers import (
+    list_transactions,
+    list_transactions_async,
+    summarize_transactions,
+    summarize_transactions_async,
+)
+
+
+tools = [
+    {
+        "method": "list_transactions",
+        "name": "List Transactions",
+        "description": LIST_TRANSACTIONS_PROMPT.strip(),
+        "args_schema": ListTransactionsParameters,
+        "actions": {"transactions": {"list": True}},
+        "services": ("transaction_store",),
+        "execute": list_transactions,
+        "execute_async": list_transactions_async,
+    },
+    {
+        "method": "summarize_transactions",
+        "name": "Summarize Transactions",
+        "description": SUMMARIZE_TRANSACTIONS_PROMPT.strip(),
+        "args_schema": SummarizeTransactionsParameters,
+        "actions": {"transactions": {"summarize": True}},
+        "services": ("transaction_store",),
+        "execute": summarize_transactions,
+        "execute_async": summarize_transactions_async,
+    },
+]